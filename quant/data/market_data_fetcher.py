@@ -7,6 +7,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -32,6 +34,14 @@ class MarketDataFetcher:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        # Keep connections alive across calls so TLS handshakes are amortised,
+        # and retry transient throttling/server errors with backoff.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self.session.mount('https://', adapter)
     
     def get_major_markets(self) -> Dict[str, str]:
         """Returns a mapping of exchange codes to exchange names for major markets."""
@@ -658,10 +668,9 @@ class MarketDataFetcher:
         try:
             # Yahoo Finance NASDAQ-100 ticker: ^NDX
             url = "https://query1.finance.yahoo.com/v8/finance/chart/%5ENDX"
-            response = self.session.get(url, timeout=10)
+            response = self.session.head(url, timeout=10, allow_redirects=False)
             
             if response.status_code == 200:
-                data = response.json()
                 # Note: This is a simplified approach. In practice, you'd need to parse
                 # the actual response structure to get constituent symbols
                 logger.info("Successfully fetched NASDAQ-100 data from Yahoo Finance")
@@ -701,10 +710,9 @@ class MarketDataFetcher:
         try:
             # Yahoo Finance NASDAQ Composite ticker: ^IXIC
             url = "https://query1.finance.yahoo.com/v8/finance/chart/%5EIXIC"
-            response = self.session.get(url, timeout=10)
+            response = self.session.head(url, timeout=10, allow_redirects=False)
             
             if response.status_code == 200:
-                data = response.json()
                 logger.info("Successfully fetched NASDAQ Composite data from Yahoo Finance")
                 
                 # Expanded list of NASDAQ symbols (top 500+ by market cap)
@@ -800,10 +808,9 @@ class MarketDataFetcher:
         try:
             # Yahoo Finance S&P 500 ticker: ^GSPC
             url = "https://query1.finance.yahoo.com/v8/finance/chart/%5EGSPC"
-            response = self.session.get(url, timeout=10)
+            response = self.session.head(url, timeout=10, allow_redirects=False)
             
             if response.status_code == 200:
-                data = response.json()
                 logger.info("Successfully fetched S&P 500 data from Yahoo Finance")
                 
                 # Major S&P 500 symbols (top 100 by market cap)
@@ -842,10 +849,9 @@ class MarketDataFetcher:
         try:
             # Yahoo Finance DJIA ticker: ^DJI
             url = "https://query1.finance.yahoo.com/v8/finance/chart/%5EDJI"
-            response = self.session.get(url, timeout=10)
+            response = self.session.head(url, timeout=10, allow_redirects=False)
             
             if response.status_code == 200:
-                data = response.json()
                 logger.info("Successfully fetched DJIA data from Yahoo Finance")
                 
                 # DJIA 30 constituents
@@ -918,9 +924,24 @@ class MarketDataFetcher:
             writer = csv.writer(f)
             writer.writerow(['symbol_id', 'ticker', 'exchange', 'currency', 'active_from', 'active_to'])
             
+            default_active_from = '2020-01-01T00:00:00Z'
+            default_active_to = ''
+            # Most symbols share a handful of distinct dates, so format each one once.
+            # The UTC offset is part of the key because equal instants in different
+            # zones compare equal but render differently.
+            iso_cache: Dict[Tuple[datetime, object], str] = {}
+            
+            def _iso(dt: datetime) -> str:
+                key = (dt, dt.utcoffset())
+                s = iso_cache.get(key)
+                if s is None:
+                    s = dt.isoformat()
+                    iso_cache[key] = s
+                return s
+            
             for i, symbol in enumerate(symbols, 1):
-                active_from = symbol.active_from.isoformat() if symbol.active_from else '2020-01-01T00:00:00Z'
-                active_to = symbol.active_to.isoformat() if symbol.active_to else ''
+                active_from = _iso(symbol.active_from) if symbol.active_from else default_active_from
+                active_to = _iso(symbol.active_to) if symbol.active_to else default_active_to
                 
                 writer.writerow([
                     i,
@@ -937,16 +958,25 @@ class MarketDataFetcher:
         if not existing_csv_path.exists():
             return new_symbols, [], []
         
-        existing_symbols = set()
+        existing: Dict[Tuple[str, str], str] = {}
         with open(existing_csv_path, 'r', newline='', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             for row in reader:
-                existing_symbols.add((row['ticker'], row['exchange']))
-        
-        new_symbol_set = {(s.ticker, s.exchange) for s in new_symbols}
-        
-        added = [s for s in new_symbols if (s.ticker, s.exchange) not in existing_symbols]
-        removed = [s for s in existing_symbols if s not in new_symbol_set]
-        unchanged = [s for s in new_symbols if (s.ticker, s.exchange) in existing_symbols]
+                existing[(row['ticker'], row['exchange'])] = row.get('currency') or ''
+        
+        # Single pass over the incoming symbols to bin them
+        added: List[MarketSymbol] = []
+        unchanged: List[MarketSymbol] = []
+        new_keys: Set[Tuple[str, str]] = set()
+        for s in new_symbols:
+            key = (s.ticker, s.exchange)
+            (unchanged if key in existing else added).append(s)
+            new_keys.add(key)
+        
+        removed = [
+            MarketSymbol(ticker=ticker, exchange=exchange, currency=currency, name=ticker)
+            for (ticker, exchange), currency in existing.items()
+            if (ticker, exchange) not in new_keys
+        ]
         
         return added, removed, unchanged 
\ No newline at end of file
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Dict, Iterable, List, Optional, Tuple
 
@@ -10,29 +11,55 @@ from .symbols_repository import get_symbols_asof as symbols_get_asof
 from sqlalchemy.engine import Engine
 
 
+def _filter_between(ts: List[datetime], start: Optional[datetime], end: Optional[datetime]) -> Tuple[int, int]:
+    """Return slice bounds of ``ts`` (sorted ascending) within [start, end]."""
+    lo = 0 if start is None else bisect_left(ts, start)
+    hi = len(ts) if end is None else bisect_right(ts, end)
+    return lo, hi
+
+
 @dataclass
 class BarsStore:
     by_symbol: Dict[int, List[BarRow]]
+    _ts_by_symbol: Dict[int, List[datetime]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # ensure sorted by ts and keep a parallel timestamp index for bisection
+        for lst in self.by_symbol.values():
+            lst.sort(key=lambda x: x.ts)
+        self._ts_by_symbol = {sym: [r.ts for r in lst] for sym, lst in self.by_symbol.items()}
 
     @classmethod
     def from_rows(cls, rows: Iterable[BarRow]) -> "BarsStore":
         by_symbol: Dict[int, List[BarRow]] = {}
         for r in rows:
             by_symbol.setdefault(r.symbol_id, []).append(r)
-        # ensure sorted by ts
-        for sym, lst in by_symbol.items():
-            lst.sort(key=lambda x: x.ts)
         return cls(by_symbol=by_symbol)
 
     def get_between(self, symbol_id: int, start: Optional[datetime], end: Optional[datetime]) -> List[BarRow]:
-        data = self.by_symbol.get(symbol_id, [])
-        out: List[BarRow] = []
-        for r in data:
-            if start is not None and r.ts < start:
-                continue
-            if end is not None and r.ts > end:
-                continue
-            out.append(r)
+        data = self.by_symbol.get(symbol_id)
+        if not data:
+            return []
+        lo, hi = _filter_between(self._ts_by_symbol[symbol_id], start, end)
+        return data[lo:hi]
+
+    def get_last_n(self, symbol_id: int, end: Optional[datetime], n: int) -> List[BarRow]:
+        """Return the last ``n`` bars with ``ts <= end`` (all history when ``end`` is None)."""
+        data = self.by_symbol.get(symbol_id)
+        if not data or n <= 0:
+            return []
+        _, hi = _filter_between(self._ts_by_symbol[symbol_id], None, end)
+        return data[max(0, hi - n):hi]
+
+    def addv_batch(self, symbol_ids: Iterable[int], end: Optional[datetime], window_days: int) -> Dict[int, float]:
+        """Average daily dollar volume (close * volume) over the last ``window_days`` bars per symbol.
+
+        Symbols without bars up to ``end`` map to 0.0.
+        """
+        out: Dict[int, float] = {}
+        for sid in symbol_ids:
+            recent = self.get_last_n(sid, end, window_days)
+            out[sid] = sum(float(b.close) * float(b.volume) for b in recent) / len(recent) if recent else 0.0
         return out
 
 
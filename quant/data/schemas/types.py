@@ -50,23 +50,38 @@ class Schema:
         return None
 
     def to_pyarrow(self):  # lazy conversion; import only when needed
+        pa = _pa_module()
+        pa_fields = [pa.field(f.name, _to_pa_type(pa, f.type), nullable=f.nullable) for f in self.fields]
+        return pa.schema(pa_fields)
+
+
+_pa = None
+
+
+def _pa_module():
+    """Import pyarrow on first use and keep the module for later calls."""
+    global _pa
+    if _pa is None:
         try:
-            import pyarrow as pa  # type: ignore
+            import pyarrow as pa_mod  # type: ignore
         except Exception as exc:
             raise ImportError(
                 "pyarrow is not installed or unavailable for this Python version"
             ) from exc
+        _pa = pa_mod
+    return _pa
+
+
+_PA_TYPE_BUILDERS = {
+    TimestampTZ: lambda pa, t: pa.timestamp(t.unit, tz=t.tz),
+    Int64: lambda pa, t: pa.int64(),
+    Float64: lambda pa, t: pa.float64(),
+    String: lambda pa, t: pa.string(),
+}
+
 
-        def _to_pa_type(t: LogicalType):
-            if isinstance(t, TimestampTZ):
-                return pa.timestamp(t.unit, tz=t.tz)
-            if isinstance(t, Int64):
-                return pa.int64()
-            if isinstance(t, Float64):
-                return pa.float64()
-            if isinstance(t, String):
-                return pa.string()
-            raise TypeError(f"Unsupported logical type: {t}")
-
-        pa_fields = [pa.field(f.name, _to_pa_type(f.type), nullable=f.nullable) for f in self.fields]
-        return pa.schema(pa_fields)
\ No newline at end of file
+def _to_pa_type(pa, t: LogicalType):
+    builder = _PA_TYPE_BUILDERS.get(type(t))
+    if builder is None:
+        raise TypeError(f"Unsupported logical type: {t}")
+    return builder(pa, t)
@@ -12,9 +12,13 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from datetime import datetime, timezone, timedelta
-from sqlalchemy import create_engine, insert
+from sqlalchemy import create_engine, insert, text
 from quant.data.fx_repository import define_fx_table, ensure_schema, MetaData
 
+# SQLite caps bound parameters per statement (32766 since 3.32, 999 before);
+# stay under the modern limit when building multi-row VALUES inserts.
+SQLITE_MAX_PARAMS = 32000
+
 def setup_fx_rates(db_path: str = "data/fx.db"):
     """
     Set up basic FX rates for USD/EUR.
@@ -59,10 +63,15 @@ def setup_fx_rates(db_path: str = "data/fx.db"):
         
         current_date += timedelta(days=1)
     
-    # Insert rates into database
+    # Insert rates into database in multi-row chunks, one transaction overall
     with engine.begin() as conn:
+        conn.execute(text("PRAGMA journal_mode=WAL"))
+        conn.execute(text("PRAGMA synchronous=NORMAL"))
         if rates:
-            conn.execute(insert(table), rates)
+            params_per_row = len(rates[0])
+            chunk_size = min(len(rates), SQLITE_MAX_PARAMS // params_per_row)
+            for i in range(0, len(rates), chunk_size):
+                conn.execute(insert(table).values(rates[i:i + chunk_size]))
     
     print(f"Created {len(rates)} FX rates for USD/EUR from {start_date.date()} to {end_date.date()}")
     print(f"Rate range: {min(r['rate'] for r in rates):.4f} - {max(r['rate'] for r in rates):.4f} EUR/USD")
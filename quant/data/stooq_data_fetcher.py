@@ -1,19 +1,76 @@
 from __future__ import annotations
 
+import asyncio
 import csv
+import functools
+import io
 import logging
+import threading
 import time
-from datetime import datetime, timedelta, timezone
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 from dataclasses import dataclass
-from sqlalchemy import create_engine, text
-from quant.data.symbols_repository import get_symbols_asof
+from sqlalchemy import Column, Date, MetaData, String as SAString, Table, bindparam, create_engine, delete, insert, select
+from sqlalchemy.engine import Engine
+from quant.data.symbols_repository import SYMBOLS_TABLE, ensure_schema, get_symbol_id_asof, tune_sqlite_engine
 
 logger = logging.getLogger(__name__)
 
+_STOOQ_COLUMNS = frozenset({'date', 'open', 'high', 'low', 'close', 'volume'})
+
+# Ticker suffix Stooq expects per exchange; exchanges not listed use the bare
+# symbol (e.g. Tokyo, where symbols are numeric).
+_STOOQ_SUFFIX: Dict[str, str] = {
+    'XNAS': '.US',  # NASDAQ
+    'XNYS': '.US',  # NYSE
+    'XHKG': '.HK',  # Hong Kong
+    'XETR': '.DE',  # Deutsche Börse
+    'XLON': '.L',   # London
+    'XAMS': '.AS',  # Amsterdam
+    'XPAR': '.PA',  # Paris
+    'XBRU': '.BR',  # Brussels
+    'XSWX': '.SW',  # Swiss
+    'XASX': '.AX',  # Australian
+    'XTSX': '.TO',  # Toronto
+}
+
+# Stooq URL format: https://stooq.com/q/d/l/?s={symbol}&d1={start_date}&d2={end_date}&i=d
+# The symbol is filled in by get_stooq_url; dates are left for str.format.
+_STOOQ_URL_TEMPLATE = "https://stooq.com/q/d/l/?s=%s&d1={start_date}&d2={end_date}&i=d"
+
+BAR_CSV_COLUMNS = ['symbol_id', 'dt', 'open', 'high', 'low', 'close', 'volume']
+
+BAR_INDEX_TABLE_NAME = "bar_index"
+
+# "csv": one bars CSV for all symbols, with a sidecar date index.
+# "parquet": output path is a directory holding one <symbol>.parquet per symbol.
+STORAGE_FORMATS = ("csv", "parquet")
+
+# Max symbols bound into one IN (...) query against the sidecar index
+_MAX_IN_PARAMS = 900
+
+
+def define_bar_index_table(metadata: MetaData) -> Table:
+    """Sidecar table recording which (symbol, date) pairs a bars CSV already holds."""
+    return Table(
+        BAR_INDEX_TABLE_NAME,
+        metadata,
+        Column("symbol", SAString(32), primary_key=True),
+        Column("dt", Date, primary_key=True),
+    )
+
+
+_BAR_INDEX_METADATA = MetaData()
+_BAR_INDEX = define_bar_index_table(_BAR_INDEX_METADATA)
+
 
 @dataclass(frozen=True)
 class StooqDataPoint:
@@ -25,120 +82,208 @@ class StooqDataPoint:
     volume: int
 
 
+def _to_datetime_utc(day: np.datetime64) -> datetime:
+    return datetime.combine(day.astype(date), datetime.min.time(), tzinfo=timezone.utc)
+
+
+@dataclass(eq=False)
+class StooqBatch:
+    """Daily history for one symbol stored as parallel column arrays.
+
+    ``dates`` is ``datetime64[D]``; prices are ``float64`` and volume ``int64``.
+    Iterating (or indexing with an int) yields ``StooqDataPoint`` views for
+    callers written against the row-per-object API.
+    """
+    dates: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def empty(cls) -> "StooqBatch":
+        f = np.empty(0, dtype='float64')
+        return cls(np.empty(0, dtype='datetime64[D]'), f, f, f, f, np.empty(0, dtype='int64'))
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, key) -> Union["StooqBatch", StooqDataPoint]:
+        if isinstance(key, (int, np.integer)):
+            return StooqDataPoint(
+                date=_to_datetime_utc(self.dates[key]),
+                open=float(self.open[key]),
+                high=float(self.high[key]),
+                low=float(self.low[key]),
+                close=float(self.close[key]),
+                volume=int(self.volume[key]),
+            )
+        return StooqBatch(
+            self.dates[key], self.open[key], self.high[key], self.low[key], self.close[key], self.volume[key]
+        )
+
+    def __iter__(self) -> Iterator[StooqDataPoint]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_dataframe(self, symbol_id: Union[int, str]) -> pd.DataFrame:
+        """Rows in bars CSV layout, with ``symbol_id`` broadcast to every row."""
+        return pd.DataFrame({
+            'symbol_id': np.full(len(self), symbol_id, dtype=object),
+            'dt': self.dates,
+            'open': self.open,
+            'high': self.high,
+            'low': self.low,
+            'close': self.close,
+            'volume': self.volume,
+        }, columns=BAR_CSV_COLUMNS)
+
+
+class _RateLimiter:
+    """Global request pacing shared by all worker threads.
+
+    Hands out one request slot every ``interval`` seconds; callers sleep until
+    their slot instead of serialising on a fixed delay after each request.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = max(0.0, interval)
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+
+
+def _first_present(header: List[str], *names: str) -> Optional[str]:
+    """First of ``names`` present in ``header``."""
+    for name in names:
+        if name in header:
+            return name
+    return None
+
+
+def _parquet_modules():
+    # Optional: requires pyarrow at runtime
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+    except Exception as exc:
+        raise ImportError("pyarrow required for parquet bar storage") from exc
+    return pa, pq
+
+
+def _read_csv_columns(csv_path: Path, columns: List[str]) -> pd.DataFrame:
+    """Read only ``columns`` of a CSV as strings, skipping malformed rows.
+    
+    Uses the multi-threaded pyarrow CSV reader when pyarrow is installed and
+    falls back to pandas otherwise. Empty cells come back as ``''``.
+    """
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.csv as pacsv  # type: ignore
+    except ImportError:
+        return pd.read_csv(csv_path, usecols=columns, dtype=str, keep_default_na=False,
+                           on_bad_lines='skip')
+    table = pacsv.read_csv(
+        csv_path,
+        parse_options=pacsv.ParseOptions(invalid_row_handler=lambda row: 'skip'),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=columns,
+            column_types={c: pa.string() for c in columns},
+            strings_can_be_null=False,
+        ),
+    )
+    return table.to_pandas()
+
+
 class StooqDataFetcher:
     """Fetches historical stock data from Stooq with intelligent missing data detection."""
     
-    def __init__(self, delay_seconds: float = 1.0, symbols_db_path: Optional[str] = None):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+    def __init__(self, delay_seconds: float = 1.0, symbols_db_path: Optional[str] = None,
+                 max_workers: int = 8, storage_format: str = "csv"):
+        if storage_format not in STORAGE_FORMATS:
+            raise ValueError(f"storage_format must be one of {STORAGE_FORMATS}, got {storage_format!r}")
+        if storage_format == "parquet":
+            _parquet_modules()  # fail fast if pyarrow is missing
+        self.storage_format = storage_format
         self.delay_seconds = delay_seconds
         self.symbols_db_path = symbols_db_path
-        self._symbol_cache = {}
+        self.max_workers = max(1, max_workers)
+        # Bounded, thread-safe cache keyed by (symbol, exchange, asof day ordinal)
+        self._lookup_symbol_id = functools.lru_cache(maxsize=50_000)(self._lookup_symbol_id_uncached)
+        self._symbols_engine = None
+        self._symbols_engine_lock = threading.Lock()
+        self._local = threading.local()
+        # One pooled adapter shared by every worker session so keep-alive
+        # connections are reused across symbols instead of re-handshaking.
+        self._adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self._rate_limiter = _RateLimiter(delay_seconds)
+        self._save_lock = threading.Lock()
+        self._index_engines: Dict[Path, Engine] = {}
+        self._index_lock = threading.Lock()
+    
+    def _get_session(self) -> requests.Session:
+        """Return the calling thread's HTTP session, creating it on first use."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            })
+            session.mount('https://', self._adapter)
+            session.mount('http://', self._adapter)
+            self._local.session = session
+        return session
+    
+    def _get_symbols_engine(self):
+        """Engine for the symbols database, created and schema-checked once."""
+        with self._symbols_engine_lock:
+            if self._symbols_engine is None:
+                engine = tune_sqlite_engine(create_engine(f"sqlite:///{self.symbols_db_path}", future=True))
+                ensure_schema(engine)
+                self._symbols_engine = engine
+        return self._symbols_engine
+    
+    def _lookup_symbol_id_uncached(self, symbol: str, exchange: str, asof_ord: int) -> Optional[int]:
+        asof = datetime.fromordinal(asof_ord).replace(tzinfo=timezone.utc)
+        try:
+            return get_symbol_id_asof(self._get_symbols_engine(), symbol, exchange, asof)
+        except Exception as e:
+            logger.warning("Could not get symbol ID for %s (%s): %s", symbol, exchange, e)
+            return None
     
     def get_symbol_id(self, symbol: str, exchange: str, asof_date: datetime) -> Optional[int]:
-        """Get symbol ID from symbols database."""
+        """Get symbol ID from symbols database.
+        
+        Lookups are resolved as of 00:00 UTC on the day of ``asof_date`` and cached
+        per (symbol, exchange, day), so passing a stable date maximises cache hits.
+        """
         if not self.symbols_db_path:
             return None
-            
-        if (symbol, exchange) not in self._symbol_cache:
-            try:
-                engine = create_engine(f"sqlite:///{self.symbols_db_path}")
-                symbols = get_symbols_asof(engine, asof_date)
-                
-                # Find matching symbol
-                for sym in symbols:
-                    if sym.ticker == symbol and sym.exchange == exchange:
-                        self._symbol_cache[(symbol, exchange)] = sym.symbol_id
-                        break
-                else:
-                    self._symbol_cache[(symbol, exchange)] = None
-                    
-            except Exception as e:
-                logger.warning(f"Could not get symbol ID for {symbol} ({exchange}): {e}")
-                self._symbol_cache[(symbol, exchange)] = None
-        
-        return self._symbol_cache[(symbol, exchange)]
+        if asof_date.tzinfo is not None:
+            asof_date = asof_date.astimezone(timezone.utc)
+        return self._lookup_symbol_id(symbol, exchange, asof_date.toordinal())
     
     def get_stooq_url(self, symbol: str, exchange: str) -> str:
         """Generate Stooq URL for a given symbol and exchange."""
-        # Map exchange codes to Stooq format
-        exchange_map = {
-            'XNAS': 'us',  # NASDAQ
-            'XNYS': 'us',  # NYSE
-            'XLON': 'uk',  # London
-            'XETR': 'de',  # Deutsche Börse
-            'XTOK': 'jp',  # Tokyo
-            'XHKG': 'hk',  # Hong Kong
-            'XAMS': 'nl',  # Amsterdam
-            'XPAR': 'fr',  # Paris
-            'XBRU': 'be',  # Brussels
-            'XLIS': 'pt',  # Lisbon
-            'XOSL': 'no',  # Oslo
-            'XSTO': 'se',  # Stockholm
-            'XHEL': 'fi',  # Helsinki
-            'XCOP': 'dk',  # Copenhagen
-            'XWAR': 'pl',  # Warsaw
-            'XPRA': 'cz',  # Prague
-            'XBUD': 'hu',  # Budapest
-            'XVIE': 'at',  # Vienna
-            'XSWX': 'ch',  # Swiss
-            'XMIL': 'it',  # Milan
-            'XMAD': 'es',  # Madrid
-            'XBOM': 'in',  # Bombay
-            'XNSE': 'in',  # National Stock Exchange of India
-            'XASX': 'au',  # Australian
-            'XTSX': 'ca',  # Toronto
-            'XSAO': 'br',  # São Paulo
-            'XJSE': 'za',  # Johannesburg
-            'XTAE': 'il',  # Tel Aviv
-        }
-        
-        stooq_exchange = exchange_map.get(exchange, 'us')
-        
-        # Handle different symbol formats for Stooq
-        if exchange in ['XNAS', 'XNYS']:
-            # US symbols need .US suffix
-            stooq_symbol = f"{symbol}.US"
-        elif exchange == 'XTOK':
-            # Japanese symbols are typically numeric, no suffix needed
-            stooq_symbol = symbol
-        elif exchange == 'XHKG':
-            # Hong Kong symbols need .HK suffix
-            stooq_symbol = f"{symbol}.HK"
-        elif exchange == 'XETR':
-            # German symbols need .DE suffix
-            stooq_symbol = f"{symbol}.DE"
-        elif exchange == 'XLON':
-            # UK symbols need .L suffix
-            stooq_symbol = f"{symbol}.L"
-        elif exchange == 'XAMS':
-            # Dutch symbols need .AS suffix
-            stooq_symbol = f"{symbol}.AS"
-        elif exchange == 'XPAR':
-            # French symbols need .PA suffix
-            stooq_symbol = f"{symbol}.PA"
-        elif exchange == 'XBRU':
-            # Belgian symbols need .BR suffix
-            stooq_symbol = f"{symbol}.BR"
-        elif exchange == 'XSWX':
-            # Swiss symbols need .SW suffix
-            stooq_symbol = f"{symbol}.SW"
-        elif exchange == 'XASX':
-            # Australian symbols need .AX suffix
-            stooq_symbol = f"{symbol}.AX"
-        elif exchange == 'XTSX':
-            # Canadian symbols need .TO suffix
-            stooq_symbol = f"{symbol}.TO"
-        else:
-            # Default to symbol as is
-            stooq_symbol = symbol
-        
-        # Stooq URL format: https://stooq.com/q/d/l/?s={symbol}&d1={start_date}&d2={end_date}&i=d
-        return f"https://stooq.com/q/d/l/?s={stooq_symbol}&d1={{start_date}}&d2={{end_date}}&i=d"
+        stooq_symbol = symbol + _STOOQ_SUFFIX.get(exchange, '')
+        return _STOOQ_URL_TEMPLATE % stooq_symbol
     
-    def fetch_symbol_data(self, symbol: str, exchange: str, start_date: datetime, end_date: datetime) -> List[StooqDataPoint]:
+    def fetch_symbol_data(self, symbol: str, exchange: str, start_date: datetime, end_date: datetime) -> StooqBatch:
         """Fetch historical data for a single symbol from Stooq."""
         fetch_start_time = time.time()
         
@@ -151,230 +296,460 @@ class StooqDataFetcher:
             
             full_url = url.format(start_date=start_str, end_date=end_str)
             
-            logger.debug(f"Fetching data for {symbol} ({exchange}) from {start_str} to {end_str}")
-            logger.debug(f"URL: {full_url}")
+            logger.debug("Fetching data for %s (%s) from %s to %s", symbol, exchange, start_str, end_str)
+            logger.debug("URL: %s", full_url)
             
-            response = self.session.get(full_url, timeout=30)
+            self._rate_limiter.acquire()
+            response = self._get_session().get(full_url, timeout=30)
             fetch_time = time.time() - fetch_start_time
             
             if response.status_code == 200:
-                # Parse CSV data
-                data_points = []
-                lines = response.text.strip().split('\n')
-                
-                if len(lines) > 1:  # Has header and data
-                    logger.debug(f"Received {len(lines)-1} data lines for {symbol}")
-                    
-                    # Skip header line
-                    for line_num, line in enumerate(lines[1:], 1):
-                        if line.strip():
-                            parts = line.split(',')
-                            if len(parts) >= 6:
-                                try:
-                                    date_str = parts[0]
-                                    date = datetime.strptime(date_str, '%Y-%m-%d').replace(tzinfo=timezone.utc)
-                                    
-                                    data_point = StooqDataPoint(
-                                        date=date,
-                                        open=float(parts[1]),
-                                        high=float(parts[2]),
-                                        low=float(parts[3]),
-                                        close=float(parts[4]),
-                                        volume=int(float(parts[5]))  # Handle decimal volume values
-                                    )
-                                    data_points.append(data_point)
-                                except (ValueError, IndexError) as e:
-                                    logger.warning(f"Error parsing line {line_num} '{line.strip()}' for {symbol}: {e}")
-                                    continue
-                else:
-                    logger.warning(f"No data lines found for {symbol} (only header)")
-                
+                data_points = self._parse_stooq_csv(response.text, symbol)
                 total_time = time.time() - fetch_start_time
-                logger.debug(f"Successfully fetched {len(data_points)} data points for {symbol} in {total_time:.2f}s (fetch: {fetch_time:.2f}s)")
+                logger.debug("Successfully fetched %d data points for %s in %.2fs (fetch: %.2fs)", len(data_points), symbol, total_time, fetch_time)
                 return data_points
             else:
                 total_time = time.time() - fetch_start_time
-                logger.warning(f"Failed to fetch data for {symbol}: HTTP {response.status_code} in {total_time:.2f}s")
-                return []
+                logger.warning("Failed to fetch data for %s: HTTP %s in %.2fs", symbol, response.status_code, total_time)
+                return StooqBatch.empty()
                 
         except Exception as e:
             total_time = time.time() - fetch_start_time
-            logger.error(f"Error fetching data for {symbol}: {e} (after {total_time:.2f}s)")
-            return []
+            logger.error("Error fetching data for %s: %s (after %.2fs)", symbol, e, total_time)
+            return StooqBatch.empty()
+    
+    def _parse_stooq_csv(self, text: str, symbol: str) -> StooqBatch:
+        """Parse a Stooq daily CSV payload in one vectorised pass."""
+        df = pd.read_csv(io.StringIO(text), on_bad_lines='skip', skipinitialspace=True)
+        df.columns = df.columns.str.strip().str.lower()
+        if df.empty or not _STOOQ_COLUMNS.issubset(df.columns):
+            logger.warning("No data lines found for %s (only header)", symbol)
+            return StooqBatch.empty()
+        
+        logger.debug("Received %d data lines for %s", len(df), symbol)
+        dates = pd.to_datetime(df['date'], format='%Y-%m-%d', errors='coerce')
+        values = df[['open', 'high', 'low', 'close', 'volume']].apply(pd.to_numeric, errors='coerce').astype('float64')
+        valid = dates.notna() & values.notna().all(axis=1)
+        if not valid.all():
+            logger.warning("Skipped %d unparseable lines for %s", int((~valid).sum()), symbol)
+            dates = dates[valid]
+            values = values[valid]
+        
+        return StooqBatch(
+            dates=dates.to_numpy(dtype='datetime64[D]'),
+            open=values['open'].to_numpy(),
+            high=values['high'].to_numpy(),
+            low=values['low'].to_numpy(),
+            close=values['close'].to_numpy(),
+            volume=values['volume'].to_numpy().astype('int64'),  # Handle decimal volume values
+        )
+    
+    @staticmethod
+    def bar_index_path(csv_path: Path) -> Path:
+        """Location of the sidecar date index kept next to a bars CSV."""
+        return Path(str(csv_path) + ".idx")
+    
+    def _get_index_engine(self, csv_path: Path) -> Engine:
+        """Engine for the sidecar index of ``csv_path``; built from the CSV on first use."""
+        key = Path(csv_path).resolve()
+        with self._index_lock:
+            engine = self._index_engines.get(key)
+            if engine is None:
+                index_path = self.bar_index_path(key)
+                needs_bootstrap = not index_path.exists() and key.exists()
+                engine = tune_sqlite_engine(create_engine(f"sqlite:///{index_path}", future=True))
+                _BAR_INDEX_METADATA.create_all(engine)
+                if needs_bootstrap:
+                    self._bootstrap_index(engine, key)
+                self._index_engines[key] = engine
+        return engine
+    
+    def _tickers_for_row_keys(self, keys: pd.Series) -> pd.Series:
+        """Map CSV row keys to the tickers the index is keyed by.
+        
+        Rows saved with a symbol id carry the numeric id; it is resolved back to its
+        ticker through the symbols database. Keys that cannot be resolved (no symbols
+        database, unknown id) are kept as they are.
+        """
+        ids = pd.to_numeric(keys, errors='coerce')
+        numeric = ids.notna()
+        if not numeric.any():
+            return keys
+        if not self.symbols_db_path:
+            logger.warning("Symbol ids in bars CSV but no symbols database to map them to tickers")
+            return keys
+        wanted = sorted({int(i) for i in ids[numeric]})
+        stmt = select(SYMBOLS_TABLE.c.symbol_id, SYMBOLS_TABLE.c.ticker).where(
+            SYMBOLS_TABLE.c.symbol_id.in_(bindparam("ids", expanding=True))
+        )
+        ticker_of: Dict[int, str] = {}
+        with self._get_symbols_engine().connect() as conn:
+            for i in range(0, len(wanted), _MAX_IN_PARAMS):
+                ticker_of.update((int(sid), ticker) for sid, ticker in conn.execute(stmt, {"ids": wanted[i:i + _MAX_IN_PARAMS]}))
+        tickers = ids.map(ticker_of)
+        return keys.where(tickers.isna(), tickers)
+    
+    def _bootstrap_index(self, engine: Engine, csv_path: Path) -> None:
+        """Populate a fresh sidecar index from an existing bars CSV (one full scan)."""
+        try:
+            header = list(pd.read_csv(csv_path, nrows=0).columns)
+            key_col = _first_present(header, 'symbol', 'symbol_id')
+            date_col = _first_present(header, 'date', 'dt')
+            if key_col is None or date_col is None:
+                logger.error("Unknown CSV format in %s", csv_path)
+                return
+            df = _read_csv_columns(csv_path, [key_col, date_col])
+            # The calendar day is the leading YYYY-MM-DD of both date and timestamp values
+            days = pd.to_datetime(df[date_col].str[:10], format='%Y-%m-%d', errors='coerce')
+            valid = (df[key_col] != '') & days.notna()
+            # The index is keyed by ticker, as save_data_to_csv writes it
+            symbols = self._tickers_for_row_keys(df[key_col][valid])
+            found = pd.DataFrame({'symbol': symbols, 'dt': days[valid].dt.date}).drop_duplicates()
+            pairs = list(zip(found['symbol'], found['dt']))
+        except Exception as e:
+            logger.error("Error indexing existing data in %s: %s", csv_path, e)
+            return
+        
+        with engine.begin() as conn:
+            if pairs:
+                conn.execute(insert(_BAR_INDEX), [{"symbol": sym, "dt": d} for sym, d in pairs])
+        logger.info("Indexed %d existing data points from %s", len(pairs), csv_path)
+    
+    @staticmethod
+    def bars_parquet_path(output_dir: Path, symbol: str) -> Path:
+        """Per-symbol Parquet file used when ``storage_format="parquet"``."""
+        return output_dir / f"{symbol}.parquet"
     
-    def get_existing_data_dates(self, csv_path: Path, symbol: str) -> Set[datetime]:
-        """Get dates that already exist in the CSV file for a given symbol."""
-        existing_dates = set()
+    def _parquet_dates(self, path: Path) -> Set[date]:
+        if not path.exists():
+            return set()
+        _, pq = _parquet_modules()
+        # Only the date column is read; OHLCV pages are never touched
+        return set(pq.read_table(path, columns=['dt'])['dt'].to_pylist())
+    
+    def get_existing_data_dates(self, csv_path: Path, symbol: str) -> Set[date]:
+        """Get dates that already exist in the output for a given symbol."""
+        if self.storage_format == "parquet":
+            try:
+                return self._parquet_dates(self.bars_parquet_path(csv_path, symbol))
+            except Exception as e:
+                logger.error("Error reading existing data for %s: %s", symbol, e)
+                return set()
         
         if not csv_path.exists():
-            return existing_dates
+            return set()
         
         try:
-            with open(csv_path, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if row.get('symbol') == symbol:
-                        try:
-                            date = datetime.fromisoformat(row['date'].replace('Z', '+00:00'))
-                            existing_dates.add(date.date())  # Use date only for comparison
-                        except (ValueError, KeyError):
-                            continue
+            engine = self._get_index_engine(csv_path)
+            with engine.connect() as conn:
+                rows = conn.execute(select(_BAR_INDEX.c.dt).where(_BAR_INDEX.c.symbol == symbol)).scalars().all()
+            return set(rows)
         except Exception as e:
-            logger.error(f"Error reading existing data for {symbol}: {e}")
-        
-        return existing_dates
+            logger.error("Error reading existing data for %s: %s", symbol, e)
+            return set()
+    
+    def get_existing_data_dates_bulk(self, csv_path: Path, symbols: List[str]) -> Dict[str, Set[date]]:
+        """Existing dates for many symbols at once, read from the sidecar index in one pass."""
+        existing: Dict[str, Set[date]] = defaultdict(set)
+        if self.storage_format == "parquet":
+            for sym in dict.fromkeys(symbols):
+                dates = self.get_existing_data_dates(csv_path, sym)
+                if dates:
+                    existing[sym] = dates
+            return existing
+        
+        if not csv_path.exists() or not symbols:
+            return existing
+        
+        stmt = select(_BAR_INDEX.c.symbol, _BAR_INDEX.c.dt).where(
+            _BAR_INDEX.c.symbol.in_(bindparam("syms", expanding=True))
+        )
+        unique = list(dict.fromkeys(symbols))
+        try:
+            engine = self._get_index_engine(csv_path)
+            with engine.connect() as conn:
+                # stay below SQLite's bound-parameter limit for very large universes
+                for i in range(0, len(unique), _MAX_IN_PARAMS):
+                    for sym, d in conn.execute(stmt, {"syms": unique[i:i + _MAX_IN_PARAMS]}):
+                        existing[sym].add(d)
+        except Exception as e:
+            logger.error("Error reading existing data from %s: %s", csv_path, e)
+        return existing
     
     def fetch_missing_data(self, symbol: str, exchange: str, csv_path: Path, 
-                          start_date: datetime, end_date: datetime) -> List[StooqDataPoint]:
-        """Fetch only missing data for a symbol."""
+                          start_date: datetime, end_date: datetime,
+                          existing_dates: Optional[Set[date]] = None) -> StooqBatch:
+        """Fetch only missing data for a symbol.
+        
+        ``existing_dates`` may be passed when the caller has already looked them up.
+        """
         # Get existing dates
-        existing_dates = self.get_existing_data_dates(csv_path, symbol)
+        if existing_dates is None:
+            existing_dates = self.get_existing_data_dates(csv_path, symbol)
         
         if existing_dates:
-            logger.debug(f"Found {len(existing_dates)} existing data points for {symbol}")
+            logger.debug("Found %d existing data points for %s", len(existing_dates), symbol)
         
         # Fetch all data for the period
         all_data = self.fetch_symbol_data(symbol, exchange, start_date, end_date)
         
         if not all_data:
-            logger.debug(f"No data fetched for {symbol}, nothing to check for missing data")
-            return []
+            logger.debug("No data fetched for %s, nothing to check for missing data", symbol)
+            return all_data
         
         # Filter out existing data
-        missing_data = []
-        for data_point in all_data:
-            if data_point.date.date() not in existing_dates:
-                missing_data.append(data_point)
+        if existing_dates:
+            existing_np = np.fromiter(existing_dates, dtype='datetime64[D]', count=len(existing_dates))
+            missing_data = all_data[~np.isin(all_data.dates, existing_np)]
+        else:
+            missing_data = all_data
         
-        logger.debug(f"Found {len(missing_data)} missing data points for {symbol} out of {len(all_data)} total")
+        logger.debug("Found %d missing data points for %s out of %d total", len(missing_data), symbol, len(all_data))
         
-        if missing_data and existing_dates:
+        if missing_data and existing_dates and logger.isEnabledFor(logging.DEBUG):
             # Show date range of missing data
-            missing_dates = sorted([dp.date.date() for dp in missing_data])
-            if len(missing_dates) > 0:
-                logger.debug(f"Missing data for {symbol}: {missing_dates[0]} to {missing_dates[-1]} ({len(missing_dates)} dates)")
+            logger.debug("Missing data for %s: %s to %s (%s dates)", symbol, missing_data.dates.min(), missing_data.dates.max(), len(missing_data))
         
         return missing_data
     
-    def save_data_to_csv(self, data_points: List[StooqDataPoint], symbol: str, 
+    def save_data_to_csv(self, data_points: Union[StooqBatch, pd.DataFrame], symbol: str, 
                         exchange: str, csv_path: Path, symbol_id: Optional[int] = None) -> None:
-        """Save data points to CSV file in bars format."""
+        """Save data points to CSV file in bars format.
+        
+        ``data_points`` is a ``StooqBatch`` or a DataFrame with the bars columns
+        (``symbol_id`` may be omitted and is then filled in).
+        """
         # Create directory if it doesn't exist
         csv_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Check if file exists and has header
         file_exists = csv_path.exists()
         
-        with open(csv_path, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Write header if file is new
-            if not file_exists:
-                writer.writerow(['symbol_id', 'dt', 'open', 'high', 'low', 'close', 'volume'])
-            
-            # Write data points in bars format
-            for data_point in data_points:
-                writer.writerow([
-                    symbol_id if symbol_id is not None else symbol,  # Use symbol_id if provided, otherwise symbol
-                    data_point.date.date().isoformat(),  # Just the date part
-                    data_point.open,
-                    data_point.high,
-                    data_point.low,
-                    data_point.close,
-                    data_point.volume
-                ])
-        
-        logger.info(f"Saved {len(data_points)} data points for {symbol} to {csv_path}")
+        index_engine = self._get_index_engine(csv_path)
+        if not file_exists:
+            # A new CSV starts with an empty index, even if a stale sidecar was left behind
+            with index_engine.begin() as conn:
+                conn.execute(delete(_BAR_INDEX))
+        
+        # Use symbol_id if provided, otherwise symbol
+        row_key = symbol_id if symbol_id is not None else symbol
+        if isinstance(data_points, StooqBatch):
+            df = data_points.to_dataframe(row_key)
+        else:
+            df = data_points
+            if 'symbol_id' not in df.columns:
+                df = df.assign(symbol_id=row_key)
+            df = df[BAR_CSV_COLUMNS]
+        
+        # Write the whole batch in one C-level pass, header only if file is new
+        df.to_csv(csv_path, mode='a', header=not file_exists, index=False, date_format='%Y-%m-%d')
+        
+        if len(df):
+            # Indexed by ticker (what lookups pass), whatever key the CSV rows carry
+            days = pd.to_datetime(df['dt']).dt.date.unique().tolist()
+            with index_engine.begin() as conn:
+                conn.execute(
+                    insert(_BAR_INDEX).prefix_with("OR IGNORE"),
+                    [{"symbol": symbol, "dt": d} for d in days],
+                )
+        
+        logger.info("Saved %d data points for %s to %s", len(df), symbol, csv_path)
     
-    def fetch_symbols_data(self, symbols: List[Tuple[str, str]], output_path: Path,
-                          start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
-                          force_refresh: bool = False) -> Dict[str, int]:
-        """Fetch data for multiple symbols with delays."""
+    def save_data_to_parquet(self, data_points: Union[StooqBatch, pd.DataFrame], symbol: str,
+                             exchange: str, output_dir: Path, symbol_id: Optional[int] = None) -> None:
+        """Merge data points into ``<output_dir>/<symbol>.parquet``.
+        
+        Parquet files cannot be appended in place, so existing rows are read back,
+        combined with the new ones (new rows win on duplicate dates) and rewritten.
+        """
+        pa, pq = _parquet_modules()
+        row_key = str(symbol_id if symbol_id is not None else symbol)
+        if isinstance(data_points, StooqBatch):
+            df = data_points.to_dataframe(row_key)
+        else:
+            df = data_points.assign(symbol_id=row_key)[BAR_CSV_COLUMNS]
+        df = df.assign(symbol_id=row_key, dt=pd.to_datetime(df['dt']).dt.date)
+        
+        output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.bars_parquet_path(output_dir, symbol)
+        if path.exists():
+            existing = pq.read_table(path).to_pandas()
+            df = pd.concat([existing, df], ignore_index=True)
+        df = df.drop_duplicates('dt', keep='last').sort_values('dt')
+        
+        schema = pa.schema([
+            ('symbol_id', pa.string()),
+            ('dt', pa.date32()),
+            ('open', pa.float64()),
+            ('high', pa.float64()),
+            ('low', pa.float64()),
+            ('close', pa.float64()),
+            ('volume', pa.int64()),
+        ])
+        table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+        pq.write_table(table, path, compression='snappy')
+        logger.info("Saved %d data points for %s to %s", len(data_points), symbol, path)
+    
+    def _process_one(self, symbol: str, exchange: str, output_path: Path,
+                     start_date: datetime, end_date: datetime, force_refresh: bool,
+                     progress: str, existing_dates: Set[date]) -> int:
+        """Fetch and persist one symbol; returns the number of data points saved."""
+        symbol_start_time = time.time()
+        logger.info("%s Processing %s (%s)...", progress, symbol, exchange)
+        
+        # Existing data is prefetched for the whole batch by fetch_symbols_data
+        if not force_refresh:
+            if existing_dates:
+                logger.info("%s   Found %d existing data points for %s", progress, len(existing_dates), symbol)
+        
+        # Fetch data
+        if force_refresh:
+            logger.info("%s   Fetching all data for %s (force refresh)", progress, symbol)
+            data_points = self.fetch_symbol_data(symbol, exchange, start_date, end_date)
+        else:
+            logger.info("%s   Fetching missing data for %s", progress, symbol)
+            data_points = self.fetch_missing_data(symbol, exchange, output_path, start_date, end_date,
+                                                  existing_dates=existing_dates)
+        
+        if not data_points:
+            if not force_refresh and existing_dates:
+                logger.info("%s   ⚪ Skipped: %s already has complete data", progress, symbol)
+            else:
+                logger.warning("%s   ⚠ No data found for %s", progress, symbol)
+            return 0
+        
+        # Get symbol ID if available
+        symbol_id = self.get_symbol_id(symbol, exchange, datetime.now(timezone.utc))
+        with self._save_lock:
+            if self.storage_format == "parquet":
+                self.save_data_to_parquet(data_points, symbol, exchange, output_path, symbol_id)
+            else:
+                self.save_data_to_csv(data_points, symbol, exchange, output_path, symbol_id)
+        
+        symbol_time = time.time() - symbol_start_time
+        logger.info("%s   ✓ Success: %d data points saved in %.2fs", progress, len(data_points), symbol_time)
+        return len(data_points)
+    
+    def _batch_window(self, start_date: Optional[datetime],
+                      end_date: Optional[datetime]) -> Tuple[datetime, datetime]:
         if start_date is None:
             start_date = datetime.now(timezone.utc) - timedelta(days=365)  # Default to 1 year
         
         if end_date is None:
             end_date = datetime.now(timezone.utc)
+        return start_date, end_date
+    
+    def _log_batch_start(self, total_symbols: int, start_date: datetime, end_date: datetime,
+                         force_refresh: bool) -> None:
+        logger.info("Starting batch fetch for %d symbols", total_symbols)
+        logger.info("Date range: %s to %s", start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+        logger.info("Force refresh: %s", force_refresh)
+        logger.info("Workers: %s, minimum interval between requests: %s seconds", self.max_workers, self.delay_seconds)
+        logger.info("-" * 80)
+    
+    def _log_batch_summary(self, results: Dict[str, int], failed_symbols: int, start_time: float) -> None:
+        total_symbols = len(results)
+        successful_symbols = sum(1 for count in results.values() if count)
+        total_data_points = sum(results.values())
+        
+        total_time = time.time() - start_time
+        logger.info("-" * 80)
+        logger.info("BATCH FETCH SUMMARY:")
+        logger.info("  Total symbols processed: %d", total_symbols)
+        logger.info("  Successful: %d", successful_symbols)
+        logger.info("  Failed: %d", failed_symbols)
+        logger.info("  Total data points fetched: %d", total_data_points)
+        logger.info("  Total time: %.2f seconds", total_time)
+        logger.info("  Average time per symbol: %.2f seconds", total_time/total_symbols)
+        logger.info("  Success rate: %.1f%%", successful_symbols/total_symbols*100)
         
-        results = {}
+        if failed_symbols > 0:
+            logger.warning("  Failed symbols: %d", failed_symbols)
+    
+    def fetch_symbols_data(self, symbols: List[Tuple[str, str]], output_path: Path,
+                          start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+                          force_refresh: bool = False) -> Dict[str, int]:
+        """Fetch data for multiple symbols concurrently, paced by the global rate limit."""
+        start_date, end_date = self._batch_window(start_date, end_date)
+        results = {symbol: 0 for symbol, _ in symbols}
         total_symbols = len(symbols)
-        successful_symbols = 0
         failed_symbols = 0
-        total_data_points = 0
         start_time = time.time()
         
-        logger.info(f"Starting batch fetch for {total_symbols} symbols")
-        logger.info(f"Date range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
-        logger.info(f"Force refresh: {force_refresh}")
-        logger.info(f"Delay between requests: {self.delay_seconds} seconds")
-        logger.info("-" * 80)
+        self._log_batch_start(total_symbols, start_date, end_date, force_refresh)
         
-        for i, (symbol, exchange) in enumerate(symbols):
-            symbol_start_time = time.time()
-            progress = f"[{i+1:3d}/{total_symbols:3d}]"
-            
-            logger.info(f"{progress} Processing {symbol} ({exchange})...")
+        existing_map: Dict[str, Set[date]] = {}
+        if not force_refresh:
+            existing_map = self.get_existing_data_dates_bulk(output_path, [s for s, _ in symbols])
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as ex:
+            futures = {}
+            for i, (symbol, exchange) in enumerate(symbols):
+                progress = f"[{i+1:3d}/{total_symbols:3d}]"
+                future = ex.submit(self._process_one, symbol, exchange, output_path,
+                                   start_date, end_date, force_refresh, progress,
+                                   existing_map.get(symbol, set()))
+                futures[future] = (symbol, progress)
             
-            try:
-                # Check existing data first
-                existing_dates = set()
-                if not force_refresh:
-                    existing_dates = self.get_existing_data_dates(output_path, symbol)
-                    if existing_dates:
-                        logger.info(f"{progress}   Found {len(existing_dates)} existing data points for {symbol}")
-                
-                # Fetch data
-                if force_refresh:
-                    logger.info(f"{progress}   Fetching all data for {symbol} (force refresh)")
-                    data_points = self.fetch_symbol_data(symbol, exchange, start_date, end_date)
-                else:
-                    logger.info(f"{progress}   Fetching missing data for {symbol}")
-                    data_points = self.fetch_missing_data(symbol, exchange, output_path, start_date, end_date)
-                
-                # Process results
-                if data_points:
-                    # Get symbol ID if available
-                    symbol_id = self.get_symbol_id(symbol, exchange, datetime.now(timezone.utc))
-                    self.save_data_to_csv(data_points, symbol, exchange, output_path, symbol_id)
-                    results[symbol] = len(data_points)
-                    total_data_points += len(data_points)
-                    successful_symbols += 1
-                    
-                    symbol_time = time.time() - symbol_start_time
-                    logger.info(f"{progress}   ✓ Success: {len(data_points)} data points saved in {symbol_time:.2f}s")
-                else:
-                    results[symbol] = 0
-                    if not force_refresh and existing_dates:
-                        logger.info(f"{progress}   ⚪ Skipped: {symbol} already has complete data")
-                    else:
-                        logger.warning(f"{progress}   ⚠ No data found for {symbol}")
-                
-                # Add delay between requests
-                if i < len(symbols) - 1:  # Don't delay after the last request
-                    logger.info(f"{progress}   Waiting {self.delay_seconds}s before next request...")
-                    time.sleep(self.delay_seconds)
-                    
-            except Exception as e:
-                failed_symbols += 1
-                results[symbol] = 0
-                symbol_time = time.time() - symbol_start_time
-                logger.error(f"{progress}   ✗ Error processing {symbol}: {e} (after {symbol_time:.2f}s)")
+            for future in as_completed(futures):
+                symbol, progress = futures[future]
+                try:
+                    results[symbol] = future.result()
+                except Exception as e:
+                    failed_symbols += 1
+                    logger.error("%s   ✗ Error processing %s: %s", progress, symbol, e)
+        
+        self._log_batch_summary(results, failed_symbols, start_time)
+        return results
+    
+    async def fetch_symbols_data_async(self, symbols: List[Tuple[str, str]], output_path: Path,
+                                       start_date: Optional[datetime] = None,
+                                       end_date: Optional[datetime] = None,
+                                       force_refresh: bool = False) -> Dict[str, int]:
+        """Awaitable counterpart of ``fetch_symbols_data`` for callers already inside an event loop.
+        
+        At most ``max_workers`` symbols are in flight at once; each runs the blocking
+        fetch/save path on a worker thread so the loop stays responsive.
+        """
+        start_date, end_date = self._batch_window(start_date, end_date)
+        results = {symbol: 0 for symbol, _ in symbols}
+        total_symbols = len(symbols)
+        start_time = time.time()
         
-        # Final summary
-        total_time = time.time() - start_time
-        logger.info("-" * 80)
-        logger.info("BATCH FETCH SUMMARY:")
-        logger.info(f"  Total symbols processed: {total_symbols}")
-        logger.info(f"  Successful: {successful_symbols}")
-        logger.info(f"  Failed: {failed_symbols}")
-        logger.info(f"  Total data points fetched: {total_data_points}")
-        logger.info(f"  Total time: {total_time:.2f} seconds")
-        logger.info(f"  Average time per symbol: {total_time/total_symbols:.2f} seconds")
-        logger.info(f"  Success rate: {successful_symbols/total_symbols*100:.1f}%")
+        self._log_batch_start(total_symbols, start_date, end_date, force_refresh)
         
-        if failed_symbols > 0:
-            logger.warning(f"  Failed symbols: {failed_symbols}")
+        existing_map: Dict[str, Set[date]] = {}
+        if not force_refresh:
+            existing_map = await asyncio.to_thread(
+                self.get_existing_data_dates_bulk, output_path, [s for s, _ in symbols]
+            )
+        
+        sem = asyncio.Semaphore(self.max_workers)
         
+        async def worker(i: int, symbol: str, exchange: str) -> int:
+            progress = f"[{i+1:3d}/{total_symbols:3d}]"
+            async with sem:
+                try:
+                    return await asyncio.to_thread(
+                        self._process_one, symbol, exchange, output_path, start_date, end_date,
+                        force_refresh, progress, existing_map.get(symbol, set())
+                    )
+                except Exception as e:
+                    logger.error("%s   ✗ Error processing %s: %s", progress, symbol, e)
+                    raise
+        
+        outcomes = await asyncio.gather(
+            *(worker(i, symbol, exchange) for i, (symbol, exchange) in enumerate(symbols)),
+            return_exceptions=True,
+        )
+        failed_symbols = 0
+        for (symbol, _), outcome in zip(symbols, outcomes):
+            if isinstance(outcome, BaseException):
+                failed_symbols += 1
+            else:
+                results[symbol] = outcome
+        
+        self._log_batch_summary(results, failed_symbols, start_time)
         return results
     
     def load_symbols_from_csv(self, symbols_csv_path: Path) -> List[Tuple[str, str]]:
@@ -390,107 +765,78 @@ class StooqDataFetcher:
                     if ticker and exchange:
                         symbols.append((ticker, exchange))
         except Exception as e:
-            logger.error(f"Error loading symbols from {symbols_csv_path}: {e}")
+            logger.error("Error loading symbols from %s: %s", symbols_csv_path, e)
         
         return symbols
     
     def get_data_summary(self, csv_path: Path) -> Dict[str, Dict]:
-        """Get summary of existing data in CSV file."""
+        """Get summary of existing data in CSV file (or Parquet directory)."""
         summary = {}
         
         if not csv_path.exists():
             return summary
         
+        if self.storage_format == "parquet":
+            return self._summarise_parquet(csv_path)
+        
         try:
-            with open(csv_path, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                
-                # Check if this is the old format (symbol, date) or new format (symbol_id, dt)
-                first_row = next(reader, None)
-                if not first_row:
-                    return summary
-                
-                # Reset file pointer
-                f.seek(0)
-                next(f)  # Skip header
-                
-                if 'symbol' in first_row and 'date' in first_row:
-                    # Old format
-                    return self._get_old_format_summary(csv_path)
-                elif 'symbol_id' in first_row and 'dt' in first_row:
-                    # New bars format
-                    return self._get_bars_format_summary(csv_path)
-                else:
-                    logger.error(f"Unknown CSV format in {csv_path}")
-                    return summary
+            columns = set(pd.read_csv(csv_path, nrows=0).columns)
+            
+            # Check if this is the old format (symbol, date) or new format (symbol_id, dt)
+            if 'symbol' in columns and 'date' in columns:
+                return self._summarise_csv(csv_path, 'symbol', 'date', with_exchange='exchange' in columns)
+            elif 'symbol_id' in columns and 'dt' in columns:
+                return self._summarise_csv(csv_path, 'symbol_id', 'dt', with_exchange=False)
+            else:
+                logger.error("Unknown CSV format in %s", csv_path)
+                return summary
                     
         except Exception as e:
-            logger.error(f"Error reading data summary from {csv_path}: {e}")
+            logger.error("Error reading data summary from %s: %s", csv_path, e)
         
         return summary
     
-    def _get_old_format_summary(self, csv_path: Path) -> Dict[str, Dict]:
-        """Get summary for old format CSV (symbol, date columns)."""
-        summary = {}
-        
-        try:
-            with open(csv_path, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    symbol = row.get('symbol')
-                    if symbol:
-                        if symbol not in summary:
-                            summary[symbol] = {
-                                'exchange': row.get('exchange', ''),
-                                'data_points': 0,
-                                'first_date': None,
-                                'last_date': None
-                            }
-                        
-                        summary[symbol]['data_points'] += 1
-                        
-                        try:
-                            date = datetime.fromisoformat(row['date'].replace('Z', '+00:00'))
-                            if summary[symbol]['first_date'] is None or date < summary[symbol]['first_date']:
-                                summary[symbol]['first_date'] = date
-                            if summary[symbol]['last_date'] is None or date > summary[symbol]['last_date']:
-                                summary[symbol]['last_date'] = date
-                        except (ValueError, KeyError):
-                            continue
-        except Exception as e:
-            logger.error(f"Error reading old format summary from {csv_path}: {e}")
-        
-        return summary
+    def _summarise_csv(self, csv_path: Path, key_col: str, date_col: str,
+                       with_exchange: bool) -> Dict[str, Dict]:
+        """Per-symbol row count and date range from one parse and a grouped aggregate."""
+        usecols = [key_col, date_col] + (['exchange'] if with_exchange else [])
+        df = _read_csv_columns(csv_path, usecols)
+        df = df[df[key_col] != '']
+        if df.empty:
+            return {}
+        
+        dates = pd.to_datetime(df[date_col], errors='coerce', utc=True, format='ISO8601')
+        exchanges = df.groupby(key_col, sort=False)['exchange'].first() if with_exchange else None
+        return self._summarise_frame(df[key_col], dates, exchanges)
     
-    def _get_bars_format_summary(self, csv_path: Path) -> Dict[str, Dict]:
-        """Get summary for new bars format CSV (symbol_id, dt columns)."""
-        summary = {}
-        
-        try:
-            with open(csv_path, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    symbol_id = row.get('symbol_id')
-                    if symbol_id:
-                        if symbol_id not in summary:
-                            summary[symbol_id] = {
-                                'exchange': '',  # Not available in bars format
-                                'data_points': 0,
-                                'first_date': None,
-                                'last_date': None
-                            }
-                        
-                        summary[symbol_id]['data_points'] += 1
-                        
-                        try:
-                            date = datetime.strptime(row['dt'], '%Y-%m-%d').replace(tzinfo=timezone.utc)
-                            if summary[symbol_id]['first_date'] is None or date < summary[symbol_id]['first_date']:
-                                summary[symbol_id]['first_date'] = date
-                            if summary[symbol_id]['last_date'] is None or date > summary[symbol_id]['last_date']:
-                                summary[symbol_id]['last_date'] = date
-                        except (ValueError, KeyError):
-                            continue
-        except Exception as e:
-            logger.error(f"Error reading bars format summary from {csv_path}: {e}")
+    def _summarise_parquet(self, output_dir: Path) -> Dict[str, Dict]:
+        """Summary over every per-symbol Parquet file, reading only key and date columns."""
+        _, pq = _parquet_modules()
+        frames = []
+        for path in sorted(output_dir.glob('*.parquet')):
+            try:
+                frames.append(pq.read_table(path, columns=['symbol_id', 'dt']).to_pandas(date_as_object=False))
+            except Exception as e:
+                logger.error("Error reading data summary from %s: %s", path, e)
+        if not frames:
+            return {}
+        df = pd.concat(frames, ignore_index=True)
+        return self._summarise_frame(df['symbol_id'], pd.to_datetime(df['dt'], utc=True), None)
+    
+    def _summarise_frame(self, keys: pd.Series, dates: pd.Series,
+                         exchanges: Optional[pd.Series]) -> Dict[str, Dict]:
+        grouped = dates.groupby(keys, sort=False)
+        counts = grouped.size()
+        first = grouped.min()
+        last = grouped.max()
         
-        return summary 
\ No newline at end of file
+        summary = {}
+        for key, n in counts.items():
+            first_ts, last_ts = first[key], last[key]
+            summary[key] = {
+                'exchange': exchanges[key] if exchanges is not None else '',
+                'data_points': int(n),
+                'first_date': None if pd.isna(first_ts) else first_ts.to_pydatetime(),
+                'last_date': None if pd.isna(last_ts) else last_ts.to_pydatetime(),
+            }
+        return summary
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import csv
-from dataclasses import dataclass
+import weakref
 from datetime import datetime, timezone
-from typing import Iterable, List, Optional, Sequence
+from typing import Iterable, List, NamedTuple, Optional, Sequence
 
 from sqlalchemy import (
     Table,
@@ -12,7 +12,10 @@ from sqlalchemy import (
     Integer,
     String as SAString,
     DateTime,
+    Index,
+    bindparam,
     create_engine,
+    event,
     select,
     insert,
 )
@@ -22,19 +25,37 @@ from sqlalchemy.engine import Engine
 SYMBOLS_TABLE_NAME = "symbols"
 
 
+_UTC = timezone.utc
+
+
 def _utc_dt(value: str | datetime) -> datetime:
     if isinstance(value, datetime):
-        dt = value
-    else:
-        # Expect ISO 8601
-        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
-    if dt.tzinfo is None:
-        return dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc)
+        if value.tzinfo is _UTC:
+            return value
+        return value.replace(tzinfo=_UTC) if value.tzinfo is None else value.astimezone(_UTC)
+    return _parse_iso_utc(value)
+
+
+def _parse_iso_utc(value: str) -> datetime:
+    if len(value) == 10:
+        # Plain YYYY-MM-DD
+        return datetime(int(value[:4]), int(value[5:7]), int(value[8:10]), tzinfo=_UTC)
+    # Expect ISO 8601; fromisoformat accepts "+00:00" but not a bare "Z" suffix before 3.11
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is _UTC:
+        return dt
+    return dt.replace(tzinfo=_UTC) if dt.tzinfo is None else dt.astimezone(_UTC)
 
 
-@dataclass(frozen=True)
-class SymbolRow:
+def _utc_dt_batch(values: Iterable[str]) -> List[datetime]:
+    """``_utc_dt`` over many ISO strings; empty strings map to ``None``."""
+    parse = _parse_iso_utc
+    return [parse(v) if v else None for v in values]
+
+
+class SymbolRow(NamedTuple):
     symbol_id: int
     ticker: str
     exchange: str
@@ -53,86 +74,158 @@ def define_symbols_table(metadata: MetaData) -> Table:
         Column("currency", SAString(8), nullable=False),
         Column("active_from", DateTime(timezone=True), nullable=False),
         Column("active_to", DateTime(timezone=True), nullable=True),
+        Index("ix_symbols_ticker_exchange", "ticker", "exchange"),
         sqlite_autoincrement=False,
     )
 
 
+# Table and statements are built once per process; SQLAlchemy then reuses the
+# compiled form of each statement across calls.
+_METADATA = MetaData()
+SYMBOLS_TABLE = define_symbols_table(_METADATA)
+
+_ASOF = bindparam("asof", type_=DateTime(timezone=True))
+
+# active_from <= asof < active_to (if active_to not null) else active_to is open-ended
+_ASOF_STMT = (
+    select(
+        SYMBOLS_TABLE.c.symbol_id,
+        SYMBOLS_TABLE.c.ticker,
+        SYMBOLS_TABLE.c.exchange,
+        SYMBOLS_TABLE.c.currency,
+        SYMBOLS_TABLE.c.active_from,
+        SYMBOLS_TABLE.c.active_to,
+    )
+    .where(SYMBOLS_TABLE.c.active_from <= _ASOF)
+    .where((SYMBOLS_TABLE.c.active_to.is_(None)) | (SYMBOLS_TABLE.c.active_to > _ASOF))
+    .order_by(SYMBOLS_TABLE.c.symbol_id.asc())
+)
+
+_SYMBOL_ID_ASOF_STMT = (
+    select(SYMBOLS_TABLE.c.symbol_id)
+    .where(SYMBOLS_TABLE.c.ticker == bindparam("ticker"))
+    .where(SYMBOLS_TABLE.c.exchange == bindparam("exchange"))
+    .where(SYMBOLS_TABLE.c.active_from <= _ASOF)
+    .where((SYMBOLS_TABLE.c.active_to.is_(None)) | (SYMBOLS_TABLE.c.active_to > _ASOF))
+    .order_by(SYMBOLS_TABLE.c.symbol_id.asc())
+    .limit(1)
+)
+
+_SCHEMA_READY: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+
 def ensure_schema(engine: Engine) -> None:
-    metadata = MetaData()
-    define_symbols_table(metadata)
-    metadata.create_all(engine)
+    if engine in _SCHEMA_READY:
+        return
+    _METADATA.create_all(engine, checkfirst=True)
+    # create_all skips indexes of tables that already exist
+    for index in SYMBOLS_TABLE.indexes:
+        index.create(engine, checkfirst=True)
+    _SCHEMA_READY.add(engine)
+
+
+LOAD_BATCH_SIZE = 10_000
 
 
 def load_symbols_csv_to_db(csv_path: str, engine: Engine) -> int:
     ensure_schema(engine)
-    metadata = MetaData()
-    table = define_symbols_table(metadata)
-
-    rows: List[dict] = []
+    stmt = insert(SYMBOLS_TABLE)
+
+    def _rows(raw: List[dict]) -> List[dict]:
+        # Timestamps are parsed column-wise per batch
+        froms = _utc_dt_batch([r["active_from"] for r in raw])
+        tos = _utc_dt_batch([r["active_to"] for r in raw])
+        return [
+            {
+                "symbol_id": int(r["symbol_id"]),
+                "ticker": r["ticker"],
+                "exchange": r["exchange"],
+                "currency": r["currency"],
+                "active_from": active_from,
+                "active_to": active_to,
+            }
+            for r, active_from, active_to in zip(raw, froms, tos)
+        ]
+
+    count = 0
+    batch: List[dict] = []
     with open(csv_path, newline="") as f:
         reader = csv.DictReader(f)
         required = {"symbol_id", "ticker", "exchange", "currency", "active_from", "active_to"}
         missing = required - set(reader.fieldnames or [])
         if missing:
             raise ValueError(f"CSV missing required columns: {missing}")
-        for r in reader:
-            rows.append(
-                {
-                    "symbol_id": int(r["symbol_id"]),
-                    "ticker": r["ticker"],
-                    "exchange": r["exchange"],
-                    "currency": r["currency"],
-                    "active_from": _utc_dt(r["active_from"]),
-                    "active_to": None if not r["active_to"] else _utc_dt(r["active_to"]),
-                }
-            )
-
-    with engine.begin() as conn:
-        if rows:
-            conn.execute(insert(table), rows)
-    return len(rows)
+        # WAL/synchronous for the bulk load come from tune_sqlite_engine
+        with engine.begin() as conn:
+            for r in reader:
+                batch.append(r)
+                if len(batch) >= LOAD_BATCH_SIZE:
+                    conn.execute(stmt, _rows(batch))
+                    count += len(batch)
+                    batch.clear()
+            if batch:
+                conn.execute(stmt, _rows(batch))
+                count += len(batch)
+    return count
 
 
 def get_symbols_asof(engine: Engine, asof: datetime) -> List[SymbolRow]:
     ensure_schema(engine)
     asof_utc = _utc_dt(asof)
 
-    metadata = MetaData()
-    table = define_symbols_table(metadata)
-
-    # active_from <= asof < active_to (if active_to not null) else active_to is open-ended
-    stmt = (
-        select(
-            table.c.symbol_id,
-            table.c.ticker,
-            table.c.exchange,
-            table.c.currency,
-            table.c.active_from,
-            table.c.active_to,
-        )
-        .where(table.c.active_from <= asof_utc)
-        .where((table.c.active_to.is_(None)) | (table.c.active_to > asof_utc))
-        .order_by(table.c.symbol_id.asc())
-    )
-
     with engine.begin() as conn:
-        result = conn.execute(stmt)
+        result = conn.execute(_ASOF_STMT, {"asof": asof_utc})
         rows = result.fetchall()
 
+    # Values are written in UTC; SQLite hands them back naive, other drivers aware.
+    utc = timezone.utc
+    make = SymbolRow._make
     out: List[SymbolRow] = []
     for r in rows:
-        out.append(
-            SymbolRow(
-                symbol_id=int(r.symbol_id),
-                ticker=str(r.ticker),
-                exchange=str(r.exchange),
-                currency=str(r.currency),
-                active_from=_utc_dt(r.active_from),
-                active_to=None if r.active_to is None else _utc_dt(r.active_to),
-            )
-        )
+        active_from = r.active_from
+        if active_from.tzinfo is None:
+            active_from = active_from.replace(tzinfo=utc)
+        active_to = r.active_to
+        if active_to is not None and active_to.tzinfo is None:
+            active_to = active_to.replace(tzinfo=utc)
+        out.append(make((int(r.symbol_id), r.ticker, r.exchange, r.currency, active_from, active_to)))
     return out
 
 
+def get_symbol_id_asof(engine: Engine, ticker: str, exchange: str, asof: datetime) -> Optional[int]:
+    """Return the symbol_id active for ``(ticker, exchange)`` at ``asof``, if any.
+
+    Single indexed probe, cheap enough to run once per symbol.
+    """
+    ensure_schema(engine)
+    params = {"ticker": ticker, "exchange": exchange, "asof": _utc_dt(asof)}
+    with engine.connect() as conn:
+        row = conn.execute(_SYMBOL_ID_ASOF_STMT, params).first()
+    return None if row is None else int(row.symbol_id)
+
+
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _tune_sqlite(dbapi_conn, _connection_record) -> None:
+    cur = dbapi_conn.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cur.execute(pragma)
+    cur.close()
+
+
+def tune_sqlite_engine(engine: Engine) -> Engine:
+    """Apply WAL/mmap/cache PRAGMAs to every new connection of a file-backed SQLite engine."""
+    if engine.dialect.name == "sqlite" and engine.url.database not in (None, "", ":memory:"):
+        event.listen(engine, "connect", _tune_sqlite)
+    return engine
+
+
 def create_sqlite_engine(path: str = ":memory:") -> Engine:
-    return create_engine(f"sqlite+pysqlite:///{path}", future=True)
\ No newline at end of file
+    return tune_sqlite_engine(create_engine(f"sqlite+pysqlite:///{path}", future=True))
\ No newline at end of file
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import csv
+import functools
+import io
+import weakref
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
+import pandas as pd
 from sqlalchemy import (
 	Table,
 	Column,
@@ -12,12 +18,16 @@ from sqlalchemy import (
 	String as SAString,
 	Float,
 	DateTime,
+	bindparam,
 	insert,
 	select,
 	and_,
+	create_engine,
 )
 from sqlalchemy.engine import Engine
 
+from ..data.symbols_repository import tune_sqlite_engine
+
 
 RATIOS_TABLE = "fundamentals_ratios"
 INCOME_TABLE = "fundamentals_income"
@@ -27,6 +37,8 @@ CASHFLOW_TABLE = "fundamentals_cashflow"
 
 def _utc_dt(value: str | datetime) -> datetime:
 	if isinstance(value, datetime):
+		if value.tzinfo is timezone.utc:
+			return value
 		dt = value
 	else:
 		dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
@@ -57,6 +69,47 @@ class StatementSnapshot:
 	fields: Dict[str, Optional[float]]
 
 
+# Typed statement snapshots: fixed slot fields instead of a per-row dict
+
+@dataclass(frozen=True, slots=True)
+class IncomeSnapshot:
+	symbol_id: int
+	period_end: datetime
+	asof: datetime
+	currency: Optional[str]
+	revenue: Optional[float] = None
+	ebitda: Optional[float] = None
+	net_income: Optional[float] = None
+	interest_expense: Optional[float] = None
+
+
+@dataclass(frozen=True, slots=True)
+class BalanceSnapshot:
+	symbol_id: int
+	period_end: datetime
+	asof: datetime
+	currency: Optional[str]
+	total_assets: Optional[float] = None
+	total_liabilities: Optional[float] = None
+	total_equity: Optional[float] = None
+	net_debt: Optional[float] = None
+
+
+@dataclass(frozen=True, slots=True)
+class CashflowSnapshot:
+	symbol_id: int
+	period_end: datetime
+	asof: datetime
+	currency: Optional[str]
+	operating_cf: Optional[float] = None
+	investing_cf: Optional[float] = None
+	financing_cf: Optional[float] = None
+	free_cash_flow: Optional[float] = None
+
+
+TypedStatementSnapshot = Union[IncomeSnapshot, BalanceSnapshot, CashflowSnapshot]
+
+
 # --- Table definitions ---
 
 def define_ratios_table(metadata: MetaData) -> Table:
@@ -120,24 +173,128 @@ def define_cashflow_table(metadata: MetaData) -> Table:
 	)
 
 
+# Tables are defined once per process and shared by every reader/writer.
+_METADATA = MetaData()
+_RATIOS_TBL = define_ratios_table(_METADATA)
+_STATEMENT_TABLES: Dict[str, Table] = {
+	INCOME_TABLE: define_income_table(_METADATA),
+	BALANCE_TABLE: define_balance_table(_METADATA),
+	CASHFLOW_TABLE: define_cashflow_table(_METADATA),
+}
+
+_SCHEMA_READY: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+# Rows per INSERT executemany call; keeps statements well under backend
+# parameter limits while still amortising round-trips.
+WRITE_BATCH_SIZE = 500
+
+# Rows per Parquet row group for the bulk ratios file
+PARQUET_ROW_GROUP_SIZE = 64_000
+
+
+def create_sqlite_engine(path: str = ":memory:") -> Engine:
+	"""SQLite engine for fundamentals: pooled connections, each tuned for WAL and a large page cache."""
+	kwargs: Dict[str, int] = {"insertmanyvalues_page_size": 1000}
+	if path != ":memory:":
+		kwargs.update(pool_size=8, max_overflow=4)
+	engine = create_engine(f"sqlite+pysqlite:///{path}", future=True, **kwargs)
+	return tune_sqlite_engine(engine)
+
+
 def ensure_schema(engine: Engine) -> None:
-	metadata = MetaData()
-	define_ratios_table(metadata)
-	define_income_table(metadata)
-	define_balance_table(metadata)
-	define_cashflow_table(metadata)
-	metadata.create_all(engine)
+	if engine in _SCHEMA_READY:
+		return
+	_METADATA.create_all(engine)
+	_SCHEMA_READY.add(engine)
+
+
+def _insert_batched(engine: Engine, table: Table, payload: List[dict]) -> None:
+	if not payload:
+		return
+	stmt = insert(table)
+	with engine.begin() as conn:
+		for i in range(0, len(payload), WRITE_BATCH_SIZE):
+			conn.execute(stmt, payload[i:i + WRITE_BATCH_SIZE])
+
+
+def _bulk_insert(engine: Engine, table: Table, payload: List[dict]) -> None:
+	"""Native bulk load for rows that all carry the same keys.
+
+	PostgreSQL (psycopg2) streams CSV through ``COPY ... FROM STDIN``; SQLite runs one
+	positional ``executemany`` on the raw DBAPI connection. Values go through each
+	column's bind processor first so storage matches the SQLAlchemy path exactly.
+	Other backends use ``_insert_batched``.
+	"""
+	if not payload:
+		return
+	dialect = engine.dialect
+	if dialect.name not in ("sqlite", "postgresql"):
+		_insert_batched(engine, table, payload)
+		return
+
+	columns = list(payload[0].keys())
+	processors = [table.c[name].type.dialect_impl(dialect).bind_processor(dialect) for name in columns]
+	rows = [
+		tuple(v if proc is None or v is None else proc(v) for v, proc in zip(values, processors))
+		for values in (tuple(r[name] for name in columns) for r in payload)
+	]
+	column_list = ", ".join(columns)
+
+	raw = engine.raw_connection()
+	try:
+		cur = raw.cursor()
+		if dialect.name == "postgresql":
+			if not hasattr(cur, "copy_expert"):
+				cur.close()
+				raw.close()
+				raw = None
+				_insert_batched(engine, table, payload)
+				return
+			buf = io.StringIO()
+			csv.writer(buf).writerows(rows)
+			buf.seek(0)
+			cur.copy_expert(f"COPY {table.name} ({column_list}) FROM STDIN WITH (FORMAT csv)", buf)
+		else:
+			placeholders = ", ".join("?" for _ in columns)
+			cur.executemany(f"INSERT INTO {table.name} ({column_list}) VALUES ({placeholders})", rows)
+		cur.close()
+		raw.commit()
+	except Exception:
+		if raw is not None:
+			raw.rollback()
+		raise
+	finally:
+		if raw is not None:
+			raw.close()
 
 
 # --- Writers with PIT guards ---
 
-def upsert_ratios_snapshots(engine: Engine, rows: List[RatioSnapshot]) -> int:
+def _ratios_payload_from_frame(df: pd.DataFrame) -> List[dict]:
+	# One vectorised timestamp conversion instead of _utc_dt per row
+	frame = df.reindex(columns=_RATIO_COLUMNS)
+	frame["asof"] = pd.Series(
+		pd.DatetimeIndex(pd.to_datetime(df["asof"], utc=True)).to_pydatetime(), index=df.index, dtype=object
+	)
+	frame = frame.astype(object).where(frame.notna(), None)
+	payload = frame.to_dict("records")
+	for row in payload:
+		row["symbol_id"] = int(row["symbol_id"])
+	return payload
+
+
+def upsert_ratios_snapshots(engine: Engine, rows: List[RatioSnapshot] | pd.DataFrame) -> int:
 	"""Insert ratio snapshots. Enforces timezone and ordering semantics minimally.
 	- asof must be timezone-aware
+	- ``rows`` may also be a DataFrame with ``symbol_id``, ``asof`` and any ratio columns
 	"""
 	ensure_schema(engine)
-	metadata = MetaData()
-	table = define_ratios_table(metadata)
+
+	if isinstance(rows, pd.DataFrame):
+		payload = _ratios_payload_from_frame(rows)
+		_bulk_insert(engine, _RATIOS_TBL, payload)
+		invalidate_ratios_cache(engine)
+		return len(payload)
 
 	payload: List[dict] = []
 	for r in rows:
@@ -154,24 +311,30 @@ def upsert_ratios_snapshots(engine: Engine, rows: List[RatioSnapshot]) -> int:
 			"interest_coverage": r.interest_coverage,
 		})
 
-	with engine.begin() as conn:
-		if payload:
-			conn.execute(insert(table), payload)
+	_bulk_insert(engine, _RATIOS_TBL, payload)
+	invalidate_ratios_cache(engine)
 	return len(payload)
 
 
-def write_statement_snapshots(engine: Engine, table_name: str, rows: List[StatementSnapshot]) -> int:
-	"""Write statement snapshots to the specified table, enforcing asof >= period_end."""
-	ensure_schema(engine)
-	metadata = MetaData()
-	if table_name == INCOME_TABLE:
-		table = define_income_table(metadata)
-	elif table_name == BALANCE_TABLE:
-		table = define_balance_table(metadata)
-	elif table_name == CASHFLOW_TABLE:
-		table = define_cashflow_table(metadata)
-	else:
+# Typed snapshot class -> (table name, value column names)
+_TYPED_STATEMENTS: Dict[type, Tuple[str, Tuple[str, ...]]] = {
+	IncomeSnapshot: (INCOME_TABLE, ("revenue", "ebitda", "net_income", "interest_expense")),
+	BalanceSnapshot: (BALANCE_TABLE, ("total_assets", "total_liabilities", "total_equity", "net_debt")),
+	CashflowSnapshot: (CASHFLOW_TABLE, ("operating_cf", "investing_cf", "financing_cf", "free_cash_flow")),
+}
+
+
+def write_statement_snapshots(
+	engine: Engine, table_name: str, rows: Sequence[StatementSnapshot | TypedStatementSnapshot]
+) -> int:
+	"""Write statement snapshots to the specified table, enforcing asof >= period_end.
+
+	Rows may be generic ``StatementSnapshot``s or the typed snapshot matching ``table_name``.
+	"""
+	table = _STATEMENT_TABLES.get(table_name)
+	if table is None:
 		raise ValueError("Unknown table name for statement snapshots")
+	ensure_schema(engine)
 
 	payload: List[dict] = []
 	for r in rows:
@@ -179,6 +342,21 @@ def write_statement_snapshots(engine: Engine, table_name: str, rows: List[Statem
 		asof = _utc_dt(r.asof)
 		if asof < period_end:
 			raise ValueError("asof must be on or after period_end for statement snapshots")
+		typed = _TYPED_STATEMENTS.get(type(r))
+		if typed is not None:
+			typed_table, columns = typed
+			if typed_table != table_name:
+				raise ValueError(f"{type(r).__name__} cannot be written to {table_name}")
+			row = {
+				"symbol_id": int(r.symbol_id),
+				"period_end": period_end,
+				"asof": asof,
+				"currency": r.currency,
+			}
+			for col in columns:
+				row[col] = getattr(r, col)
+			payload.append(row)
+			continue
 		row: Dict[str, Optional[float] | int | datetime | str] = {
 			"symbol_id": int(r.symbol_id),
 			"period_end": period_end,
@@ -190,38 +368,74 @@ def write_statement_snapshots(engine: Engine, table_name: str, rows: List[Statem
 			row[k] = v
 		payload.append(row)
 
-	with engine.begin() as conn:
-		if payload:
-			conn.execute(insert(table), payload)
+	_insert_batched(engine, table, payload)
 	return len(payload)
 
 
 # --- Readers with PIT guards ---
 
+_GET_RATIOS_STMT = (
+	select(
+		_RATIOS_TBL.c.symbol_id,
+		_RATIOS_TBL.c.asof,
+		_RATIOS_TBL.c.currency,
+		_RATIOS_TBL.c.pe,
+		_RATIOS_TBL.c.ev_ebitda,
+		_RATIOS_TBL.c.fcf_yield,
+		_RATIOS_TBL.c.debt_ebitda,
+		_RATIOS_TBL.c.roic,
+		_RATIOS_TBL.c.interest_coverage,
+	)
+	.where(_RATIOS_TBL.c.symbol_id == bindparam("sid"))
+	.where(_RATIOS_TBL.c.asof <= bindparam("asof", type_=DateTime(timezone=True)))
+	.order_by(_RATIOS_TBL.c.asof.desc())
+	.limit(1)
+)
+
+
+# Max cached (symbol_id, asof) ratio lookups per engine
+RATIOS_CACHE_SIZE = 200_000
+
+# Per-engine LRU of ratio lookups; weakly keyed so a dropped engine (and its pool) is not kept alive
+_RATIOS_CACHE: "weakref.WeakKeyDictionary[Engine, Callable[[int, datetime], RatioSnapshot]]" = weakref.WeakKeyDictionary()
+
+
+def invalidate_ratios_cache(engine: Optional[Engine] = None) -> None:
+	"""Drop cached ratio lookups for ``engine`` (every engine when None).
+
+	The ratio writers in this module call this after every insert. Rows written by
+	another process or by raw SQL are not seen until the cache is invalidated.
+	"""
+	if engine is None:
+		_RATIOS_CACHE.clear()
+	else:
+		_RATIOS_CACHE.pop(engine, None)
+
+
+def _ratios_lookup(engine: Engine) -> Callable[[int, datetime], RatioSnapshot]:
+	lookup = _RATIOS_CACHE.get(engine)
+	if lookup is None:
+		# The cached function holds only a weak reference; the caller keeps the engine alive
+		engine_ref = weakref.ref(engine)
+
+		@functools.lru_cache(maxsize=RATIOS_CACHE_SIZE)
+		def lookup(symbol_id: int, asof_utc: datetime) -> RatioSnapshot:
+			return _fetch_ratios_asof(engine_ref(), symbol_id, asof_utc)
+
+		_RATIOS_CACHE[engine] = lookup
+	return lookup
+
+
 def get_ratios_asof(engine: Engine, symbol_id: int, asof: datetime) -> RatioSnapshot:
+	# Keyed on the exact UTC asof rather than its day so an intraday cut never
+	# sees a snapshot published later that same day.
+	return _ratios_lookup(engine)(int(symbol_id), _utc_dt(asof))
+
+
+def _fetch_ratios_asof(engine: Engine, symbol_id: int, asof_utc: datetime) -> RatioSnapshot:
 	ensure_schema(engine)
-	metadata = MetaData()
-	table = define_ratios_table(metadata)
-	asof_utc = _utc_dt(asof)
-	stmt = (
-		select(
-			table.c.symbol_id,
-			table.c.asof,
-			table.c.currency,
-			table.c.pe,
-			table.c.ev_ebitda,
-			table.c.fcf_yield,
-			table.c.debt_ebitda,
-			table.c.roic,
-			table.c.interest_coverage,
-		)
-		.where(table.c.symbol_id == int(symbol_id))
-		.where(table.c.asof <= asof_utc)
-		.order_by(table.c.asof.desc())
-		.limit(1)
-	)
-	with engine.begin() as conn:
-		row = conn.execute(stmt).fetchone()
+	with engine.connect() as conn:
+		row = conn.execute(_GET_RATIOS_STMT, {"sid": symbol_id, "asof": asof_utc}).fetchone()
 	if row is None:
 		raise LookupError(f"No ratios snapshot for symbol {symbol_id} as of {asof_utc.isoformat()}")
 	return RatioSnapshot(
@@ -240,4 +454,103 @@ def get_ratios_asof(engine: Engine, symbol_id: int, asof: datetime) -> RatioSnap
 def _opt_float(v: Optional[float]) -> Optional[float]:
 	if v is None:
 		return None
-	return float(v)
\ No newline at end of file
+	return float(v)
+
+
+# --- Parquet bulk storage for ratios ---
+
+_RATIO_COLUMNS = [
+	"symbol_id",
+	"asof",
+	"currency",
+	"pe",
+	"ev_ebitda",
+	"fcf_yield",
+	"debt_ebitda",
+	"roic",
+	"interest_coverage",
+]
+
+
+def _parquet_modules():
+	# Optional: requires pyarrow at runtime
+	try:
+		import pyarrow as pa  # type: ignore
+		import pyarrow.parquet as pq  # type: ignore
+	except Exception as exc:
+		raise ImportError("pyarrow required for parquet ratios storage") from exc
+	return pa, pq
+
+
+def _ratios_arrow_schema(pa):
+	return pa.schema([
+		("symbol_id", pa.int64()),
+		("asof", pa.timestamp("us", tz="UTC")),
+		("currency", pa.string()),
+		("pe", pa.float64()),
+		("ev_ebitda", pa.float64()),
+		("fcf_yield", pa.float64()),
+		("debt_ebitda", pa.float64()),
+		("roic", pa.float64()),
+		("interest_coverage", pa.float64()),
+	])
+
+
+def write_ratios_parquet(path: str | Path, rows: List[RatioSnapshot]) -> int:
+	"""Merge ratio snapshots into a Parquet file sorted by (symbol_id, asof).
+
+	Sorting keeps each row group to a narrow symbol_id/asof range, so
+	``load_ratios_parquet`` filters can skip most of the file.
+	"""
+	pa, pq = _parquet_modules()
+	schema = _ratios_arrow_schema(pa)
+	columns: Dict[str, list] = {name: [] for name in _RATIO_COLUMNS}
+	for r in rows:
+		columns["symbol_id"].append(int(r.symbol_id))
+		columns["asof"].append(_utc_dt(r.asof))
+		columns["currency"].append(r.currency)
+		for name in _RATIO_COLUMNS[3:]:
+			columns[name].append(getattr(r, name))
+	table = pa.table(columns, schema=schema)
+
+	target = Path(path)
+	if target.exists():
+		table = pa.concat_tables([pq.read_table(target, schema=schema), table])
+	table = table.sort_by([("symbol_id", "ascending"), ("asof", "ascending")])
+	target.parent.mkdir(parents=True, exist_ok=True)
+	pq.write_table(table, target, compression="zstd", row_group_size=PARQUET_ROW_GROUP_SIZE)
+	return len(rows)
+
+
+def load_ratios_parquet(
+	path: str | Path, asof: datetime, symbol_ids: Optional[Iterable[int]] = None
+) -> Dict[int, RatioSnapshot]:
+	"""Latest ratio snapshot with ``asof <= asof`` for every symbol, in one bulk read.
+
+	Bulk counterpart of ``get_ratios_asof``; symbols without a snapshot are absent.
+	"""
+	_, pq = _parquet_modules()
+	asof_utc = _utc_dt(asof)
+	filters: List[tuple] = [("asof", "<=", asof_utc)]
+	if symbol_ids is not None:
+		filters.append(("symbol_id", "in", [int(s) for s in symbol_ids]))
+	table = pq.read_table(path, columns=_RATIO_COLUMNS, filters=filters)
+	if table.num_rows == 0:
+		return {}
+	# After sorting by (symbol_id, asof) the last row per symbol is the PIT snapshot
+	table = table.sort_by([("symbol_id", "ascending"), ("asof", "ascending")])
+	data = table.to_pydict()
+	out: Dict[int, RatioSnapshot] = {}
+	for i, sid in enumerate(data["symbol_id"]):
+		out[int(sid)] = RatioSnapshot(
+			symbol_id=int(sid),
+			asof=_utc_dt(data["asof"][i]),
+			currency=data["currency"][i],
+			pe=_opt_float(data["pe"][i]),
+			ev_ebitda=_opt_float(data["ev_ebitda"][i]),
+			fcf_yield=_opt_float(data["fcf_yield"][i]),
+			debt_ebitda=_opt_float(data["debt_ebitda"][i]),
+			roic=_opt_float(data["roic"][i]),
+			interest_coverage=_opt_float(data["interest_coverage"][i]),
+		)
+	return out
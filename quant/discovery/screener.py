@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import csv
+import heapq
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -31,6 +32,20 @@ class UniverseFilters:
 	min_addv: Optional[float] = None  # average daily dollar volume
 	addv_window_days: int = 20
 
+	def __post_init__(self) -> None:
+		# O(1) membership in filter_universe; empty sequences mean "no filter"
+		object.__setattr__(self, "exchanges", _code_set(self.exchanges))
+		object.__setattr__(self, "regions", _code_set(self.regions))
+
+
+def _code_set(values: Optional[Sequence[str]]) -> Optional[frozenset[str]]:
+	if not values:
+		return None
+	# A bare code like "XNAS" is one code, not a sequence of characters
+	if isinstance(values, str):
+		return frozenset((values,))
+	return frozenset(values)
+
 
 @dataclass(frozen=True)
 class Candidate:
@@ -49,31 +64,19 @@ def _utc(ts: datetime) -> datetime:
 
 def compute_addv(store: BarsStore, symbol_id: int, asof: datetime, window_days: int) -> float:
 	asof_u = _utc(asof)
-	# Use last N bars up to asof
-	bars = store.get_between(symbol_id, None, asof_u)
-	if not bars:
-		return 0.0
-	# Select last window_days entries
-	recent = bars[-window_days:]
-	if not recent:
-		return 0.0
-	# Dollar volume = close * volume
-	dvs = [float(b.close) * float(b.volume) for b in recent]
-	return sum(dvs) / len(dvs)
+	return store.addv_batch([symbol_id], asof_u, window_days)[symbol_id]
 
 
 def filter_universe(symbols: Iterable[SymbolRow], filters: UniverseFilters) -> List[SymbolRow]:
-	out: List[SymbolRow] = []
-	for s in symbols:
-		if filters.exchanges and s.exchange not in filters.exchanges:
-			continue
-		if filters.regions:
-			region = EXCHANGE_TO_REGION.get(s.exchange, "US")
-			if region not in filters.regions:
-				continue
-		# Market cap unavailable in current dataset; skip unless None
-		out.append(s)
-	return out
+	exchanges = filters.exchanges
+	regions = filters.regions
+	region_of = EXCHANGE_TO_REGION.get
+	# Market cap unavailable in current dataset; skip unless None
+	return [
+		s for s in symbols
+		if (exchanges is None or s.exchange in exchanges)
+		and (regions is None or region_of(s.exchange, "US") in regions)
+	]
 
 
 def rank_candidates(
@@ -91,12 +94,15 @@ def rank_candidates(
 	# Build sector stats
 	points = [ratio_points[s.symbol_id] for s in symbols if s.symbol_id in ratio_points]
 	sector_stats = compute_sector_stats(points, list(metric_weights.keys()))
-	# Compute ADDV if required
+	# ADDV for every ranked symbol in one batch
+	addv_map = store.addv_batch(
+		[s.symbol_id for s in symbols if s.symbol_id in ratio_points], asof_u, filters.addv_window_days
+	)
 	eligible: List[Tuple[SymbolRow, Dict[str, float]]] = []
 	for s in symbols:
 		if s.symbol_id not in ratio_points:
 			continue
-		addv = compute_addv(store, s.symbol_id, asof_u, filters.addv_window_days)
+		addv = addv_map[s.symbol_id]
 		if filters.min_addv is not None and addv < float(filters.min_addv):
 			continue
 		# Percentiles within sector
@@ -109,16 +115,18 @@ def rank_candidates(
 			score += w * pct
 		eligible.append((s, {"score": score, "addv": addv, **{f"pct_{m}": float(pcts.get(m, 0.0)) for m in metric_weights}}))
 	# Rank and take top_k
-	ranked = sorted(eligible, key=lambda x: x[1]["score"], reverse=True)[: top_k]
+	# nlargest matches sorted(..., reverse=True)[:top_k], ties included, in O(N log K)
+	ranked = heapq.nlargest(top_k, eligible, key=lambda x: x[1]["score"])
 	return [Candidate(symbol_id=s.symbol_id, ticker=s.ticker, exchange=s.exchange, score=det["score"], details=det) for s, det in ranked]
 
 
 def write_candidates_csv(out_path: Path | str, candidates: List[Candidate]) -> str:
 	path = Path(out_path)
 	path.parent.mkdir(parents=True, exist_ok=True)
-	with path.open("w", newline="") as f:
+	with path.open("w", newline="", buffering=1 << 20) as f:
 		writer = csv.writer(f)
 		writer.writerow(["rank", "symbol_id", "ticker", "exchange", "score"])
-		for i, c in enumerate(candidates, start=1):
-			writer.writerow([i, c.symbol_id, c.ticker, c.exchange, f"{c.score:.6f}"])
+		writer.writerows(
+			[i, c.symbol_id, c.ticker, c.exchange, f"{c.score:.6f}"] for i, c in enumerate(candidates, start=1)
+		)
 	return str(path)
\ No newline at end of file
@@ -1,7 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:  # Optional: JIT-compiled ranking kernel when numba is installed
+	from numba import njit, prange  # type: ignore
+except ImportError:  # pragma: no cover - exercised only without numba
+	njit = None
+	prange = range
 
 
 @dataclass(frozen=True)
@@ -18,15 +26,74 @@ class SectorStats:
 	percentiles: Dict[int, Dict[str, float]]  # symbol_id -> metric -> pct in [0,1]
 
 
-def _median(values: List[float]) -> float:
-	sorted_vals = sorted(values)
-	n = len(sorted_vals)
+def _median(values: Sequence[float]) -> float:
+	arr = np.asarray(values, dtype=np.float64)
+	n = arr.size
 	if n == 0:
 		return float("nan")
 	mid = n // 2
+	# Partial partition (quickselect) instead of a full sort
 	if n % 2 == 1:
-		return float(sorted_vals[mid])
-	return float((sorted_vals[mid - 1] + sorted_vals[mid]) / 2.0)
+		return float(np.partition(arr, mid)[mid])
+	part = np.partition(arr, [mid - 1, mid])
+	return float((part[mid - 1] + part[mid]) / 2.0)
+
+
+def _sector_ranks_kernel(values: np.ndarray, offsets: np.ndarray, pcts: np.ndarray, medians: np.ndarray) -> None:
+	"""Fill percentiles and medians for sector blocks ``values[offsets[k]:offsets[k+1]]``.
+
+	Written against plain NumPy so it runs as-is in Python and compiles under numba.
+	``pcts`` and ``medians`` must be pre-filled with NaN.
+	"""
+	n_metrics = values.shape[1]
+	for k in prange(offsets.shape[0] - 1):
+		lo = offsets[k]
+		hi = offsets[k + 1]
+		for j in range(n_metrics):
+			col = values[lo:hi, j]
+			rows = np.nonzero(~np.isnan(col))[0]
+			n = rows.shape[0]
+			if n == 0:
+				continue
+			v = col[rows]
+			medians[k, j] = np.median(v)
+			if n == 1:
+				pcts[lo + rows[0], j] = 1.0
+				continue
+			# Stable sort so ties keep input order
+			order = np.argsort(v, kind="mergesort")
+			for rank in range(n):
+				pcts[lo + rows[order[rank]], j] = rank / (n - 1)
+
+
+_sector_ranks_jit = njit(cache=True, parallel=True)(_sector_ranks_kernel) if njit is not None else None
+
+
+def _sector_stats_from_kernel(points: List[RatioPoint], metrics: List[str], kernel) -> Dict[str, SectorStats]:
+	# Sector codes in first-seen order; a stable sort makes each sector a contiguous block
+	codes: Dict[str, int] = {}
+	sector_of = np.fromiter((codes.setdefault(p.sector, len(codes)) for p in points), dtype=np.int64, count=len(points))
+	perm = np.argsort(sector_of, kind="stable")
+	ordered = [points[i] for i in perm.tolist()]
+	offsets = np.searchsorted(sector_of[perm], np.arange(len(codes) + 1)).astype(np.int64)
+	values = np.array(
+		[[np.nan if p.metrics.get(m) is None else float(p.metrics[m]) for m in metrics] for p in ordered],
+		dtype=np.float64,
+	).reshape(len(ordered), len(metrics))
+	pcts = np.full(values.shape, np.nan)
+	medians = np.full((len(codes), len(metrics)), np.nan)
+	kernel(values, offsets, pcts, medians)
+
+	stats: Dict[str, SectorStats] = {}
+	for sector, k in codes.items():
+		lo, hi = int(offsets[k]), int(offsets[k + 1])
+		block = pcts[lo:hi].tolist()
+		meds = {m: float(medians[k, j]) for j, m in enumerate(metrics) if not np.isnan(medians[k, j])}
+		sector_pcts: Dict[int, Dict[str, float]] = {}
+		for p, row in zip(ordered[lo:hi], block):
+			sector_pcts[p.symbol_id] = {m: row[j] for j, m in enumerate(metrics) if m in meds and row[j] == row[j]}
+		stats[sector] = SectorStats(sector=sector, medians=meds, percentiles=sector_pcts)
+	return stats
 
 
 def compute_sector_stats(points: List[RatioPoint], metrics: List[str]) -> Dict[str, SectorStats]:
@@ -34,6 +101,12 @@ def compute_sector_stats(points: List[RatioPoint], metrics: List[str]) -> Dict[s
 	Percentile defined as rank/ (N-1) for ascending order for metrics where higher is better by default
 	Assumes higher is better for all provided metrics; reverse before calling if needed.
 	"""
+	if _sector_ranks_jit is not None and points:
+		return _sector_stats_from_kernel(points, metrics, _sector_ranks_jit)
+	return _sector_stats_numpy(points, metrics)
+
+
+def _sector_stats_numpy(points: List[RatioPoint], metrics: List[str]) -> Dict[str, SectorStats]:
 	# Group by sector
 	by_sector: Dict[str, List[RatioPoint]] = {}
 	for p in points:
@@ -41,24 +114,31 @@ def compute_sector_stats(points: List[RatioPoint], metrics: List[str]) -> Dict[s
 
 	stats: Dict[str, SectorStats] = {}
 	for sector, lst in by_sector.items():
+		sym_ids = np.fromiter((p.symbol_id for p in lst), dtype=np.int64, count=len(lst))
+		# One [n_symbols x n_metrics] block per sector, NaN where a metric is missing
+		values = np.array(
+			[[np.nan if p.metrics.get(m) is None else float(p.metrics[m]) for m in metrics] for p in lst],
+			dtype=np.float64,
+		).reshape(len(lst), len(metrics))
 		meds: Dict[str, float] = {}
-		pcts: Dict[int, Dict[str, float]] = {p.symbol_id: {} for p in lst}
-		for m in metrics:
-			vals: List[Tuple[int, float]] = []
-			for p in lst:
-				v = p.metrics.get(m)
-				if v is not None:
-					vals.append((p.symbol_id, float(v)))
-			if not vals:
+		pcts: Dict[int, Dict[str, float]] = {sid: {} for sid in sym_ids.tolist()}
+		for j, m in enumerate(metrics):
+			col = values[:, j]
+			mask = ~np.isnan(col)
+			v = col[mask]
+			n = v.size
+			if n == 0:
 				continue
-			meds[m] = _median([v for _, v in vals])
-			# Percentiles: rank order ascending
-			vals_sorted = sorted(vals, key=lambda x: x[1])
-			n = len(vals_sorted)
+			meds[m] = _median(v)
 			if n == 1:
-				pcts[vals_sorted[0][0]][m] = 1.0
+				ranked = np.ones(1)
 			else:
-				for rank, (sid, _) in enumerate(vals_sorted):
-					pcts[sid][m] = rank / (n - 1)
+				# Percentiles: rank order ascending, ties keep input order
+				order = np.argsort(v, kind="stable")
+				ranks = np.empty(n, dtype=np.int64)
+				ranks[order] = np.arange(n)
+				ranked = ranks / (n - 1)
+			for sid, pct in zip(sym_ids[mask].tolist(), ranked.tolist()):
+				pcts[sid][m] = pct
 		stats[sector] = SectorStats(sector=sector, medians=meds, percentiles=pcts)
-	return stats
\ No newline at end of file
+	return stats
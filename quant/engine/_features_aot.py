@@ -0,0 +1,30 @@
+"""Ahead-of-time build of the strategy feature kernels.
+
+Run ``python -m quant.engine._features_aot`` (requires numba with ``numba.pycc``) to
+emit the ``quant_features_aot`` extension next to this file. ``_kernels`` imports it
+when present, so processes skip JIT warm-up entirely.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def build(output_dir: str | Path | None = None) -> None:
+    try:
+        from numba.pycc import CC  # type: ignore
+    except Exception as exc:
+        raise ImportError("numba with numba.pycc required to build AOT kernels") from exc
+
+    from . import _kernels
+
+    cc = CC("quant_features_aot")
+    cc.output_dir = str(output_dir or Path(__file__).resolve().parent)
+    cc.export("simple_returns", "f8[:](f8[:])")(_kernels._simple_returns_loop)
+    cc.export("rolling_mean_last", "f8(f8[:], i8)")(_kernels._rolling_mean_last_loop)
+    cc.export("vol_target_last", "f8(f8[:], f8, i8, i8)")(_kernels._vol_target_last_loop)
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
@@ -0,0 +1,90 @@
+"""Numeric kernels for per-bar strategy features.
+
+Each kernel returns only the last value a strategy needs. Resolution order: the
+prebuilt ``quant_features_aot`` extension (see ``_features_aot``), then numba JIT
+compiled eagerly from explicit signatures (and cached on disk), then the NumPy
+equivalents below.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+try:  # Optional: native kernels when numba is installed
+    from numba import njit  # type: ignore
+except ImportError:  # pragma: no cover - exercised only without numba
+    njit = None
+
+
+def _simple_returns_loop(closes):
+    n = closes.shape[0]
+    out = np.zeros(max(n - 1, 0), dtype=np.float64)
+    for i in range(1, n):
+        prev = closes[i - 1]
+        if prev != 0.0:
+            out[i - 1] = (closes[i] - prev) / prev
+    return out
+
+
+def _rolling_mean_last_loop(x, n):
+    m = x.shape[0]
+    if n <= 0 or m < n:
+        return math.nan
+    acc = 0.0
+    for i in range(m - n, m):
+        acc += x[i]
+    return acc / n
+
+
+def _vol_target_last_loop(returns, target, window, ppy):
+    m = returns.shape[0]
+    if window <= 1 or m < window:
+        return math.nan
+    mu = 0.0
+    for i in range(m - window, m):
+        mu += returns[i]
+    mu /= window
+    ss = 0.0
+    for i in range(m - window, m):
+        d = returns[i] - mu
+        ss += d * d
+    s = math.sqrt(ss / window)
+    if s == 0.0:
+        s = 1e-12
+    return target / (s * math.sqrt(ppy))
+
+
+def _simple_returns_np(closes: np.ndarray) -> np.ndarray:
+    prev = closes[:-1]
+    diff = np.diff(closes)
+    out = np.zeros_like(diff)
+    np.divide(diff, prev, out=out, where=prev != 0.0)
+    return out
+
+
+def _rolling_mean_last_np(x: np.ndarray, n: int) -> float:
+    if n <= 0 or x.shape[0] < n:
+        return math.nan
+    return float(x[-n:].mean())
+
+
+def _vol_target_last_np(returns: np.ndarray, target: float, window: int, ppy: int) -> float:
+    if window <= 1 or returns.shape[0] < window:
+        return math.nan
+    s = float(returns[-window:].std()) or 1e-12
+    return target / (s * math.sqrt(ppy))
+
+
+try:  # Optional: AOT-compiled extension, no JIT warm-up
+    from .quant_features_aot import rolling_mean_last, simple_returns, vol_target_last  # type: ignore
+except ImportError:
+    if njit is not None:
+        simple_returns = njit("float64[:](float64[:])", cache=True, fastmath=True)(_simple_returns_loop)
+        rolling_mean_last = njit("float64(float64[:], int64)", cache=True, fastmath=True)(_rolling_mean_last_loop)
+        vol_target_last = njit("float64(float64[:], float64, int64, int64)", cache=True, fastmath=True)(_vol_target_last_loop)
+    else:
+        simple_returns = _simple_returns_np
+        rolling_mean_last = _rolling_mean_last_np
+        vol_target_last = _vol_target_last_np
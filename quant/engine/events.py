@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from enum import IntEnum
-from typing import Any, List, Tuple
+from typing import Any, List
 import heapq
 
 
@@ -14,41 +15,74 @@ class EventType(IntEnum):
     CORPORATE_ACTION = 3
 
 
-@dataclass(order=True, frozen=True)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
+
+def _epoch_ns(ts: datetime) -> int:
+    """Exact nanoseconds since the Unix epoch; naive datetimes are taken as UTC."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return (ts - _EPOCH) // _ONE_US * 1000
+
+
+@functools.total_ordering
+@dataclass(frozen=True)
 class Event:
-    sort_index: Tuple[datetime, int, int] = field(init=False, repr=False, compare=True)
-    ts: datetime = field(compare=False)
-    type: EventType = field(compare=False)
+    ts: datetime
+    type: EventType
     payload: Any = field(compare=False, default=None)
-    seq: int = field(compare=False, default=0)
+    seq: int = 0
+    # Integer sort keys, derived once so heap compares never touch datetime
+    ts_ns: int = field(init=False, repr=False, compare=False)
+    type_int: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         # use object.__setattr__ due to frozen dataclass
-        object.__setattr__(self, "sort_index", (self.ts, int(self.type), self.seq))
+        object.__setattr__(self, "ts_ns", _epoch_ns(self.ts))
+        object.__setattr__(self, "type_int", int(self.type))
+
+    def __lt__(self, other: "Event") -> bool:
+        # Heap order: ts, then type priority, then insertion sequence
+        if self.ts_ns != other.ts_ns:
+            return self.ts_ns < other.ts_ns
+        if self.type_int != other.type_int:
+            return self.type_int < other.type_int
+        return self.seq < other.seq
+
+    def __eq__(self, other: object) -> bool:
+        # Same key as __lt__, so total_ordering's <=, > and >= agree with the heap order
+        if not isinstance(other, Event):
+            return NotImplemented
+        return self.ts_ns == other.ts_ns and self.type_int == other.type_int and self.seq == other.seq
+
+    def __hash__(self) -> int:
+        return hash((self.ts_ns, self.type_int, self.seq))
 
 
 class EventQueue:
     def __init__(self) -> None:
-        self._heap: List[Tuple[datetime, int, int, Event]] = []
+        # Events are ordered by Event.__lt__, so they go on the heap as-is
+        self._heap: List[Event] = []
         self._seq_counter: int = 0
 
     def push(self, ts: datetime, type: EventType, payload: Any | None = None) -> Event:
         evt = Event(ts=ts, type=type, payload=payload, seq=self._seq_counter)
         self._seq_counter += 1
-        heapq.heappush(self._heap, (evt.ts, int(evt.type), evt.seq, evt))
+        heapq.heappush(self._heap, evt)
         return evt
 
     def pop(self) -> Event:
         if not self._heap:
             raise IndexError("pop from empty EventQueue")
-        return heapq.heappop(self._heap)[3]
+        return heapq.heappop(self._heap)
 
     def peek(self) -> Event | None:
-        return self._heap[0][3] if self._heap else None
+        return self._heap[0] if self._heap else None
 
     def __len__(self) -> int:
         return len(self._heap)
 
     def clear(self) -> None:
         self._heap.clear()
-        self._seq_counter = 0
\ No newline at end of file
+        self._seq_counter = 0
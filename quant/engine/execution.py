@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from math import sqrt
-from typing import List, Optional, Tuple
-from datetime import datetime, timezone
+from typing import List, Optional, Sequence, Tuple
+from datetime import datetime, timezone, tzinfo
+
+import numpy as np
 
 from .orders import Order, OrderSide, OrderType, TimeInForce
 from ..data.costs import CostCalculator, Order as CostOrder
@@ -30,6 +32,25 @@ class Fill:
     quantity: int
 
 
+_TOD_LABELS = ("MID", "OPEN", "CLOSE")
+
+
+def _tod_table(open_bucket: Tuple[int, int], close_bucket: Tuple[int, int]) -> bytes:
+    """Minute-of-day -> index into _TOD_LABELS; bucket bounds are [start, end) local minutes."""
+    table = bytearray(24 * 60)
+    table[open_bucket[0]:open_bucket[1]] = b"\x01" * (open_bucket[1] - open_bucket[0])
+    table[close_bucket[0]:close_bucket[1]] = b"\x02" * (close_bucket[1] - close_bucket[0])
+    return bytes(table)
+
+
+# Rough session assumptions: XNYS 09:30-16:00, XETR 09:00-17:30.
+# OPEN/CLOSE are the first/last 30 minutes; the XNYS buckets include the 10:00 and 16:00 minutes.
+_TOD_TABLES = {
+    "XNYS": _tod_table((9 * 60 + 30, 10 * 60 + 1), (15 * 60 + 30, 16 * 60 + 1)),
+    "XETR": _tod_table((9 * 60, 9 * 60 + 30), (17 * 60, 17 * 60 + 30)),
+}
+
+
 class ExecutionSimulator:
     def __init__(
         self,
@@ -43,6 +64,8 @@ class ExecutionSimulator:
     ) -> None:
         self._costs = cost_calculator
         self._adv = adv_by_symbol or {}
+        # 1/sqrt(ADV) per symbol, so impact needs one sqrt per order instead of a divide and sqrt
+        self._inv_sqrt_adv: dict[int, float] = {sid: 1.0 / sqrt(max(adv, 1)) for sid, adv in self._adv.items()}
         self._cap = float(adv_cap_fraction)
         self._alpha = float(impact_alpha)
         self._sigma = sigma_by_symbol or {}
@@ -53,41 +76,22 @@ class ExecutionSimulator:
             "CLOSE": 1.3,
             "MID": 1.0,
         }
+        # venue as passed by callers -> (exchange tz, minute-of-day bucket table)
+        self._venue_tz: dict[str, Tuple[tzinfo, bytes]] = {}
 
     def _tod_bucket(self, venue: str, ts: Optional[datetime]) -> str:
         if ts is None:
             return "MID"
-        tz = EXCHANGE_TZ.get("XNYS" if venue.upper() == "US" else ("XETR" if venue.upper() in ("EU", "DE", "XETR") else "XNYS"))
-        ts = ts if ts.tzinfo is not None else ts.replace(tzinfo=timezone.utc)
-        local = ts.astimezone(tz) if tz is not None else ts
-        # Define buckets: first 30 minutes as OPEN, last 30 minutes as CLOSE
-        hour = local.hour
-        minute = local.minute
-        # Rough session assumptions: XNYS 09:30-16:00, XETR 09:00-17:30
-        if tz is not None and tz.key == "America/New_York":
-            if (hour == 9 and minute >= 30) or (hour == 10 and minute < 0):
-                pass
-            # OPEN bucket: 09:30-10:00
-            if (hour == 9 and minute >= 30) or (hour == 9 and minute >= 30 and minute < 60) or (hour == 10 and minute == 0):
-                if hour == 9 and minute >= 30 or (hour == 10 and minute == 0):
-                    if hour == 9 or (hour == 10 and minute == 0):
-                        if hour == 9 and minute >= 30 or (hour == 10 and minute == 0):
-                            if hour == 9 and minute >= 30 and minute < 60:
-                                return "OPEN"
-                            if hour == 10 and minute == 0:
-                                return "OPEN"
-            # CLOSE bucket: 15:30-16:00
-            if (hour == 15 and minute >= 30) or (hour == 16 and minute == 0):
-                return "CLOSE"
+        venue_tz = self._venue_tz.get(venue)
+        if venue_tz is None:
+            exchange = "XETR" if venue.upper() in ("EU", "DE", "XETR") else "XNYS"
+            venue_tz = self._venue_tz[venue] = (EXCHANGE_TZ[exchange], _TOD_TABLES[exchange])
+        tz, table = venue_tz
+        if ts.tzinfo is tz:
+            local = ts
         else:
-            # Assume XETR 09:00-17:30
-            # OPEN bucket: 09:00-09:30
-            if hour == 9 and minute < 30:
-                return "OPEN"
-            # CLOSE bucket: 17:00-17:30
-            if (hour == 17 and minute >= 0 and minute < 30):
-                return "CLOSE"
-        return "MID"
+            local = (ts if ts.tzinfo is not None else ts.replace(tzinfo=timezone.utc)).astimezone(tz)
+        return _TOD_LABELS[table[local.hour * 60 + local.minute]]
 
     def simulate(
         self,
@@ -121,14 +125,22 @@ class ExecutionSimulator:
 
         # Market impact component
         sigma = self._sigma.get(order.symbol_id, 0.0)
-        qty_for_impact = max_fillable
-        impact = (1 if order.side == OrderSide.BUY else -1) * sigma * sqrt(max(qty_for_impact, 1) / max(adv, 1)) * self._alpha
+        inv_sqrt_adv = self._inv_sqrt_adv.get(order.symbol_id)
+        if inv_sqrt_adv is None:
+            inv_sqrt_adv = 1.0 / sqrt(max(adv, 1))
+        side_sign = 1 if order.side == OrderSide.BUY else -1
+        impact = side_sign * sigma * sqrt(max(max_fillable, 1)) * inv_sqrt_adv * self._alpha
         impacted_mid = mid + impact
 
         # Determine executable price respecting limit and [bid, ask]
-        target = impacted_mid + (urgency_k * effective_spread if order.side == OrderSide.BUY else -urgency_k * effective_spread)
+        target = impacted_mid + side_sign * urgency_k * effective_spread
         # Clamp to [bid, ask] widened by TOD does not change quoted bounds; keep original quote bounds
-        target = min(max(target, quote.bid), quote.ask)
+        bid = quote.bid
+        ask = quote.ask
+        if target < bid:
+            target = bid
+        if target > ask:
+            target = ask
 
         # Respect limit constraints
         if order.type == OrderType.LIMIT:
@@ -137,7 +149,10 @@ class ExecutionSimulator:
             if order.side == OrderSide.SELL and target < order.limit_price:
                 target = order.limit_price
             # Still ensure within [bid, ask]
-            target = min(max(target, quote.bid), quote.ask)
+            if target < bid:
+                target = bid
+            if target > ask:
+                target = ask
 
         # FOK: only fill if full qty available under constraints
         if order.tif == TimeInForce.FOK and max_fillable < order.quantity:
@@ -153,4 +168,64 @@ class ExecutionSimulator:
         if self._costs and filled > 0:
             cost_total = self._costs.cost(venue, CostOrder(side=order.side.value, qty=filled, price=target))
 
-        return fills, cost_total
\ No newline at end of file
+        return fills, cost_total
+
+    def simulate_batch(
+        self,
+        orders: Sequence[Order],
+        bids: np.ndarray,
+        asks: np.ndarray,
+        venue: str,
+        available_liquidity: np.ndarray,
+        *,
+        ts: Optional[datetime] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorised ``simulate`` for many orders sharing one venue and timestamp.
+
+        ``bids``, ``asks`` and ``available_liquidity`` are aligned with ``orders``.
+        Returns ``(prices, quantities)``; a quantity of 0 means no fill. Costs are
+        not computed here.
+        """
+        n = len(orders)
+        bid = np.asarray(bids, dtype=np.float64)
+        ask = np.asarray(asks, dtype=np.float64)
+        liq = np.asarray(available_liquidity, dtype=np.float64)
+        if n == 0:
+            return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.int64)
+
+        # Columnar view of the orders
+        qty = np.fromiter((o.quantity for o in orders), dtype=np.float64, count=n)
+        sign = np.fromiter((1.0 if o.side == OrderSide.BUY else -1.0 for o in orders), dtype=np.float64, count=n)
+        is_limit = np.fromiter((o.type == OrderType.LIMIT for o in orders), dtype=bool, count=n)
+        is_fok = np.fromiter((o.tif == TimeInForce.FOK for o in orders), dtype=bool, count=n)
+        is_ioc = np.fromiter((o.tif == TimeInForce.IOC for o in orders), dtype=bool, count=n)
+        if any(o.type == OrderType.LIMIT and o.limit_price is None for o in orders):
+            raise ValueError("Limit order missing limit_price")
+        limit = np.fromiter(
+            (o.limit_price if o.limit_price is not None else np.nan for o in orders), dtype=np.float64, count=n
+        )
+        adv = np.fromiter((self._adv.get(o.symbol_id, np.nan) for o in orders), dtype=np.float64, count=n)
+        adv = np.where(np.isnan(adv), liq, adv)
+        sigma = np.fromiter((self._sigma.get(o.symbol_id, 0.0) for o in orders), dtype=np.float64, count=n)
+
+        # Fillable size per ADV cap and available liquidity
+        cap = np.floor(np.maximum(0.0, np.minimum(liq, self._cap * adv)))
+        max_fillable = np.where(is_fok, qty, np.minimum(qty, cap))
+
+        # Price target: impacted mid plus urgency share of the TOD-adjusted spread
+        spread_multiplier = self._tod_mults.get(self._tod_bucket(venue, ts), 1.0)
+        mid = (bid + ask) / 2.0
+        effective_spread = (ask - bid) * spread_multiplier
+        urgency_k = np.where(is_limit, 0.5, 0.75)
+        impact = sign * sigma * np.sqrt(np.maximum(max_fillable, 1.0) / np.maximum(adv, 1.0)) * self._alpha
+        target = mid + impact + sign * urgency_k * effective_spread
+        target = np.minimum(np.maximum(target, bid), ask)
+
+        # Limit prices cap buys from above and sells from below, then re-clamp to the quote
+        limited = np.where(sign > 0, np.minimum(target, limit), np.maximum(target, limit))
+        target = np.where(is_limit, np.minimum(np.maximum(limited, bid), ask), target)
+
+        fill_qty = np.where(is_ioc, np.minimum(max_fillable, liq), max_fillable)
+        fill_qty = np.where((max_fillable <= 0) | (is_fok & (max_fillable < qty)), 0.0, fill_qty)
+        fill_qty = np.maximum(fill_qty, 0.0).astype(np.int64)
+        return np.round(target, 10), fill_qty
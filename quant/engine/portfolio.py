@@ -1,64 +1,209 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Mapping, Sequence, Set, Tuple
+import math
+
+import numpy as np
 
 from ..data.adjusters import apply_actions, dividend_cashflow_on_exdate
 from ..data.corp_actions_repository import CorporateAction
 from ..data.fx_repository import get_rate_asof, Engine as _EngineType  # type: ignore
 
 
-@dataclass
+# Fill side -> sign; OrderSide members hash like their string values
+_SIDE_SIGN: Dict[Any, int] = {"BUY": 1, "SELL": -1, 1: 1, -1: -1}
+
+# Initial row capacity of a Portfolio's position arrays; grows by doubling
+_INITIAL_CAPACITY = 16
+
+
+class _Rows:
+    """Single-row storage backing a Position created outside a Portfolio."""
+
+    __slots__ = ("_sym", "_qty", "_avg_px", "_ccy", "_active")
+
+    def __init__(self, symbol_id: int, currency: str, quantity: float, average_price: float) -> None:
+        self._sym = np.array([symbol_id], dtype=np.int64)
+        self._qty = np.array([quantity], dtype=np.float64)
+        self._avg_px = np.array([average_price], dtype=np.float64)
+        self._ccy = [currency]
+        self._active = {0} if quantity else set()
+
+
 class Position:
-    symbol_id: int
-    currency: str
-    quantity: float = 0.0
-    average_price: float = 0.0
+    """View of one row in a Portfolio's position arrays.
+
+    Attribute writes go straight to the arrays. Constructing a Position directly
+    gives a standalone row with the same interface.
+    """
+
+    __slots__ = ("_rows", "_idx")
+
+    def __init__(self, symbol_id: int, currency: str, quantity: float = 0.0, average_price: float = 0.0) -> None:
+        self._rows: Any = _Rows(symbol_id, currency, quantity, average_price)
+        self._idx = 0
+
+    @classmethod
+    def _view(cls, rows: Any, idx: int) -> "Position":
+        pos = cls.__new__(cls)
+        pos._rows = rows
+        pos._idx = idx
+        return pos
+
+    @property
+    def symbol_id(self) -> int:
+        return int(self._rows._sym[self._idx])
+
+    @property
+    def currency(self) -> str:
+        return self._rows._ccy[self._idx]
+
+    @property
+    def quantity(self) -> float:
+        return float(self._rows._qty[self._idx])
+
+    @quantity.setter
+    def quantity(self, value: float) -> None:
+        self._rows._qty[self._idx] = value
+        _mark_active(self._rows, self._idx, value)
+
+    @property
+    def average_price(self) -> float:
+        return float(self._rows._avg_px[self._idx])
+
+    @average_price.setter
+    def average_price(self, value: float) -> None:
+        self._rows._avg_px[self._idx] = value
+
+    def _key(self) -> Tuple[int, str, float, float]:
+        return (self.symbol_id, self.currency, self.quantity, self.average_price)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self._key() == other._key()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return "Position(symbol_id=%r, currency=%r, quantity=%r, average_price=%r)" % self._key()
 
     def apply_fill(self, qty_delta: float, price: float) -> Tuple[float, float]:
-        realized_pnl = 0.0
+        rows, i = self._rows, self._idx
+        quantity = float(rows._qty[i])
+        average_price = float(rows._avg_px[i])
         if qty_delta == 0:
-            return self.quantity, realized_pnl
-        # If same sign or moving from flat to non-flat, update average price
-        if self.quantity == 0 or (self.quantity > 0 and qty_delta > 0) or (self.quantity < 0 and qty_delta < 0):
-            new_qty = self.quantity + qty_delta
-            # weighted average
-            self.average_price = (
-                (self.average_price * self.quantity + price * qty_delta) / new_qty
-            ) if new_qty != 0 else 0.0
-            self.quantity = new_qty
-            return self.quantity, realized_pnl
+            return quantity, 0.0
+        # Flat or same sign: extend the position at a weighted average price
+        if quantity == 0.0 or quantity * qty_delta > 0.0:
+            new_qty = quantity + qty_delta
+            rows._avg_px[i] = (average_price * quantity + price * qty_delta) / new_qty if new_qty else 0.0
+            rows._qty[i] = new_qty
+            _mark_active(rows, i, new_qty)
+            return new_qty, 0.0
         # Reducing or flipping the position
-        close_qty = min(abs(qty_delta), abs(self.quantity))
-        sign = 1.0 if self.quantity > 0 else -1.0
-        realized_pnl = (price - self.average_price) * (close_qty * sign)
-        self.quantity += qty_delta
-        if self.quantity == 0:
-            self.average_price = 0.0
-        else:
-            # If flipped beyond zero, set avg price to fill price of the residual open portion
-            if (self.quantity > 0 and qty_delta > 0) or (self.quantity < 0 and qty_delta < 0):
-                # this path theoretically won't occur because we handled same sign earlier
-                self.average_price = (self.average_price + price) / 2.0
-            else:
-                self.average_price = price
-        return self.quantity, realized_pnl
+        close_qty = min(abs(qty_delta), abs(quantity))
+        realized_pnl = (price - average_price) * (close_qty * math.copysign(1.0, quantity))
+        new_qty = quantity + qty_delta
+        # Flat -> 0; flipped past zero -> midpoint of old average and fill; reduced -> fill price
+        rows._avg_px[i] = 0.0 if new_qty == 0 else ((average_price + price) / 2.0 if new_qty * qty_delta > 0.0 else price)
+        rows._qty[i] = new_qty
+        _mark_active(rows, i, new_qty)
+        return new_qty, realized_pnl
 
     def apply_corporate_actions(self, actions: List[CorporateAction]) -> None:
         if not actions or self.quantity == 0:
             return
+        # Dividend-only / 1:1 lists leave price and quantity untouched
+        if not any(_is_split(a) for a in actions):
+            return
         adjusted = apply_actions(self.average_price, self.quantity, actions)
         self.average_price = adjusted.price
         self.quantity = adjusted.qty
 
 
-@dataclass
+def _mark_active(rows: Any, idx: int, quantity: float) -> None:
+    # Keep the owner's set of open (non-zero) rows in step with every quantity write
+    if quantity:
+        rows._active.add(idx)
+    else:
+        rows._active.discard(idx)
+
+
+def _effective_date(action: CorporateAction) -> datetime:
+    return action.effective_date
+
+
+def _is_split(action: CorporateAction) -> bool:
+    # Same test the adjuster uses: a positive ratio other than 1:1
+    ratio = action.split_ratio
+    return bool(ratio) and ratio > 0 and ratio != 1.0
+
+
+class _PositionsView(Mapping[int, Position]):
+    """Read-only symbol_id -> Position mapping over a Portfolio's arrays."""
+
+    __slots__ = ("_portfolio",)
+
+    def __init__(self, portfolio: "Portfolio") -> None:
+        self._portfolio = portfolio
+
+    def __getitem__(self, symbol_id: int) -> Position:
+        return Position._view(self._portfolio, self._portfolio._sym_to_idx[symbol_id])
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._portfolio._sym_to_idx)
+
+    def __len__(self) -> int:
+        return len(self._portfolio._sym_to_idx)
+
+
+@dataclass(slots=True, eq=False)
 class Portfolio:
     base_currency: str = "EUR"
     cash_by_ccy: Dict[str, float] = field(default_factory=dict)
-    positions: Dict[int, Position] = field(default_factory=dict)
     _processed_actions: Dict[int, List[datetime]] = field(default_factory=dict)
+    # Struct-of-arrays position storage: row i holds symbol _sym[i]; rows beyond len(_ccy) are spare capacity
+    _sym_to_idx: Dict[int, int] = field(default_factory=dict, repr=False)
+    _sym: np.ndarray = field(default_factory=lambda: np.zeros(_INITIAL_CAPACITY, dtype=np.int64), repr=False)
+    _qty: np.ndarray = field(default_factory=lambda: np.zeros(_INITIAL_CAPACITY, dtype=np.float64), repr=False)
+    _avg_px: np.ndarray = field(default_factory=lambda: np.zeros(_INITIAL_CAPACITY, dtype=np.float64), repr=False)
+    _ccy: List[str] = field(default_factory=list, repr=False)
+    # Rows with non-zero quantity, so mark-to-market skips closed positions without scanning them
+    _active: Set[int] = field(default_factory=set, repr=False)
+
+    def _open_book(self) -> Dict[int, Tuple[float, float, str]]:
+        return {int(self._sym[i]): (float(self._qty[i]), float(self._avg_px[i]), self._ccy[i]) for i in self._active}
+
+    def __eq__(self, other: object) -> bool:
+        # Array rows are compared by content; flat rows and spare capacity do not count
+        if not isinstance(other, Portfolio):
+            return NotImplemented
+        return (
+            self.base_currency == other.base_currency
+            and self.cash_by_ccy == other.cash_by_ccy
+            and self._processed_actions == other._processed_actions
+            and self._open_book() == other._open_book()
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def positions(self) -> Mapping[int, Position]:
+        return _PositionsView(self)
+
+    def quantities_for(self, symbol_ids: Sequence[int] | np.ndarray) -> np.ndarray:
+        """Current quantity per symbol id as a float64 array; 0.0 for symbols never traded."""
+        ids = np.asarray(symbol_ids, dtype=np.int64)
+        sym_to_idx = self._sym_to_idx
+        rows = np.fromiter((sym_to_idx.get(s, -1) for s in ids.tolist()), dtype=np.int64, count=ids.size)
+        held = rows >= 0
+        out = np.zeros(ids.size, dtype=np.float64)
+        out[held] = self._qty[rows[held]]
+        return out
 
     def get_cash(self, currency: str) -> float:
         return self.cash_by_ccy.get(currency, 0.0)
@@ -69,24 +214,36 @@ class Portfolio:
     def withdraw(self, amount: float, currency: str) -> None:
         self.cash_by_ccy[currency] = self.get_cash(currency) - float(amount)
 
+    def _add_row(self, symbol_id: int, currency: str) -> int:
+        idx = len(self._ccy)
+        if idx == self._qty.shape[0]:
+            cap = 2 * idx
+            for name in ("_sym", "_qty", "_avg_px"):
+                old = getattr(self, name)
+                grown = np.zeros(cap, dtype=old.dtype)
+                grown[:idx] = old
+                setattr(self, name, grown)
+        self._sym[idx] = symbol_id
+        self._ccy.append(currency)
+        self._sym_to_idx[symbol_id] = idx
+        return idx
+
     def get_or_create_position(self, symbol_id: int, currency: str) -> Position:
-        pos = self.positions.get(symbol_id)
-        if pos is None:
-            pos = Position(symbol_id=symbol_id, currency=currency)
-            self.positions[symbol_id] = pos
-        return pos
+        idx = self._sym_to_idx.get(symbol_id)
+        if idx is None:
+            idx = self._add_row(symbol_id, currency)
+        return Position._view(self, idx)
 
-    def apply_fill(self, symbol_id: int, currency: str, side: str, qty: float, price: float) -> float:
+    def apply_fill(self, symbol_id: int, currency: str, side: str | int, qty: float, price: float) -> float:
+        """``side`` is +1/-1, an OrderSide, or a "BUY"/"SELL" string (anything not BUY sells)."""
+        sign = _SIDE_SIGN.get(side)
+        if sign is None:
+            sign = 1 if str(side).upper() == "BUY" else -1
         pos = self.get_or_create_position(symbol_id, currency)
-        qty_signed = qty if side.upper() == "BUY" else -qty
         before_qty = pos.quantity
-        new_qty, realized_pnl = pos.apply_fill(qty_signed, price)
-        notional = qty * price
-        # Update cash
-        if side.upper() == "BUY":
-            self.withdraw(notional, currency)
-        else:
-            self.deposit(notional, currency)
+        new_qty, realized_pnl = pos.apply_fill(sign * qty, price)
+        # Update cash: buys pay the notional, sells receive it
+        (self.withdraw if sign > 0 else self.deposit)(qty * price, currency)
         # Realized P&L is tracked separately by the caller; cash only moves by trade notional and costs
         return realized_pnl
 
@@ -98,22 +255,32 @@ class Portfolio:
     def process_actions_for_symbol(self, symbol_id: int, actions: List[CorporateAction], asof: datetime) -> float:
         if asof.tzinfo is None:
             asof = asof.replace(tzinfo=timezone.utc)
-        pos = self.positions.get(symbol_id)
-        if pos is None or pos.quantity == 0:
+        idx = self._sym_to_idx.get(symbol_id)
+        if idx is None or idx not in self._active:
             return 0.0
+        pos = Position._view(self, idx)
+        # Processed dates stay sorted; walking date-ordered actions against them is a single merge pass
         processed = self._processed_actions.setdefault(symbol_id, [])
-        to_apply: List[CorporateAction] = []
+        split_actions: List[CorporateAction] = []
         div_actions: List[CorporateAction] = []
-        for a in actions:
-            if a.effective_date <= asof and a.effective_date not in processed:
-                to_apply.append(a)
-                if a.dividend and a.dividend != 0.0:
-                    div_actions.append(a)
-                processed.append(a.effective_date)
-        if not to_apply:
-            return 0.0
+        p = 0
+        for a in sorted(actions, key=_effective_date):  # repository order is already sorted: linear
+            d = a.effective_date
+            if d > asof:
+                break
+            p = bisect_left(processed, d, p)
+            if p < len(processed) and processed[p] == d:
+                continue
+            processed.insert(p, d)
+            if _is_split(a):
+                split_actions.append(a)
+            if a.dividend and a.dividend != 0.0:
+                div_actions.append(a)
         # Apply splits first via adjuster
-        pos.apply_corporate_actions(to_apply)
+        if split_actions:
+            pos.apply_corporate_actions(split_actions)
+        if not div_actions:
+            return 0.0
         # Credit dividends as cashflow in instrument currency
         div_cash = dividend_cashflow_on_exdate(pos.quantity, div_actions)
         if div_cash != 0.0:
@@ -123,25 +290,35 @@ class Portfolio:
     def total_value_eur(self, asof: datetime, mark_prices: Dict[int, float], fx_engine: _EngineType) -> float:  # type: ignore
         if asof.tzinfo is None:
             asof = asof.replace(tzinfo=timezone.utc)
+        # One FX lookup per currency for the whole mark-to-market pass
+        fx_cache: Dict[str, float] = {self.base_currency: 1.0}
+
+        def _rate(ccy: str) -> float:
+            r = fx_cache.get(ccy)
+            if r is None:
+                r = get_rate_asof(fx_engine, ccy, self.base_currency, asof).rate
+                fx_cache[ccy] = r
+            return r
+
         total_eur = 0.0
         # Cash
         for ccy, amount in self.cash_by_ccy.items():
             if ccy == self.base_currency:
                 total_eur += amount
             else:
-                rate = get_rate_asof(fx_engine, ccy, self.base_currency, asof)
-                total_eur += amount * rate.rate
-        # Positions
-        for symbol_id, pos in self.positions.items():
-            if pos.quantity == 0:
-                continue
-            price = mark_prices.get(symbol_id)
-            if price is None:
-                continue
-            mv = pos.quantity * price
-            if pos.currency == self.base_currency:
-                total_eur += mv
-            else:
-                rate = get_rate_asof(fx_engine, pos.currency, self.base_currency, asof)
-                total_eur += mv * rate.rate
+                total_eur += amount * _rate(ccy)
+        # Positions: one vectorised qty * mark * fx reduction over the open rows; unpriced symbols drop out
+        open_rows = np.sort(np.fromiter(self._active, dtype=np.int64, count=len(self._active)))
+        if open_rows.size:
+            mark = np.fromiter(
+                (mark_prices.get(s, np.nan) for s in self._sym[open_rows].tolist()), dtype=np.float64, count=open_rows.size
+            )
+            priced = ~np.isnan(mark)
+            ccy = self._ccy
+            fx = np.fromiter(
+                (_rate(ccy[i]) if ok else 0.0 for i, ok in zip(open_rows.tolist(), priced.tolist())),
+                dtype=np.float64,
+                count=open_rows.size,
+            )
+            total_eur += float(np.einsum("i,i,i->", self._qty[open_rows], np.where(priced, mark, 0.0), fx))
         return round(total_eur, 10)
\ No newline at end of file
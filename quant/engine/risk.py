@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, Tuple
 
+import numpy as np
+
 from .orders import Order, OrderSide
 from .portfolio import Portfolio
 from ..data.fx_repository import Engine as _EngineType  # type: ignore
@@ -36,4 +38,18 @@ class RiskManager:
 
         # Gross and net exposure approximation using mark_prices isn't fully available here; rely on caller to pass aggregate if needed.
         # For now, enforce symbol-level which is most critical pre-trade.
-        return True, None
\ No newline at end of file
+        return True, None
+
+    def check_batch(
+        self,
+        portfolio: Portfolio,
+        symbol_ids: np.ndarray,
+        prices: np.ndarray,
+        qtys: np.ndarray,
+        fx_rates: np.ndarray,
+    ) -> np.ndarray:
+        """Per-symbol cap for a basket of orders in one pass; True where an order passes."""
+        ids = np.asarray(symbol_ids, dtype=np.int64)
+        existing_qty = portfolio.quantities_for(ids)
+        mv_eur = (existing_qty + np.asarray(qtys, dtype=np.float64)) * np.asarray(prices, dtype=np.float64) * np.asarray(fx_rates, dtype=np.float64)
+        return np.abs(mv_eur) <= self._caps.max_symbol
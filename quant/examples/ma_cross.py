@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Optional
 
 from ..sdk.strategy import Strategy, Context
 
@@ -12,20 +14,60 @@ class MACross(Strategy):
     fast: int = 10
     slow: int = 30
     last_state: str | None = None
+    # Incremental window state: each bar enters once and both sums update in O(1)
+    _fast_buf: Deque[float] = field(default_factory=deque, init=False, repr=False)
+    _slow_buf: Deque[float] = field(default_factory=deque, init=False, repr=False)
+    _fast_sum: float = field(default=0.0, init=False, repr=False)
+    _slow_sum: float = field(default=0.0, init=False, repr=False)
+    _last_ts: Optional[datetime] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._reset_windows()
+
+    def _reset_windows(self) -> None:
+        self._fast_buf = deque(maxlen=self.fast)
+        self._slow_buf = deque(maxlen=self.slow)
+        self._fast_sum = 0.0
+        self._slow_sum = 0.0
+        self._last_ts = None
+
+    def _push(self, close: float) -> None:
+        if len(self._fast_buf) == self.fast:
+            self._fast_sum -= self._fast_buf[0]
+        self._fast_buf.append(close)
+        self._fast_sum += close
+        if len(self._slow_buf) == self.slow:
+            self._slow_sum -= self._slow_buf[0]
+        self._slow_buf.append(close)
+        self._slow_sum += close
 
     def on_start(self, ctx: Context) -> None:
+        self._reset_windows()
         ctx.log.info("MACross starting for %s", self.symbol)
 
+    def _seed(self, ctx: Context) -> None:
+        # Rebuild both windows from the bars already visible at ctx.now
+        self._reset_windows()
+        data = ctx.data.get(self.symbol, ["close"], lookback=self.slow, at=ctx.now)
+        for close in data.get("close", []):
+            self._push(float(close))
+
     def on_event(self, evt: Any, ctx: Context) -> None:
-        # Use close prices
-        data = ctx.data.get(self.symbol, ["close"], lookback=self.slow + 1, at=ctx.now)
-        closes = data.get("close", [])
-        if len(closes) < self.slow:
+        # The newest two bars tell whether exactly one new bar arrived since the last step
+        data = ctx.data.get(self.symbol, ["close", "ts"], lookback=2, at=ctx.now)
+        ts = data.get("ts", [])
+        if not ts or ts[-1] == self._last_ts:
             return
-        ma_fast = ctx.features.rolling_mean(closes, self.fast)[-1]
-        ma_slow = ctx.features.rolling_mean(closes, self.slow)[-1]
-        if ma_fast is None or ma_slow is None:
+        if self._last_ts is not None and len(ts) == 2 and ts[0] == self._last_ts:
+            self._push(float(data["close"][-1]))
+        else:
+            # First step, pre-start history, or bars this strategy never saw
+            self._seed(ctx)
+        self._last_ts = ts[-1]
+        if len(self._slow_buf) < self.slow or len(self._fast_buf) < self.fast:
             return
+        ma_fast = self._fast_sum / self.fast
+        ma_slow = self._slow_sum / self.slow
         # Signal
         state = "above" if ma_fast > ma_slow else "below"
         if self.last_state is None:
@@ -40,4 +82,4 @@ class MACross(Strategy):
             self.last_state = state
 
     def on_end(self, ctx: Context) -> None:
-        ctx.log.info("MACross finished for %s", self.symbol)
\ No newline at end of file
+        ctx.log.info("MACross finished for %s", self.symbol)
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, List, Optional
+from typing import Any, Optional
 
+import numpy as np
+
+from ..engine._kernels import simple_returns, vol_target_last
 from ..sdk.strategy import Strategy, Context
 
 
@@ -22,16 +25,9 @@ class VolTargetedCarry(Strategy):
         closes = data.get("close", [])
         if len(closes) < self.window + 1:
             return
-        # simple returns
-        returns: List[float] = []
-        for i in range(1, len(closes)):
-            if closes[i - 1] == 0:
-                returns.append(0.0)
-            else:
-                returns.append((closes[i] - closes[i - 1]) / closes[i - 1])
-        lev_series = ctx.features.vol_target(returns, self.target_annual_vol, self.window, self.periods_per_year)
-        weight = lev_series[-1]
-        if weight is None:
+        returns = simple_returns(np.asarray(closes, dtype=np.float64))
+        weight = vol_target_last(returns, float(self.target_annual_vol), int(self.window), int(self.periods_per_year))
+        if weight != weight:  # NaN: window not filled
             return
         self.last_weight = float(weight)
         # Example: scale position to 100 * weight (demo only)
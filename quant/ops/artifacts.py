@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import csv
+import functools
 import hashlib
 import json
 import os
@@ -10,6 +11,17 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
+import numpy as np
+
+try:  # Optional: C JSON encoder for metrics and manifests
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+# Write buffer for CSV artifacts
+_CSV_BUFFER_BYTES = 1 << 20
+
 
 def _ensure_dir(path: str | Path) -> Path:
     p = Path(path)
@@ -18,16 +30,28 @@ def _ensure_dir(path: str | Path) -> Path:
 
 
 def compute_params_hash(params: Dict[str, Any]) -> str:
-    payload = json.dumps(params, sort_keys=True, separators=(",", ":"), default=_json_default).encode("utf-8")
-    return hashlib.sha256(payload).hexdigest()
+    return _params_digest(_PARAMS_ENCODER.encode(params).encode("utf-8"))
+
+
+@functools.lru_cache(maxsize=1024)
+def _params_digest(payload: bytes) -> str:
+    # Internal content hash, not a security boundary: 128-bit BLAKE2b is plenty and faster than SHA-256
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+# Resolved once per process; "" records a failed lookup so callers still get their own default
+_git_sha: Optional[str] = None
 
 
 def get_git_sha(default: str = "unknown") -> str:
-    try:
-        sha = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=Path(__file__).resolve().parents[2], timeout=2)
-        return sha.decode("utf-8").strip()
-    except Exception:
-        return default
+    global _git_sha
+    if _git_sha is None:
+        try:
+            sha = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=Path(__file__).resolve().parents[2], timeout=2)
+            _git_sha = sha.decode("utf-8").strip()
+        except Exception:
+            _git_sha = ""
+    return _git_sha or default
 
 
 @dataclass
@@ -57,11 +81,34 @@ class ArtifactWriter:
         )
 
     def write_equity(self, rows: Iterable[Dict[str, Any]]) -> None:
-        with self.paths.equity_csv.open("w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=["ts", "equity_eur"])
-            writer.writeheader()
-            for r in rows:
-                writer.writerow({"ts": _iso(r["ts"]), "equity_eur": r["equity_eur"]})
+        # Two fixed columns: format lines directly (same bytes csv.writer would emit)
+        with self.paths.equity_csv.open("w", newline="", buffering=_CSV_BUFFER_BYTES) as f:
+            f.write("ts,equity_eur\r\n")
+            f.writelines(f"{_iso(r['ts'])},{r['equity_eur']}\r\n" for r in rows)
+
+    def write_equity_arrow(self, ts: np.ndarray, equity_eur: np.ndarray) -> None:
+        """Columnar variant of write_equity for callers holding NumPy arrays (``ts`` as UTC datetime64).
+
+        Formatting runs inside pyarrow's CSV writer; numbers use its shortest round-trip form.
+        """
+        # Optional: requires pyarrow at runtime
+        try:
+            import pyarrow as pa  # type: ignore
+            import pyarrow.csv as pa_csv  # type: ignore
+        except Exception as exc:
+            raise ImportError("pyarrow required to write arrow CSV") from exc
+
+        ts_us = np.asarray(ts, dtype="datetime64[us]")
+        unit = "us" if (ts_us.astype(np.int64) % 1_000_000).any() else "s"
+        table = pa.table(
+            {
+                "ts": pa.array(np.datetime_as_string(ts_us, unit=unit, timezone="UTC")),
+                "equity_eur": pa.array(np.asarray(equity_eur, dtype=np.float64)),
+            }
+        )
+        with self.paths.equity_csv.open("wb") as f:
+            f.write(b"ts,equity_eur\n")
+            pa_csv.write_csv(table, f, write_options=pa_csv.WriteOptions(include_header=False, quoting_style="none"))
 
     def write_orders(self, rows: Iterable[Dict[str, Any]]) -> None:
         fields = [
@@ -75,41 +122,42 @@ class ArtifactWriter:
             "limit_price",
             "state",
         ]
-        with self.paths.orders_csv.open("w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fields)
-            writer.writeheader()
-            for r in rows:
-                r2 = dict(r)
-                r2["ts"] = _iso(r2["ts"]) if r2.get("ts") else None
-                writer.writerow(r2)
+        _write_rows(self.paths.orders_csv, fields, rows)
 
     def write_fills(self, rows: Iterable[Dict[str, Any]]) -> None:
         fields = ["ts", "order_id", "symbol_id", "price", "quantity", "venue", "cost"]
-        with self.paths.fills_csv.open("w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fields)
-            writer.writeheader()
-            for r in rows:
-                r2 = dict(r)
-                r2["ts"] = _iso(r2["ts"]) if r2.get("ts") else None
-                writer.writerow(r2)
+        _write_rows(self.paths.fills_csv, fields, rows)
 
     def write_positions(self, rows: Iterable[Dict[str, Any]]) -> None:
         fields = ["ts", "symbol_id", "currency", "quantity", "average_price"]
-        with self.paths.positions_csv.open("w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fields)
-            writer.writeheader()
-            for r in rows:
-                r2 = dict(r)
-                r2["ts"] = _iso(r2["ts"]) if r2.get("ts") else None
-                writer.writerow(r2)
+        _write_rows(self.paths.positions_csv, fields, rows)
 
     def write_metrics(self, metrics: Dict[str, Any]) -> None:
-        with self.paths.metrics_json.open("w") as f:
-            json.dump(metrics, f, indent=2, default=_json_default)
+        _write_json(self.paths.metrics_json, metrics)
 
     def write_manifest(self, manifest: Dict[str, Any]) -> None:
-        with self.paths.manifest_json.open("w") as f:
-            json.dump(manifest, f, indent=2, default=_json_default)
+        _write_json(self.paths.manifest_json, manifest)
+
+
+def _write_rows(path: Path, fields: List[str], rows: Iterable[Dict[str, Any]]) -> None:
+    # Tuples in fixed column order; "ts" (always first) is formatted inline instead of copying each row dict
+    rest = fields[1:]
+    with path.open("w", newline="", buffering=_CSV_BUFFER_BYTES) as f:
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        writer.writerows(
+            (_iso(r["ts"]) if r.get("ts") else None, *[r.get(k) for k in rest]) for r in rows
+        )
+
+
+def _write_json(path: Path, obj: Dict[str, Any]) -> None:
+    if orjson is not None:
+        # Datetimes still go through _json_default so timestamps keep the "Z" form
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        path.write_bytes(orjson.dumps(obj, default=_json_default, option=option))
+        return
+    with path.open("w") as f:
+        json.dump(obj, f, indent=2, default=_json_default)
 
 
 def _json_default(value: Any) -> Any:
@@ -118,7 +166,14 @@ def _json_default(value: Any) -> Any:
     return str(value)
 
 
+# Canonical params payload (sorted keys, compact separators); built once instead of per json.dumps call
+_PARAMS_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=_json_default)
+
+
 def _iso(ts: datetime) -> str:
+    if ts.tzinfo is timezone.utc:
+        # Common case: isoformat() always ends in "+00:00" here
+        return ts.isoformat()[:-6] + "Z"
     if ts.tzinfo is None:
         ts = ts.replace(tzinfo=timezone.utc)
     else:
@@ -1,6 +1,49 @@
 from __future__ import annotations
 
-from prometheus_client import Counter, Gauge, Histogram
+import os
+import threading
+import time
+from typing import Any, List
+
+import numpy as np
+
+
+class _Noop:
+    """Stands in for a metric (or BatchObserver) when metrics are disabled."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def labels(self, *args: Any, **kwargs: Any) -> "_Noop":
+        return self
+
+    def inc(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def set(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def observe(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+
+# QUANT_DISABLE_METRICS=1 (or no prometheus_client) turns every metric below into a no-op
+_DISABLED = os.environ.get("QUANT_DISABLE_METRICS", "").strip().lower() in ("1", "true", "yes")
+
+if not _DISABLED:
+    try:
+        from prometheus_client import Counter, Gauge, Histogram, disable_created_metrics
+    except ImportError:  # pragma: no cover - prometheus_client is optional for offline runs
+        _DISABLED = True
+    else:
+        # Skip the per-metric *_created series: fewer series to scrape and less work per update
+        disable_created_metrics()
+
+if _DISABLED:
+    Counter = Gauge = Histogram = _Noop  # type: ignore[misc,assignment]
 
 # Counters
 # Total processed events (use PromQL rate() to get events/sec)
@@ -29,4 +72,56 @@ backtest_step_duration_seconds = Histogram(
     "quant_backtest_step_duration_seconds",
     "Wall-clock duration per backtest timestep",
     buckets=(0.001, 0.005, 0.01, 0.02, 0.05, 0.1, 0.25, 0.5, 1, 2)
-)
\ No newline at end of file
+)
+
+
+class BatchObserver:
+    """Buffers observations for an unlabelled Histogram and folds them in bulk.
+
+    Bucket lookup for a whole batch is one ``searchsorted``; each touched bucket is
+    incremented once. The buffer is flushed every ``flush_every`` samples or once
+    ``flush_interval`` seconds have passed since the last flush, whichever comes
+    first, so a live scrape lags by at most about that interval. Call ``flush`` at
+    the end of a run so pending samples are exported. Safe to share across threads.
+    """
+
+    def __init__(self, hist: Histogram, flush_every: int = 4096, flush_interval: float = 1.0) -> None:
+        self._hist = hist
+        self._bounds = np.asarray(hist._upper_bounds, dtype=np.float64)
+        self._flush_every = flush_every
+        self._flush_interval = flush_interval
+        self._buf: List[float] = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def observe(self, amount: float) -> None:
+        with self._lock:
+            self._buf.append(amount)
+            if len(self._buf) >= self._flush_every or time.monotonic() - self._last_flush >= self._flush_interval:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._buf:
+            return
+        values = np.asarray(self._buf, dtype=np.float64)
+        self._buf = []
+        n = self._bounds.size
+        # First bound >= value, as Histogram.observe does; NaN lands past +Inf and is only summed
+        counts = np.bincount(np.searchsorted(self._bounds, values, side="left"), minlength=n + 1)[:n]
+        self._hist._sum.inc(float(values.sum()))
+        for i in np.flatnonzero(counts).tolist():
+            self._hist._buckets[i].inc(int(counts[i]))
+
+
+# Batched front-ends for the per-fill / per-step histograms
+if _DISABLED:
+    fill_slippage_observer: Any = _Noop()
+    backtest_step_observer: Any = _Noop()
+else:
+    fill_slippage_observer = BatchObserver(fill_slippage_bps)
+    backtest_step_observer = BatchObserver(backtest_step_duration_seconds)
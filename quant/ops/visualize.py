@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import math
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -10,40 +12,202 @@ import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.figure import Figure
 import numpy as np
 
+try:  # Optional: Arrow's multithreaded CSV reader
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    _CSV_ENGINE = "pyarrow"
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    pa = pacsv = None
+    _CSV_ENGINE = "c"
 
-def _compute_max_drawdown(equity: pd.Series) -> Tuple[float, pd.Timestamp, pd.Timestamp, pd.Series]:
+try:  # Optional: compiled comparison-grid fill when numba is installed
+    from numba import njit  # type: ignore
+except ImportError:  # pragma: no cover - exercised only without numba
+    njit = None
+
+
+def _fill_grid_loop(eq_cols, row_equity, tol, out):
+    # Cell code is 1 + index of the first run within tol of its level (0 = blank);
+    # NaN (outside a run's range) never matches
+    n_runs, width = eq_cols.shape
+    for r in range(row_equity.shape[0]):
+        for c in range(width):
+            for k in range(n_runs):
+                if abs(eq_cols[k, c] - row_equity[r]) <= tol:
+                    out[r, c] = k + 1
+                    break
+
+
+def _fill_grid_np(eq_cols, row_equity, tol, out):
+    # Later runs are written first so earlier runs overwrite them where curves overlap
+    for k in range(eq_cols.shape[0] - 1, -1, -1):
+        out[np.abs(eq_cols[k][None, :] - row_equity[:, None]) <= tol] = k + 1
+
+
+if njit is not None:
+    # No fastmath: it assumes no NaNs, and NaN marks columns outside a run's range
+    _fill_grid = njit("void(float64[:, :], float64[:], float64, int16[:, :])", cache=True)(_fill_grid_loop)
+else:
+    _fill_grid = _fill_grid_np
+
+
+def _compute_max_drawdown(equity: pd.Series) -> Tuple[float, pd.Timestamp, pd.Timestamp, pd.Series, int]:
     """Compute max drawdown on an equity curve.
 
-    Returns a tuple of (max_drawdown_fraction, peak_time, trough_time, drawdown_series)
-    where drawdown is in fractional terms (e.g., -0.25 for -25%).
+    Returns a tuple of (max_drawdown_fraction, peak_time, trough_time, drawdown_series, trough_pos)
+    where drawdown is in fractional terms (e.g., -0.25 for -25%) and trough_pos is the trough's
+    integer position in ``equity`` (-1 when there is no trough).
     """
     if equity.empty:
-        return 0.0, pd.NaT, pd.NaT, pd.Series(dtype=float)
-
-    # Ensure float
-    equity = equity.astype(float)
-    
-    # Handle case where all values are zero or negative
-    if equity.max() <= 0:
-        # If all values are zero or negative, calculate drawdown from the highest point
-        running_max = equity.cummax()
-        dd = equity - running_max  # Absolute drawdown instead of percentage
-        trough_idx = dd.idxmin()
-        max_dd = float(dd.loc[trough_idx]) if trough_idx in dd.index else 0.0
-        peak_idx = equity.loc[:trough_idx].idxmax() if trough_idx in equity.index else equity.idxmax()
-        return max_dd, pd.to_datetime(peak_idx), pd.to_datetime(trough_idx), dd
-    
-    # Normal case: running peak and drawdown
-    running_max = equity.cummax()
-    dd = equity / running_max - 1.0
-    # Max drawdown is the minimum value of dd (most negative)
-    trough_idx = dd.idxmin()
-    max_dd = float(dd.loc[trough_idx]) if trough_idx in dd.index else 0.0
-    # Peak is the last time equity hit the running max before the trough
-    peak_idx = equity.loc[:trough_idx].idxmax() if trough_idx in equity.index else equity.idxmax()
-    return max_dd, pd.to_datetime(peak_idx), pd.to_datetime(trough_idx), dd
+        return 0.0, pd.NaT, pd.NaT, pd.Series(dtype=float), -1
+
+    vals = equity.to_numpy(dtype=np.float64)
+    # Running peak; fmax skips missing values the way cummax does
+    running_max = np.fmax.accumulate(vals)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if np.nanmax(vals, initial=-np.inf) <= 0:
+            # If all values are zero or negative, use absolute drawdown instead of percentage
+            dd = vals - running_max
+        else:
+            dd = vals / running_max - 1.0
+    dd_series = pd.Series(dd, index=equity.index, name=equity.name)
+    if np.isnan(dd).all():
+        return 0.0, pd.NaT, pd.NaT, dd_series, -1
+
+    # Max drawdown is the minimum value of dd (most negative); the peak is the highest point before it
+    trough = int(np.nanargmin(dd))
+    peak = int(np.nanargmax(vals[:trough + 1]))
+    return float(dd[trough]), pd.Timestamp(equity.index[peak]), pd.Timestamp(equity.index[trough]), dd_series, trough
+
+
+def _minmax_bin(y: np.ndarray, nbins: int) -> np.ndarray:
+    """Row positions keeping the min and max of each of ``nbins`` near-equal chunks, in time order.
+
+    Plotting only these points draws the same envelope as the full series at one bin per pixel.
+    The first and last rows are always kept so the x-limits match; chunks that are all NaN keep
+    their first row so gaps still break the line.
+    """
+    keep = [np.array([0, y.shape[0] - 1])]
+    for chunk in np.array_split(np.arange(y.shape[0]), nbins):
+        values = y[chunk]
+        if np.isnan(values).all():
+            keep.append(chunk[:1])
+        else:
+            keep.append(chunk[[np.nanargmin(values), np.nanargmax(values)]])
+    return np.unique(np.concatenate(keep))
+
+
+def _read_csv(path: Path) -> pd.DataFrame:
+    """Read a run CSV, parsing any ``ts`` column to UTC nanoseconds (unparseable stamps become NaT)."""
+    df = pd.read_csv(path, engine=_CSV_ENGINE)
+    if "ts" in df.columns:
+        # Arrow may already have inferred timestamps (at second resolution); strings still go through to_datetime
+        df["ts"] = pd.to_datetime(df["ts"], utc=True, errors="coerce").astype("datetime64[ns, UTC]")
+    return df
+
+
+def _load_equity_raw(path: Path) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Typed Arrow read of equity.csv into (ts as UTC datetime64[ns], equity_eur as float64) arrays.
+
+    Returns None without pyarrow, without both columns, or when a value doesn't parse under the
+    strict types (e.g. a malformed or offset-less timestamp); callers then use the coercing pandas path.
+    """
+    if pacsv is None:
+        return None
+    convert = pacsv.ConvertOptions(
+        column_types={"ts": pa.timestamp("ns", "UTC"), "equity_eur": pa.float64()},
+        include_columns=["ts", "equity_eur"],
+    )
+    try:
+        table = pacsv.read_csv(path, convert_options=convert)
+    except (pa.ArrowInvalid, pa.ArrowKeyError):
+        return None
+    ts = table.column("ts").to_numpy().astype("datetime64[ns]")
+    return ts, table.column("equity_eur").to_numpy()
+
+
+@functools.lru_cache(maxsize=32)
+def _load_run(run_dir: str, equity_mtime_ns: int):
+    """Parse a run directory's equity.csv and its drawdown, cached per path and file mtime.
+
+    Returns (df, max_dd, dd_peak_ts, dd_trough_ts, dd_series, dd_trough_pos, equity_values), or None
+    when equity.csv lacks the ts/equity_eur columns. The frames are shared between calls, so
+    callers must not modify them.
+    """
+    run_dir_path = Path(run_dir)
+
+    # Load equity: straight into typed arrays when Arrow can, else through pandas with coercion
+    raw = _load_equity_raw(run_dir_path / "equity.csv")
+    if raw is not None:
+        df = pd.DataFrame({"ts": pd.to_datetime(raw[0], utc=True), "equity_eur": raw[1]})
+    else:
+        df = _read_csv(run_dir_path / "equity.csv")
+        if "ts" not in df.columns or "equity_eur" not in df.columns:
+            return None
+    # Backtests write equity in strictly increasing time order; only copy the frame when it needs
+    # sorting (NaT or repeated stamps always go through sort_values, as before)
+    ts = df["ts"].values
+    if not (ts[1:] > ts[:-1]).all():
+        df = df.sort_values("ts").reset_index(drop=True)
+
+    # Compute drawdown
+    equity_values = df["equity_eur"].values
+    equity = pd.Series(equity_values, index=pd.Index(df["ts"]), name="equity_eur")
+    max_dd, dd_peak_ts, dd_trough_ts, dd_series, dd_trough_pos = _compute_max_drawdown(equity)
+    return df, max_dd, dd_peak_ts, dd_trough_ts, dd_series, dd_trough_pos, equity_values
+
+
+def _read_run(run_dir_path: Path):
+    """Load a run's equity through ``_load_run``, re-parsing only when equity.csv changed."""
+    return _load_run(str(run_dir_path), (run_dir_path / "equity.csv").stat().st_mtime_ns)
+
+
+def _orders_file(run_dir_path: Path) -> Optional[Tuple[str, int]]:
+    """(path, st_mtime_ns) of the run's orders.csv, the cache key for the order loaders; None if absent."""
+    orders_csv = run_dir_path / "orders.csv"
+    if not orders_csv.exists():
+        return None
+    return str(orders_csv), orders_csv.stat().st_mtime_ns
+
+
+@functools.lru_cache(maxsize=32)
+def _load_orders(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Orders with a parseable ts, sorted by time (unparsed without a ts column). Shared; don't modify."""
+    orders_df = _read_csv(Path(path))
+    if "ts" in orders_df.columns:
+        orders_df = orders_df.dropna(subset=["ts"]).sort_values("ts").reset_index(drop=True)
+    return orders_df
+
+
+@functools.lru_cache(maxsize=32)
+def _count_orders(path: str, mtime_ns: int) -> Tuple[int, bool]:
+    """(row count, has ts column) of ``_load_orders`` without building the frame when possible.
+
+    Only the ts column is read, typed, through Arrow; blanks are nulls and are not counted, as
+    dropna does. Any stamp Arrow can't parse strictly falls back to the coercing pandas read.
+    """
+    if pacsv is not None:
+        convert = pacsv.ConvertOptions(column_types={"ts": pa.timestamp("ns", "UTC")}, include_columns=["ts"])
+        try:
+            table = pacsv.read_csv(path, convert_options=convert)
+        except (pa.ArrowInvalid, pa.ArrowKeyError):
+            pass
+        else:
+            return table.num_rows - table.column("ts").null_count, True
+    orders_df = _load_orders(path, mtime_ns)
+    return int(orders_df.shape[0]), "ts" in orders_df.columns
+
+
+def _grid_lines(row_equity: np.ndarray, grid: np.ndarray) -> list[str]:
+    """Chart rows: y-axis label (every 3rd row plus first/last) and the grid characters."""
+    height, width = grid.shape
+    labels = [f"{v:7.0f}" if r == 0 or r == height - 1 or r % 3 == 0 else " " * 7 for r, v in enumerate(row_equity.tolist())]
+    # Each contiguous row of single characters reads as one string
+    rows = np.ascontiguousarray(grid).view(f"<U{width}").ravel().tolist()
+    return [label + " |" + row for label, row in zip(labels, rows)]
 
 
 def visualize_run_ascii(run_dir: str | Path, width: int = None, height: int = None) -> str:
@@ -79,33 +243,21 @@ def visualize_run_ascii(run_dir: str | Path, width: int = None, height: int = No
     height = max(height, 10)
     run_dir_path = Path(run_dir)
     equity_csv = run_dir_path / "equity.csv"
-    orders_csv = run_dir_path / "orders.csv"
 
     if not equity_csv.exists():
         raise FileNotFoundError(f"Missing equity.csv in run directory: {equity_csv}")
 
-    # Load equity
-    df = pd.read_csv(equity_csv)
-    if "ts" not in df.columns or "equity_eur" not in df.columns:
+    # Load equity, orders and drawdown
+    loaded = _read_run(run_dir_path)
+    if loaded is None:
         raise ValueError("equity.csv must have columns: ts,equity_eur")
-    df["ts"] = pd.to_datetime(df["ts"], utc=True, errors="coerce")
-    df = df.sort_values("ts").reset_index(drop=True)
+    df, max_dd, dd_peak_ts, dd_trough_ts, dd_series, dd_trough_pos, equity_values = loaded
 
-    # Load orders (optional)
-    orders_df = None
-    if orders_csv.exists():
-        orders_df = pd.read_csv(orders_csv)
-        if "ts" in orders_df.columns:
-            orders_df["ts"] = pd.to_datetime(orders_df["ts"], utc=True, errors="coerce")
-            orders_df = orders_df.dropna(subset=["ts"]).sort_values("ts").reset_index(drop=True)
-        else:
-            orders_df = None
-
-    # Compute drawdown
-    max_dd, dd_peak_ts, dd_trough_ts, dd_series = _compute_max_drawdown(df.set_index("ts")["equity_eur"])
+    # Orders (optional) only feed the header count, so they are counted without building a frame
+    orders = _orders_file(run_dir_path)
+    n_orders, orders_have_ts = _count_orders(*orders) if orders is not None else (0, False)
 
-    # Get equity values and create constant scale
-    equity_values = df["equity_eur"].values
+    # Create constant scale
     min_equity = equity_values.min()
     max_equity = equity_values.max()
     equity_range = max_equity - min_equity
@@ -118,7 +270,7 @@ def visualize_run_ascii(run_dir: str | Path, width: int = None, height: int = No
     chart = []
     
     # Header with summary
-    total_orders = int(orders_df.shape[0]) if orders_df is not None else 0
+    total_orders = n_orders if orders_have_ts else 0
     
     # Handle different drawdown display formats in header
     if max_equity <= 0:
@@ -131,55 +283,27 @@ def visualize_run_ascii(run_dir: str | Path, width: int = None, height: int = No
     chart.append(f"Equity range: {min_equity:.2f} - {max_equity:.2f} EUR")
     chart.append("")
     
-    # Create the chart grid
-    for row in range(height):
-        # Calculate the equity value for this row (inverted for ASCII display)
-        row_equity = max_equity - (row * equity_range / (height - 1))
-        
-        # Create the row
-        row_chars = []
-        
-        # Y-axis label (every 3rd row or first/last for more detail)
-        if row == 0 or row == height - 1 or row % 3 == 0:
-            label = f"{row_equity:7.0f}"
-        else:
-            label = " " * 7
-        row_chars.append(label + " |")
-        
-        # Plot points
-        for col in range(width):
-            # Calculate the time index for this column
-            time_idx = int(col * (len(equity_values) - 1) / (width - 1))
-            if time_idx >= len(equity_values):
-                time_idx = len(equity_values) - 1
-            
-            current_equity = equity_values[time_idx]
-            
-            # Determine if this point should be plotted
-            if abs(current_equity - row_equity) <= equity_range / (height - 1) / 2:
-                # Check if this is in the drawdown period
-                if (pd.notna(dd_peak_ts) and pd.notna(dd_trough_ts) and 
-                    dd_peak_ts <= df.iloc[time_idx]["ts"] <= dd_trough_ts):
-                    row_chars.append("D")  # Drawdown period
-                else:
-                    row_chars.append("*")  # Normal equity point
-            else:
-                row_chars.append(" ")
-        
-        chart.append("".join(row_chars))
+    # Create the chart grid: one equity sample per column, one level per row (inverted for ASCII display)
+    time_idx = np.arange(width) * (len(equity_values) - 1) // (width - 1)
+    eq_col = equity_values[time_idx]
+    row_equity = max_equity - (np.arange(height) * equity_range / (height - 1))
+    plot_mask = np.abs(eq_col[None, :] - row_equity[:, None]) <= equity_range / (height - 1) / 2
+    grid = np.full((height, width), " ", dtype="<U1")
+    grid[plot_mask] = "*"  # Normal equity point
+    if pd.notna(dd_peak_ts) and pd.notna(dd_trough_ts):
+        ts_col = df["ts"].values[time_idx]
+        in_dd = (ts_col >= dd_peak_ts.to_datetime64()) & (ts_col <= dd_trough_ts.to_datetime64())
+        grid[plot_mask & in_dd[None, :]] = "D"  # Drawdown period
+
+    chart.extend(_grid_lines(row_equity, grid))
     
     # X-axis
     chart.append("-" * 7 + "+" + "-" * width)
     
     # X-axis labels (time) - more frequent labels for larger charts
-    time_labels = []
     label_interval = max(1, width // 8)  # More labels for wider charts
-    for col in range(0, width, label_interval):
-        time_idx = int(col * (len(equity_values) - 1) / (width - 1))
-        if time_idx >= len(equity_values):
-            time_idx = len(equity_values) - 1
-        time_label = df.iloc[time_idx]["ts"].strftime("%m-%d")
-        time_labels.append(f"{time_label:>6}")
+    # Same column -> row mapping as the grid; one positional gather instead of a row lookup per label
+    time_labels = [f"{ts.strftime('%m-%d'):>6}" for ts in df["ts"].iloc[time_idx[::label_interval]]]
     
     chart.append(" " * 8 + "".join(time_labels))
     
@@ -212,60 +336,61 @@ def visualize_run(run_dir: str | Path, out_path: Optional[str | Path] = None) ->
     """
     run_dir_path = Path(run_dir)
     equity_csv = run_dir_path / "equity.csv"
-    orders_csv = run_dir_path / "orders.csv"
 
     if not equity_csv.exists():
         raise FileNotFoundError(f"Missing equity.csv in run directory: {equity_csv}")
 
-    # Load equity
-    df = pd.read_csv(equity_csv)
-    if "ts" not in df.columns or "equity_eur" not in df.columns:
+    # Load equity, orders and drawdown
+    loaded = _read_run(run_dir_path)
+    if loaded is None:
         raise ValueError("equity.csv must have columns: ts,equity_eur")
-    df["ts"] = pd.to_datetime(df["ts"], utc=True, errors="coerce")
-    df = df.sort_values("ts").reset_index(drop=True)
+    df, max_dd, dd_peak_ts, dd_trough_ts, dd_series, dd_trough_pos, equity_values = loaded
 
     # Load orders (optional)
-    orders_df = None
-    if orders_csv.exists():
-        orders_df = pd.read_csv(orders_csv)
-        if "ts" in orders_df.columns:
-            orders_df["ts"] = pd.to_datetime(orders_df["ts"], utc=True, errors="coerce")
-            orders_df = orders_df.dropna(subset=["ts"]).sort_values("ts").reset_index(drop=True)
-        else:
-            orders_df = None
-
-    # Compute drawdown
-    max_dd, dd_peak_ts, dd_trough_ts, dd_series = _compute_max_drawdown(df.set_index("ts")["equity_eur"])
+    orders = _orders_file(run_dir_path)
+    orders_df = _load_orders(*orders) if orders is not None else None
+    if orders_df is not None and "ts" not in orders_df.columns:
+        orders_df = None
 
     # Prepare figure
     plt.style.use("ggplot")
-    fig, ax = plt.subplots(figsize=(12, 6), dpi=140)
+    # A bare Figure rather than plt.subplots: pyplot never tracks it, so nothing leaks if rendering fails
+    fig = Figure(figsize=(12, 6), dpi=140)
+    ax = fig.subplots()
 
     # Equity line
-    ax.plot(df["ts"], df["equity_eur"], color="C0", linewidth=1.8, label="Equity (EUR)")
+    # Long curves are reduced to a min/max envelope per pixel column before plotting; drawdown stays full-resolution
+    plot_df = df
+    nbins = int(fig.get_size_inches()[0] * fig.dpi)
+    if len(df) > max(4000, 2 * nbins):
+        plot_df = df.iloc[_minmax_bin(df["equity_eur"].to_numpy(dtype=np.float64), nbins)]
+
+    # Dense artists are rasterized so vector outputs (svg/pdf) stay small; PNG pixels are unaffected
+    ax.plot(plot_df["ts"], plot_df["equity_eur"], color="C0", linewidth=1.8, label="Equity (EUR)", rasterized=True)
     ax.set_xlabel("Time")
     ax.set_ylabel("Equity (EUR)")
 
     # Orders per timestep (bars on secondary axis)
     if orders_df is not None and not orders_df.empty:
-        per_ts = orders_df.groupby("ts").size()
-        # Align to equity timestamps
-        per_ts = per_ts.reindex(df["ts"].values, fill_value=0)
+        # Orders per equity timestamp: orders are sorted by ts, so each count is the width of its run
+        order_ts = orders_df["ts"].values
+        ts_keys = df["ts"].values
+        per_ts = np.searchsorted(order_ts, ts_keys, side="right") - np.searchsorted(order_ts, ts_keys, side="left")
 
         ax2 = ax.twinx()
-        ts_num = mdates.date2num(df["ts"].dt.to_pydatetime())
+        ts_num = mdates.date2num(df["ts"].values)
         if len(ts_num) >= 2:
             bar_width = np.min(np.diff(ts_num)) * 0.6
         else:
             bar_width = 0.8
-        ax2.bar(ts_num, per_ts.values, width=bar_width, color="C1", alpha=0.3, label="Orders per step")
+        ax2.bar(ts_num, per_ts, width=bar_width, color="C1", alpha=0.3, label="Orders per step", rasterized=True)
         ax2.set_ylabel("Orders per step")
 
     # Highlight max drawdown window
     if pd.notna(dd_peak_ts) and pd.notna(dd_trough_ts) and dd_peak_ts != dd_trough_ts:
         ax.axvspan(dd_peak_ts, dd_trough_ts, color="red", alpha=0.10, label="Max drawdown window")
         # Annotate drawdown magnitude near trough
-        trough_equity = float(df.set_index("ts").loc[dd_trough_ts, "equity_eur"]) if dd_trough_ts in df.set_index("ts").index else float(df["equity_eur"].iloc[-1])
+        trough_equity = float(equity_values[dd_trough_pos])
         ax.annotate(
             f"Max DD: {max_dd:.2%}",
             xy=(dd_trough_ts, trough_equity), xytext=(10, -20), textcoords="offset points",
@@ -290,8 +415,11 @@ def visualize_run(run_dir: str | Path, out_path: Optional[str | Path] = None) ->
 
     # Output path
     out = Path(out_path) if out_path is not None else (run_dir_path / "visualization.png")
-    fig.savefig(out)
-    plt.close(fig)
+    save_kwargs = {}
+    if out.suffix.lower() == ".png":
+        # Fastest zlib level: encoding dominates savefig for large canvases, file size matters less
+        save_kwargs["pil_kwargs"] = {"compress_level": 1}
+    fig.savefig(out, **save_kwargs)
     return out
 
 
@@ -332,42 +460,28 @@ def visualize_runs_comparison(run_dirs: list[str | Path], width: int = None, hei
     
     # Load all run data
     run_data = []
-    all_equity_values = []
+    # Global min/max for a consistent scale, reduced per run
+    min_equity = math.inf
+    max_equity = -math.inf
     
     for i, run_dir in enumerate(run_dirs):
         run_dir_path = Path(run_dir)
-        equity_csv = run_dir_path / "equity.csv"
-        orders_csv = run_dir_path / "orders.csv"
-        
-        if not equity_csv.exists():
+        if not (run_dir_path / "equity.csv").exists():
             continue
             
-        # Load equity
-        df = pd.read_csv(equity_csv)
-        if "ts" not in df.columns or "equity_eur" not in df.columns:
+        # Load equity, orders and drawdown
+        loaded = _read_run(run_dir_path)
+        if loaded is None:
             continue
-            
-        df["ts"] = pd.to_datetime(df["ts"], utc=True, errors="coerce")
-        df = df.sort_values("ts").reset_index(drop=True)
-        
-        # Load orders (optional)
-        orders_df = None
-        if orders_csv.exists():
-            orders_df = pd.read_csv(orders_csv)
-            if "ts" in orders_df.columns:
-                orders_df["ts"] = pd.to_datetime(orders_df["ts"], utc=True, errors="coerce")
-                orders_df = orders_df.dropna(subset=["ts"]).sort_values("ts").reset_index(drop=True)
-        
-        # Compute drawdown
-        max_dd, dd_peak_ts, dd_trough_ts, dd_series = _compute_max_drawdown(df.set_index("ts")["equity_eur"])
+        df, max_dd, dd_peak_ts, dd_trough_ts, dd_series, dd_trough_pos, equity_values = loaded
+        orders = _orders_file(run_dir_path)
         
         # Calculate KPIs
-        equity_values = df["equity_eur"].values
         if len(equity_values) > 0 and equity_values[0] != 0:
             total_return = (equity_values[-1] - equity_values[0]) / equity_values[0]
         else:
             total_return = 0.0
-        total_orders = int(orders_df.shape[0]) if orders_df is not None else 0
+        total_orders = _count_orders(*orders)[0] if orders is not None else 0
         
         run_data.append({
             'name': run_dir_path.name,
@@ -383,7 +497,9 @@ def visualize_runs_comparison(run_dirs: list[str | Path], width: int = None, hei
             'end_equity': equity_values[-1] if len(equity_values) > 0 else 0
         })
         
-        all_equity_values.extend(equity_values)
+        if len(equity_values) > 0:
+            min_equity = min(min_equity, float(equity_values.min()))
+            max_equity = max(max_equity, float(equity_values.max()))
     
     if not run_data:
         return "No valid run data found."
@@ -392,26 +508,6 @@ def visualize_runs_comparison(run_dirs: list[str | Path], width: int = None, hei
     full_start = min(run['df']['ts'].min() for run in run_data)
     full_end = max(run['df']['ts'].max() for run in run_data)
     
-    # Keep all data but align by time for visualization
-    all_equity_values = []
-    for run in run_data:
-        # Keep all data, don't filter
-        run['equity_values'] = run['df']['equity_eur'].values
-        
-        # Calculate KPIs using the full run data (not filtered)
-        equity_values = run['equity_values']
-        if len(equity_values) > 0 and equity_values[0] != 0:
-            run['total_return'] = (equity_values[-1] - equity_values[0]) / equity_values[0]
-        else:
-            run['total_return'] = 0.0
-        run['start_equity'] = equity_values[0] if len(equity_values) > 0 else 0
-        run['end_equity'] = equity_values[-1] if len(equity_values) > 0 else 0
-        
-        all_equity_values.extend(equity_values)
-    
-    # Calculate global min/max for consistent scale
-    min_equity = min(all_equity_values)
-    max_equity = max(all_equity_values)
     equity_range = max_equity - min_equity
     
     # Avoid division by zero
@@ -428,62 +524,34 @@ def visualize_runs_comparison(run_dirs: list[str | Path], width: int = None, hei
     chart.append(f"Equity range: {min_equity:.2f} - {max_equity:.2f} EUR")
     chart.append("")
     
-    # Create the chart grid
-    for row in range(height):
-        # Calculate the equity value for this row (inverted for ASCII display)
-        row_equity = max_equity - (row * equity_range / (height - 1))
-        
-        # Create the row
-        row_chars = []
-        
-        # Y-axis label (every 3rd row or first/last)
-        if row == 0 or row == height - 1 or row % 3 == 0:
-            label = f"{row_equity:7.0f}"
-        else:
-            label = " " * 7
-        row_chars.append(label + " |")
-        
-        # Plot points for all runs
-        for col in range(width):
-            # Calculate the time position (0.0 to 1.0) for this column
-            time_pos = col / (width - 1)
-            
-            # Convert time position to actual date
-            current_date = full_start + (full_end - full_start) * time_pos
-            
-            # Check each run for this point
-            point_plotted = False
-            for run in run_data:
-                # Find the closest date in this run's data
-                run_dates = run['df']['ts'].values
-                if len(run_dates) == 0:
-                    continue
-                
-                # Convert current_date to numpy datetime64 for comparison
-                current_date_np = np.datetime64(current_date)
-                
-                # Find the closest date index
-                time_diff = np.abs(run_dates - current_date_np)
-                closest_idx = np.argmin(time_diff)
-                
-                # Only plot if this date is within the run's actual date range
-                run_start = run_dates[0]
-                run_end = run_dates[-1]
-                
-                if run_start <= current_date_np <= run_end:
-                    if closest_idx < len(run['equity_values']):
-                        current_equity = run['equity_values'][closest_idx]
-                        
-                        # Determine if this point should be plotted
-                        if abs(current_equity - row_equity) <= equity_range / (height - 1) / 2:
-                            row_chars.append(run['color'])
-                            point_plotted = True
-                            break
-            
-            if not point_plotted:
-                row_chars.append(" ")
-        
-        chart.append("".join(row_chars))
+    # Date of each column as epoch ns, floored to microseconds like the Timestamp -> datetime64 conversion
+    span_ns = (full_end - full_start).value
+    query = (full_start.value + (np.arange(width) / (width - 1) * span_ns).astype(np.int64)) // 1000 * 1000
+    
+    # Sample each run once per column: closest point, or NaN outside the run's date range
+    col_equity = []
+    for run in run_data:
+        run_dates = run['df']['ts'].values.astype("datetime64[ns]").view("i8")
+        eq_col = np.full(width, np.nan)
+        if len(run_dates) > 0:
+            # Neighbours either side of each query date; ties and repeated timestamps take the earliest row
+            pos = np.searchsorted(run_dates, query)
+            right = np.minimum(pos, len(run_dates) - 1)
+            left = np.searchsorted(run_dates, run_dates[np.maximum(pos - 1, 0)])
+            closest = np.where(query - run_dates[left] <= run_dates[right] - query, left, right)
+            # A trailing NaT (minimum int64) leaves the run unplotted
+            in_range = (query >= run_dates[0]) & (query <= run_dates[-1])
+            eq_col[in_range] = run['equity_values'][closest[in_range]]
+        col_equity.append(eq_col)
+    
+    # Create the chart grid as run codes (0 = blank); earlier runs take precedence where curves overlap
+    row_equity = (max_equity - (np.arange(height) * equity_range / (height - 1))).astype(np.float64)
+    grid_codes = np.zeros((height, width), dtype=np.int16)
+    _fill_grid(np.vstack(col_equity), row_equity, float(equity_range / (height - 1) / 2), grid_codes)
+    palette = np.array([" "] + [run['color'] for run in run_data], dtype="<U1")
+    grid = palette[grid_codes]
+    
+    chart.extend(_grid_lines(row_equity, grid))
     
     # X-axis
     chart.append("-" * 7 + "+" + "-" * width)
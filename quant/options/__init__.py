@@ -1,3 +1,5 @@
+from .black_scholes import BSContext, bs_greeks_with_ctx, bs_price_with_ctx  # noqa: F401
 from .black_scholes import bs_price, bs_greeks, implied_volatility, Greeks  # noqa: F401
+from .black_scholes_vec import BS_DTYPE, bs_greeks_vec, bs_price_vec  # noqa: F401
 from .cache import GreeksCache  # noqa: F401
-from .early_exercise import early_exercise_probability_call, should_exercise_early_call  # noqa: F401
\ No newline at end of file
+from .early_exercise import early_exercise_probability_call, should_exercise_early_call  # noqa: F401
@@ -1,9 +1,22 @@
+"""Black-Scholes pricing, greeks and implied volatility for European options.
+
+The keyword API delegates to positional ``_bs_*`` kernels, passing the per-expiry
+rate/time/discount factors after the contract inputs; callers pricing a chain build
+one ``BSContext`` and use the ``*_with_ctx`` variants. Numba compiles the kernels
+eagerly (and caches on disk) when it is installed.
+"""
+
 from __future__ import annotations
 
 from dataclasses import dataclass
 from math import erf, exp, log, sqrt
 from typing import Literal, Tuple
 
+try:  # Optional: native scalar kernels when numba is installed
+    from numba import njit  # type: ignore
+except ImportError:  # pragma: no cover - exercised only without numba
+    njit = None
+
 
 def _norm_cdf(x: float) -> float:
     # standard normal CDF via error function
@@ -14,16 +27,103 @@ def _norm_pdf(x: float) -> float:
     return (1.0 / sqrt(2.0 * 3.141592653589793)) * exp(-0.5 * x * x)
 
 
-def _d1_d2(spot: float, strike: float, rate: float, time_years: float, vol: float, div_yield: float = 0.0) -> Tuple[float, float]:
-    if spot <= 0.0 or strike <= 0.0 or time_years <= 0.0 or vol <= 0.0:
+def _d1_d2(spot, strike, vol, rate, div_yield, time_years, sqrt_t):
+    if spot <= 0.0 or strike <= 0.0 or vol <= 0.0:
         raise ValueError("spot, strike, time, vol must be positive")
     num = log(spot / strike) + (rate - div_yield + 0.5 * vol * vol) * time_years
-    den = vol * sqrt(time_years)
+    den = vol * sqrt_t
     d1 = num / den
-    d2 = d1 - vol * sqrt(time_years)
+    d2 = d1 - vol * sqrt_t
     return d1, d2
 
 
+if njit is not None:
+    # Rebound before the kernels below are compiled so they call the native versions
+    _norm_cdf = njit("float64(float64)", cache=True, fastmath=True)(_norm_cdf)
+    _norm_pdf = njit("float64(float64)", cache=True, fastmath=True)(_norm_pdf)
+    _d1_d2 = njit("UniTuple(float64, 2)(float64, float64, float64, float64, float64, float64, float64)", cache=True, fastmath=True)(_d1_d2)
+
+
+def _bs_price_py(spot, strike, vol, is_call, rate, div_yield, time_years, sqrt_t, df, dq):
+    d1, d2 = _d1_d2(spot, strike, vol, rate, div_yield, time_years, sqrt_t)
+    if is_call:
+        return dq * spot * _norm_cdf(d1) - df * strike * _norm_cdf(d2)
+    return df * strike * _norm_cdf(-d2) - dq * spot * _norm_cdf(-d1)
+
+
+def _bs_greeks_py(spot, strike, vol, is_call, rate, div_yield, time_years, sqrt_t, df, dq):
+    d1, d2 = _d1_d2(spot, strike, vol, rate, div_yield, time_years, sqrt_t)
+    pdf_d1 = _norm_pdf(d1)
+
+    if is_call:
+        delta = dq * _norm_cdf(d1)
+        theta = (
+            - (spot * dq * pdf_d1 * vol) / (2.0 * sqrt_t)
+            - rate * df * strike * _norm_cdf(d2)
+            + div_yield * dq * spot * _norm_cdf(d1)
+        )
+        rho = time_years * df * strike * _norm_cdf(d2)
+    else:
+        delta = -dq * _norm_cdf(-d1)
+        theta = (
+            - (spot * dq * pdf_d1 * vol) / (2.0 * sqrt_t)
+            + rate * df * strike * _norm_cdf(-d2)
+            - div_yield * dq * spot * _norm_cdf(-d1)
+        )
+        rho = -time_years * df * strike * _norm_cdf(-d2)
+
+    gamma = dq * pdf_d1 / (spot * vol * sqrt_t)
+    vega = spot * dq * pdf_d1 * sqrt_t
+    return delta, gamma, vega, theta, rho
+
+
+def _bs_price_vega_py(spot, strike, vol, is_call, rate, div_yield, time_years, sqrt_t, df, dq):
+    # price and vega from a single d1/d2 evaluation
+    d1, d2 = _d1_d2(spot, strike, vol, rate, div_yield, time_years, sqrt_t)
+    if is_call:
+        price = dq * spot * _norm_cdf(d1) - df * strike * _norm_cdf(d2)
+    else:
+        price = df * strike * _norm_cdf(-d2) - dq * spot * _norm_cdf(-d1)
+    return price, spot * dq * _norm_pdf(d1) * sqrt_t
+
+
+if njit is not None:
+    _ARGS = "(float64, float64, float64, boolean, float64, float64, float64, float64, float64, float64)"
+    _bs_price_nb = njit("float64" + _ARGS, cache=True, fastmath=True)(_bs_price_py)
+    _bs_greeks_nb = njit("UniTuple(float64, 5)" + _ARGS, cache=True, fastmath=True)(_bs_greeks_py)
+    _bs_price_vega_nb = njit("UniTuple(float64, 2)" + _ARGS, cache=True, fastmath=True)(_bs_price_vega_py)
+else:
+    _bs_price_nb = _bs_price_py
+    _bs_greeks_nb = _bs_greeks_py
+    _bs_price_vega_nb = _bs_price_vega_py
+
+
+def _factors(rate: float, time_years: float, div_yield: float) -> Tuple[float, float, float, float, float, float]:
+    if time_years <= 0.0:
+        raise ValueError("spot, strike, time, vol must be positive")
+    return rate, div_yield, time_years, sqrt(time_years), exp(-rate * time_years), exp(-div_yield * time_years)
+
+
+@dataclass(frozen=True)
+class BSContext:
+    """Rate, carry and time factors shared by every contract with the same expiry at one timestamp."""
+
+    rate: float
+    div_yield: float
+    time_years: float
+    sqrt_t: float
+    df: float
+    dq: float
+
+    @classmethod
+    def build(cls, *, rate: float, time_years: float, div_yield: float = 0.0) -> "BSContext":
+        return cls(*_factors(rate, time_years, div_yield))
+
+
+def bs_price_with_ctx(*, spot: float, strike: float, vol: float, ctx: BSContext, right: Literal["C", "P"] = "C") -> float:
+    return _bs_price_nb(spot, strike, vol, right == "C", ctx.rate, ctx.div_yield, ctx.time_years, ctx.sqrt_t, ctx.df, ctx.dq)
+
+
 def bs_price(
     *,
     spot: float,
@@ -34,13 +134,12 @@ def bs_price(
     div_yield: float = 0.0,
     right: Literal["C", "P"] = "C",
 ) -> float:
-    d1, d2 = _d1_d2(spot, strike, rate, time_years, vol, div_yield)
-    df = exp(-rate * time_years)
-    dq = exp(-div_yield * time_years)
-    if right == "C":
-        return dq * spot * _norm_cdf(d1) - df * strike * _norm_cdf(d2)
-    else:
-        return df * strike * _norm_cdf(-d2) - dq * spot * _norm_cdf(-d1)
+    # Factors inlined rather than via BSContext: this is the per-call path
+    if time_years <= 0.0:
+        raise ValueError("spot, strike, time, vol must be positive")
+    return _bs_price_nb(
+        spot, strike, vol, right == "C", rate, div_yield, time_years, sqrt(time_years), exp(-rate * time_years), exp(-div_yield * time_years)
+    )
 
 
 @dataclass(frozen=True)
@@ -52,6 +151,13 @@ class Greeks:
     rho: float
 
 
+def bs_greeks_with_ctx(*, spot: float, strike: float, vol: float, ctx: BSContext, right: Literal["C", "P"] = "C") -> Greeks:
+    delta, gamma, vega, theta, rho = _bs_greeks_nb(
+        spot, strike, vol, right == "C", ctx.rate, ctx.div_yield, ctx.time_years, ctx.sqrt_t, ctx.df, ctx.dq
+    )
+    return Greeks(delta=delta, gamma=gamma, vega=vega, theta=theta, rho=rho)
+
+
 def bs_greeks(
     *,
     spot: float,
@@ -62,31 +168,11 @@ def bs_greeks(
     div_yield: float = 0.0,
     right: Literal["C", "P"] = "C",
 ) -> Greeks:
-    d1, d2 = _d1_d2(spot, strike, rate, time_years, vol, div_yield)
-    df = exp(-rate * time_years)
-    dq = exp(-div_yield * time_years)
-    pdf_d1 = _norm_pdf(d1)
-
-    if right == "C":
-        delta = dq * _norm_cdf(d1)
-        theta = (
-            - (spot * dq * pdf_d1 * vol) / (2.0 * sqrt(time_years))
-            - rate * df * strike * _norm_cdf(d2)
-            + div_yield * dq * spot * _norm_cdf(d1)
-        )
-        rho = time_years * df * strike * _norm_cdf(d2)
-    else:
-        delta = -dq * _norm_cdf(-d1)
-        theta = (
-            - (spot * dq * pdf_d1 * vol) / (2.0 * sqrt(time_years))
-            + rate * df * strike * _norm_cdf(-d2)
-            - div_yield * dq * spot * _norm_cdf(-d1)
-        )
-        rho = -time_years * df * strike * _norm_cdf(-d2)
-
-    gamma = dq * pdf_d1 / (spot * vol * sqrt(time_years))
-    vega = spot * dq * pdf_d1 * sqrt(time_years)
-
+    if time_years <= 0.0:
+        raise ValueError("spot, strike, time, vol must be positive")
+    delta, gamma, vega, theta, rho = _bs_greeks_nb(
+        spot, strike, vol, right == "C", rate, div_yield, time_years, sqrt(time_years), exp(-rate * time_years), exp(-div_yield * time_years)
+    )
     return Greeks(delta=delta, gamma=gamma, vega=vega, theta=theta, rho=rho)
 
 
@@ -104,34 +190,42 @@ def implied_volatility(
     vol_lower: float = 1e-6,
     vol_upper: float = 5.0,
 ) -> float:
-    # Bisection method for robustness
+    # Newton-Raphson on vega, safeguarded by a bisection bracket
+    args = (right == "C", *_factors(rate, time_years, div_yield))
     low = vol_lower
     high = vol_upper
 
-    def _price(v: float) -> float:
-        return bs_price(spot=spot, strike=strike, rate=rate, time_years=time_years, vol=v, div_yield=div_yield, right=right)
+    def _price(v: float) -> Tuple[float, float]:
+        return _bs_price_vega_nb(spot, strike, v, *args)
 
-    p_low = _price(low)
-    p_high = _price(high)
+    p_low = _price(low)[0]
+    p_high = _price(high)[0]
     if (p_low - target_price) * (p_high - target_price) > 0:
         # Expand bounds heuristically
         for _ in range(10):
             high *= 2.0
-            p_high = _price(high)
+            p_high = _price(high)[0]
             if (p_low - target_price) * (p_high - target_price) <= 0:
                 break
         else:
             raise ValueError("Could not bracket implied volatility")
 
+    # Seed at the inflection point of price in vol, where vega is largest
+    vol = sqrt(abs(2.0 / time_years * (log(spot / strike) + (rate - div_yield) * time_years)))
+    if not low < vol < high:
+        vol = 0.5 * (low + high)
+
     for _ in range(max_iter):
-        mid = 0.5 * (low + high)
-        p_mid = _price(mid)
-        if abs(p_mid - target_price) < tol:
-            return mid
-        if (p_mid - target_price) * (p_low - target_price) < 0:
-            high = mid
-            p_high = p_mid
+        p, vega = _price(vol)
+        diff = p - target_price
+        if abs(diff) < tol:
+            return vol
+        if diff * (p_low - target_price) < 0:
+            high = vol
         else:
-            low = mid
-            p_low = p_mid
-    return 0.5 * (low + high)
\ No newline at end of file
+            low = vol
+            p_low = p
+        # Fall back to the bracket midpoint when the Newton step leaves it or vega vanishes
+        step = vol - diff / vega if vega > 1e-10 else high
+        vol = step if low < step < high else 0.5 * (low + high)
+    return vol
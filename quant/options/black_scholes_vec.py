@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from math import erf
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+try:  # Optional: SIMD normal CDF
+    from scipy.special import ndtr  # type: ignore
+except ImportError:  # pragma: no cover - exercised only without scipy
+    ndtr = None
+
+_erf = np.frompyfunc(erf, 1, 1)
+
+BS_DTYPE = np.dtype(
+    [
+        ("price", np.float64),
+        ("delta", np.float64),
+        ("gamma", np.float64),
+        ("vega", np.float64),
+        ("theta", np.float64),
+        ("rho", np.float64),
+    ]
+)
+
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    if ndtr is not None:
+        return ndtr(x)
+    return 0.5 * (1.0 + np.asarray(_erf(x / np.sqrt(2.0)), dtype=np.float64))
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return (1.0 / np.sqrt(2.0 * np.pi)) * np.exp(-0.5 * x * x)
+
+
+def _inputs(spot, strike, rate, time_years, vol, div_yield, is_call):
+    s, k, r, t, v, q, c = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64) for a in (spot, strike, rate, time_years, vol, div_yield)),
+        np.asarray(is_call, dtype=bool),
+    )
+    if np.any(s <= 0.0) or np.any(k <= 0.0) or np.any(t <= 0.0) or np.any(v <= 0.0):
+        raise ValueError("spot, strike, time, vol must be positive")
+    return s, k, r, t, v, q, c
+
+
+def bs_price_vec(
+    spot: ArrayLike,
+    strike: ArrayLike,
+    rate: ArrayLike,
+    time_years: ArrayLike,
+    vol: ArrayLike,
+    div_yield: ArrayLike = 0.0,
+    is_call: ArrayLike = True,
+) -> np.ndarray:
+    """Black-Scholes prices for broadcastable arrays of contracts; ``is_call`` False prices puts."""
+    s, k, r, t, v, q, c = _inputs(spot, strike, rate, time_years, vol, div_yield, is_call)
+    sqrt_t = np.sqrt(t)
+    d1 = (np.log(s / k) + (r - q + 0.5 * v * v) * t) / (v * sqrt_t)
+    d2 = d1 - v * sqrt_t
+    sdq = s * np.exp(-q * t)
+    kdf = k * np.exp(-r * t)
+    # Put via parity terms: N(-x) = 1 - N(x)
+    sign = np.where(c, 1.0, -1.0)
+    return sign * (sdq * _norm_cdf(sign * d1) - kdf * _norm_cdf(sign * d2))
+
+
+def bs_greeks_vec(
+    spot: ArrayLike,
+    strike: ArrayLike,
+    rate: ArrayLike,
+    time_years: ArrayLike,
+    vol: ArrayLike,
+    div_yield: ArrayLike = 0.0,
+    is_call: ArrayLike = True,
+) -> np.ndarray:
+    """Price and greeks in one pass, as a ``BS_DTYPE`` structured array shaped like the inputs."""
+    s, k, r, t, v, q, c = _inputs(spot, strike, rate, time_years, vol, div_yield, is_call)
+    sqrt_t = np.sqrt(t)
+    d1 = (np.log(s / k) + (r - q + 0.5 * v * v) * t) / (v * sqrt_t)
+    d2 = d1 - v * sqrt_t
+    dq = np.exp(-q * t)
+    df = np.exp(-r * t)
+    sign = np.where(c, 1.0, -1.0)
+    n1 = _norm_cdf(sign * d1)
+    n2 = _norm_cdf(sign * d2)
+    pdf_d1 = _norm_pdf(d1)
+    sdq = s * dq
+    kdf = k * df
+
+    out = np.empty(s.shape, dtype=BS_DTYPE)
+    out["price"] = sign * (sdq * n1 - kdf * n2)
+    out["delta"] = sign * dq * n1
+    out["gamma"] = dq * pdf_d1 / (s * v * sqrt_t)
+    out["vega"] = sdq * pdf_d1 * sqrt_t
+    out["theta"] = -(sdq * pdf_d1 * v) / (2.0 * sqrt_t) - sign * (r * kdf * n2 - q * sdq * n1)
+    out["rho"] = sign * t * kdf * n2
+    return out
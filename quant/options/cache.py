@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Tuple
+import functools
+from typing import Callable, Optional, Tuple
 
 from .black_scholes import Greeks, bs_greeks, bs_price
 
@@ -17,27 +17,56 @@ Key = Tuple[
 ]
 
 
-@dataclass
+def _key(spot: float, strike: float, rate: float, time_years: float, vol: float, div_yield: float, right: str) -> Optional[Key]:
+    # Snap inputs to a fixed grid so float jitter (0.2 vs 0.20000000001) hits the same entry:
+    # spot/strike 1e-4, rate/div_yield 1e-6, time 1e-6 years (~30s), vol 1e-5
+    key = (
+        round(spot, 4),
+        round(strike, 4),
+        round(rate, 6),
+        round(time_years, 6),
+        round(vol, 5),
+        round(div_yield, 6),
+        right,
+    )
+    # Inputs too small for the grid (e.g. seconds to expiry) would round to an invalid 0: not cacheable
+    if (key[0] <= 0.0 < spot) or (key[1] <= 0.0 < strike) or (key[3] <= 0.0 < time_years) or (key[4] <= 0.0 < vol):
+        return None
+    return key
+
+
+def _price(key: Key) -> float:
+    spot, strike, rate, time_years, vol, div_yield, right = key
+    return bs_price(spot=spot, strike=strike, rate=rate, time_years=time_years, vol=vol, div_yield=div_yield, right=right)  # type: ignore[arg-type]
+
+
+def _greeks(key: Key) -> Greeks:
+    spot, strike, rate, time_years, vol, div_yield, right = key
+    return bs_greeks(spot=spot, strike=strike, rate=rate, time_years=time_years, vol=vol, div_yield=div_yield, right=right)  # type: ignore[arg-type]
+
+
 class GreeksCache:
-    _cache_greeks: Dict[Key, Greeks]
-    _cache_price: Dict[Key, float]
+    """LRU memo for bs_price/bs_greeks keyed on inputs rounded to the grid in ``_key``.
+
+    Values are computed from the rounded inputs, so a hit returns exactly what a miss would.
+    Inputs whose positive spot, strike, time or vol rounds to zero are priced uncached.
+    """
+
+    _cached_price: Callable[[Key], float]
+    _cached_greeks: Callable[[Key], Greeks]
 
-    def __init__(self) -> None:
-        self._cache_greeks = {}
-        self._cache_price = {}
+    def __init__(self, maxsize: Optional[int] = 65_536) -> None:
+        self._cached_price = functools.lru_cache(maxsize=maxsize)(_price)
+        self._cached_greeks = functools.lru_cache(maxsize=maxsize)(_greeks)
 
     def price(self, *, spot: float, strike: float, rate: float, time_years: float, vol: float, div_yield: float, right: str) -> float:
-        key: Key = (spot, strike, rate, time_years, vol, div_yield, right)
-        if key not in self._cache_price:
-            self._cache_price[key] = bs_price(
-                spot=spot, strike=strike, rate=rate, time_years=time_years, vol=vol, div_yield=div_yield, right=right  # type: ignore[arg-type]
-            )
-        return self._cache_price[key]
+        key = _key(spot, strike, rate, time_years, vol, div_yield, right)
+        if key is None:
+            return bs_price(spot=spot, strike=strike, rate=rate, time_years=time_years, vol=vol, div_yield=div_yield, right=right)  # type: ignore[arg-type]
+        return self._cached_price(key)
 
     def greeks(self, *, spot: float, strike: float, rate: float, time_years: float, vol: float, div_yield: float, right: str) -> Greeks:
-        key: Key = (spot, strike, rate, time_years, vol, div_yield, right)
-        if key not in self._cache_greeks:
-            self._cache_greeks[key] = bs_greeks(
-                spot=spot, strike=strike, rate=rate, time_years=time_years, vol=vol, div_yield=div_yield, right=right  # type: ignore[arg-type]
-            )
-        return self._cache_greeks[key]
\ No newline at end of file
+        key = _key(spot, strike, rate, time_years, vol, div_yield, right)
+        if key is None:
+            return bs_greeks(spot=spot, strike=strike, rate=rate, time_years=time_years, vol=vol, div_yield=div_yield, right=right)  # type: ignore[arg-type]
+        return self._cached_greeks(key)
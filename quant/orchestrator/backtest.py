@@ -15,9 +15,9 @@ from ..data.symbols_repository import SymbolRow
 from ..data.costs import load_calculator_from_yaml
 from ..engine.execution import ExecutionSimulator, Quote
 from ..engine.portfolio import Portfolio
-from ..engine.orders import Order
+from ..engine.orders import Order, OrderSide
 from ..ops.artifacts import ArtifactWriter, compute_params_hash, get_git_sha
-from ..ops.metrics import events_total, queue_lag_seconds, fill_slippage_bps, orders_total, fills_total, backtest_step_duration_seconds
+from ..ops.metrics import events_total, queue_lag_seconds, orders_total, fills_total, fill_slippage_observer, backtest_step_observer
 
 
 DEFAULT_SPREAD_BPS = 5.0  # simple default spread if not otherwise provided
@@ -40,29 +40,15 @@ def _to_utc(ts: datetime) -> datetime:
     return ts.astimezone(timezone.utc)
 
 
-def _unique_times_between(store: BarsStore, start: datetime, end: datetime) -> List[datetime]:
-    start = _to_utc(start)
-    end = _to_utc(end)
-    ts_set: set[datetime] = set()
-    for rows in store.by_symbol.values():
-        for r in rows:
-            if r.ts < start or r.ts > end:
-                continue
-            ts_set.add(r.ts)
-    return sorted(ts_set)
-
-
-def _bars_by_time(store: BarsStore, start: datetime, end: datetime) -> Dict[datetime, List[BarRow]]:
+def _bars_by_time(store: BarsStore, start: datetime, end: datetime) -> Tuple[List[datetime], Dict[datetime, List[BarRow]]]:
+    """Sorted unique bar timestamps in [start, end] and the bars at each, in one pass."""
     mapping: Dict[datetime, List[BarRow]] = {}
-    for rows in store.by_symbol.values():
-        for r in rows:
-            if r.ts < start or r.ts > end:
-                continue
-            mapping.setdefault(r.ts, []).append(r)
-    # Ensure deterministic ordering within same timestamp
-    for k in list(mapping.keys()):
-        mapping[k].sort(key=lambda x: (x.symbol_id, x.ts))
-    return mapping
+    setd = mapping.setdefault
+    # Walking symbols in id order leaves each bucket sorted by symbol_id
+    for symbol_id in sorted(store.by_symbol):
+        for r in store.get_between(symbol_id, start, end):
+            setd(r.ts, []).append(r)
+    return sorted(mapping), mapping
 
 
 def _build_symbol_maps(symbols: Iterable[SymbolRow]) -> Tuple[Dict[int, SymbolRow], Dict[int, str]]:
@@ -129,8 +115,7 @@ def run_backtest(
     symbols_by_id, venue_by_symbol = _build_symbol_maps(symbol_rows)
 
     # Build bars index
-    times = _unique_times_between(bars_store, start, end)
-    bars_at_time = _bars_by_time(bars_store, start, end)
+    times, bars_at_time = _bars_by_time(bars_store, start, end)
 
     ctx = StrategyContext(
         now=start,
@@ -184,15 +169,15 @@ def run_backtest(
             # Apply fills to portfolio
             sym_meta = symbols_by_id.get(order.symbol_id)
             currency = sym_meta.currency if sym_meta else base_currency
+            side_sign = 1 if order.side is OrderSide.BUY else -1
             for f in fills:
                 fills_total.inc()
-                side = order.side.value
-                portfolio.apply_fill(order.symbol_id, currency, side, f.quantity, f.price)
+                portfolio.apply_fill(order.symbol_id, currency, side_sign, f.quantity, f.price)
                 # Slippage vs mid in bps
                 mid = (quote.bid + quote.ask) / 2.0
                 if mid > 0:
                     bps = abs((f.price - mid) / mid) * 10000.0
-                    fill_slippage_bps.observe(bps)
+                    fill_slippage_observer.observe(bps)
                 # Calculate cost per fill (proportional to fill quantity)
                 cost_per_fill = (cost_total / sum(f.quantity for f in fills)) * f.quantity if fills else 0.0
                 fills_out.append(
@@ -244,7 +229,11 @@ def run_backtest(
 
         # End of step metrics
         queue_lag_seconds.set(0.0)
-        backtest_step_duration_seconds.observe(_time.perf_counter() - _t0)
+        backtest_step_observer.observe(_time.perf_counter() - _t0)
+
+    # Export batched histogram samples for this run
+    fill_slippage_observer.flush()
+    backtest_step_observer.flush()
 
     if hasattr(strategy, "on_end"):
         strategy.on_end(ctx)
@@ -504,8 +504,8 @@ def update_symbols(
     
     if removed:
         typer.echo("\nSymbols to remove:")
-        for ticker, exchange in removed[:10]:
-            typer.echo(f"  {ticker} ({exchange})")
+        for symbol in removed[:10]:
+            typer.echo(f"  {symbol.ticker} ({symbol.exchange})")
         if len(removed) > 10:
             typer.echo(f"  ... and {len(removed) - 10} more")
     
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from quant.ops.artifacts import ArtifactWriter
+
+
+def test_write_equity_arrow_matches_row_writer(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    start = datetime(2024, 1, 2, 16, tzinfo=timezone.utc)
+    rows = [{"ts": start + timedelta(days=i), "equity_eur": 1000.0 + 0.25 * i} for i in range(5)]
+
+    rows_writer = ArtifactWriter(tmp_path / "rows")
+    rows_writer.write_equity(rows)
+    arrow_writer = ArtifactWriter(tmp_path / "arrow")
+    arrow_writer.write_equity_arrow(
+        np.array([r["ts"].replace(tzinfo=None) for r in rows], dtype="datetime64[ns]"),
+        np.array([r["equity_eur"] for r in rows]),
+    )
+
+    expected = pd.read_csv(rows_writer.paths.equity_csv)
+    got = pd.read_csv(arrow_writer.paths.equity_csv)
+    pd.testing.assert_frame_equal(got, expected)
+    assert got["ts"].iloc[0] == "2024-01-02T16:00:00Z"
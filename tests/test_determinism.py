@@ -8,7 +8,7 @@ from quant.data.pit_reader import BarsStore, PITDataReader
 from quant.data.fx_repository import ensure_schema as fx_ensure_schema, load_fx_csv_to_db
 from quant.data.symbols_repository import ensure_schema as sym_ensure_schema, create_sqlite_engine, load_symbols_csv_to_db
 from quant.examples.ma_cross import MACross
-from quant.orchestrator.backtest import run_backtest
+from quant.orchestrator.backtest import _bars_by_time, run_backtest
 
 
 def _dt(s: str):
@@ -91,4 +91,18 @@ def test_seed_determinism(tmp_path: Path) -> None:
 
     f1 = (out1 / "fills.csv").read_text()
     f2 = (out2 / "fills.csv").read_text()
-    assert f1 == f2
\ No newline at end of file
+    assert f1 == f2
+
+
+def test_bars_by_time_groups_window_by_timestamp_and_symbol() -> None:
+    def bar(symbol_id: int, ts: str) -> BarRow:
+        return BarRow(ts=_dt(ts), symbol_id=symbol_id, open=1, high=1, low=1, close=1, volume=1, dt=_dt(ts).date())
+
+    store = BarsStore.from_rows(
+        [bar(7, "2024-06-04T20:00:00Z"), bar(2, "2024-06-04T20:00:00Z"), bar(2, "2024-06-03T20:00:00Z"), bar(7, "2024-06-06T20:00:00Z")]
+    )
+    times, bars_at_time = _bars_by_time(store, _dt("2024-06-03T20:00:00Z"), _dt("2024-06-05T00:00:00Z"))
+
+    assert times == [_dt("2024-06-03T20:00:00Z"), _dt("2024-06-04T20:00:00Z")]
+    assert set(bars_at_time) == set(times)
+    assert [b.symbol_id for b in bars_at_time[times[1]]] == [2, 7]
@@ -15,18 +15,28 @@ from quant.data.schemas import (
 from quant.discovery.fundamentals_repository import (
 	RatioSnapshot,
 	StatementSnapshot,
+	IncomeSnapshot,
 	upsert_ratios_snapshots,
 	write_statement_snapshots,
 	get_ratios_asof,
 	INCOME_TABLE,
 	BALANCE_TABLE,
 	CASHFLOW_TABLE,
+	create_sqlite_engine as create_fundamentals_engine,
+	write_ratios_parquet,
+	load_ratios_parquet,
 )
 from quant.data.symbols_repository import create_sqlite_engine, ensure_schema as symbols_ensure_schema, define_symbols_table
 from sqlalchemy import MetaData, insert
 from quant.data.bars_loader import BarRow
 from quant.data.pit_reader import BarsStore
-from quant.discovery.sector_stats import RatioPoint, compute_sector_stats
+from quant.discovery.sector_stats import (
+	RatioPoint,
+	compute_sector_stats,
+	_sector_ranks_kernel,
+	_sector_stats_from_kernel,
+	_sector_stats_numpy,
+)
 from quant.discovery.screener import UniverseFilters, filter_universe, rank_candidates, Candidate
 
 
@@ -80,6 +90,21 @@ def test_snapshot_writer_enforces_asof_guard(tmp_path: Path) -> None:
 		)
 
 
+def test_typed_statement_snapshots(tmp_path: Path) -> None:
+	engine = create_sqlite_engine(str(tmp_path / "funds.db"))
+	rows = [
+		IncomeSnapshot(symbol_id=1, period_end=_utc(2024, 3, 31), asof=_utc(2024, 5, 15), currency="USD", revenue=100.0),
+		IncomeSnapshot(symbol_id=2, period_end=_utc(2024, 3, 31), asof=_utc(2024, 5, 16), currency="EUR", net_income=5.0),
+	]
+	assert write_statement_snapshots(engine, INCOME_TABLE, rows) == 2
+	with engine.connect() as conn:
+		got = conn.exec_driver_sql(f"SELECT symbol_id, revenue, net_income FROM {INCOME_TABLE} ORDER BY symbol_id").fetchall()
+	assert [tuple(r) for r in got] == [(1, 100.0, None), (2, None, 5.0)]
+	# Typed rows must match the target table
+	with pytest.raises(ValueError):
+		write_statement_snapshots(engine, BALANCE_TABLE, rows)
+
+
 def test_ratios_pit_reader(tmp_path: Path) -> None:
 	engine = create_sqlite_engine(str(tmp_path / "funds.db"))
 	# Insert two snapshots and ensure PIT retrieves the latest <= asof
@@ -96,6 +121,102 @@ def test_ratios_pit_reader(tmp_path: Path) -> None:
 	# No-peek: earlier asof gets older snapshot
 	got2 = get_ratios_asof(engine, 1, _utc(2024, 2, 1))
 	assert got2.pe == 20.0
+	# Cached lookups are dropped when new snapshots are written
+	upsert_ratios_snapshots(
+		engine,
+		[RatioSnapshot(symbol_id=1, asof=_utc(2024, 4, 15), currency="USD", pe=17.0)],
+	)
+	assert get_ratios_asof(engine, 1, _utc(2024, 4, 20)).pe == 17.0
+	# Same day, earlier cut: the later snapshot must not leak in
+	assert get_ratios_asof(engine, 1, _utc(2024, 4, 15, 9)).pe == 18.0
+
+
+def test_ratios_cache_is_per_engine_and_releases_engines(tmp_path: Path) -> None:
+	import gc
+	import weakref
+
+	from quant.discovery import fundamentals_repository as fr
+
+	engines = [create_sqlite_engine(str(tmp_path / f"funds{i}.db")) for i in range(2)]
+	for engine, pe in zip(engines, (20.0, 30.0)):
+		upsert_ratios_snapshots(engine, [RatioSnapshot(symbol_id=1, asof=_utc(2024, 1, 15), currency="USD", pe=pe)])
+		assert get_ratios_asof(engine, 1, _utc(2024, 2, 1)).pe == pe
+	# A write to one engine leaves the other engine's lookups cached
+	upsert_ratios_snapshots(engines[0], [RatioSnapshot(symbol_id=1, asof=_utc(2024, 1, 20), currency="USD", pe=21.0)])
+	assert engines[0] not in fr._RATIOS_CACHE and engines[1] in fr._RATIOS_CACHE
+	assert get_ratios_asof(engines[0], 1, _utc(2024, 2, 1)).pe == 21.0
+
+	ref = weakref.ref(engines[1])
+	engines[1].dispose()
+	del engines[1], engine
+	gc.collect()
+	assert ref() is None
+
+
+def test_upsert_ratios_from_dataframe(tmp_path: Path) -> None:
+	import pandas as pd
+
+	engine = create_sqlite_engine(str(tmp_path / "funds.db"))
+	df = pd.DataFrame({
+		"symbol_id": [1, 1],
+		"asof": ["2024-01-15T16:00:00Z", "2024-04-10T16:00:00Z"],
+		"currency": ["USD", "USD"],
+		"pe": [20.0, float("nan")],
+	})
+	assert upsert_ratios_snapshots(engine, df) == 2
+	got = get_ratios_asof(engine, 1, _utc(2024, 4, 20))
+	assert got.asof == _utc(2024, 4, 10)
+	assert got.pe is None and got.roic is None
+	assert get_ratios_asof(engine, 1, _utc(2024, 2, 1)).pe == 20.0
+
+
+def test_fundamentals_engine_batches_large_writes(tmp_path: Path) -> None:
+	engine = create_fundamentals_engine(str(tmp_path / "funds.db"))
+	rows = [
+		RatioSnapshot(symbol_id=i, asof=_utc(2024, 1, 15), currency="USD", pe=float(i))
+		for i in range(1, 1201)
+	]
+	assert upsert_ratios_snapshots(engine, rows) == 1200
+	assert get_ratios_asof(engine, 1200, _utc(2024, 2, 1)).pe == 1200.0
+	with engine.connect() as conn:
+		assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+		# Native executemany path stores datetimes exactly as SQLAlchemy would
+		stored = conn.exec_driver_sql("SELECT asof FROM fundamentals_ratios WHERE symbol_id = 1").scalar()
+	assert stored == "2024-01-15 16:00:00.000000"
+
+
+def test_ratios_parquet_bulk_pit_load(tmp_path: Path) -> None:
+	pytest.importorskip("pyarrow")
+	path = tmp_path / "ratios.parquet"
+	write_ratios_parquet(path, [
+		RatioSnapshot(symbol_id=1, asof=_utc(2024, 1, 15), currency="USD", pe=20.0),
+		RatioSnapshot(symbol_id=2, asof=_utc(2024, 3, 1), currency="EUR", pe=12.0),
+	])
+	write_ratios_parquet(path, [
+		RatioSnapshot(symbol_id=1, asof=_utc(2024, 4, 10), currency="USD", pe=18.0, roic=0.12),
+	])
+	got = load_ratios_parquet(path, _utc(2024, 4, 20))
+	assert {sid: r.pe for sid, r in got.items()} == {1: 18.0, 2: 12.0}
+	assert got[1].roic == 0.12 and got[1].asof == _utc(2024, 4, 10)
+	# No-peek and symbol subset
+	early = load_ratios_parquet(path, _utc(2024, 2, 1), symbol_ids=[1, 2])
+	assert {sid: r.pe for sid, r in early.items()} == {1: 20.0}
+	assert load_ratios_parquet(path, _utc(2024, 4, 20), symbol_ids=[2])[2].currency == "EUR"
+
+
+def test_sector_ranks_kernel_matches_numpy_path() -> None:
+	points = [
+		RatioPoint(symbol_id=1, sector="Tech", metrics={"fcf_yield": 0.05, "roic": 0.12}),
+		RatioPoint(symbol_id=2, sector="Industrial", metrics={"fcf_yield": 0.08, "roic": None}),
+		RatioPoint(symbol_id=3, sector="Tech", metrics={"fcf_yield": 0.02, "roic": 0.08}),
+		RatioPoint(symbol_id=4, sector="Tech", metrics={"fcf_yield": 0.05, "roic": None}),
+	]
+	metrics = ["fcf_yield", "roic", "pe"]
+	# The kernel runs as plain Python here, so this checks it whether or not numba is installed
+	got = _sector_stats_from_kernel(points, metrics, _sector_ranks_kernel)
+	assert got == _sector_stats_numpy(points, metrics)
+	assert got["Tech"].percentiles[4] == {"fcf_yield": 1.0}
+	assert got["Industrial"].medians == {"fcf_yield": 0.08}
 
 
 def test_sector_stats_and_screener_ranker(tmp_path: Path) -> None:
@@ -141,6 +262,8 @@ def test_sector_stats_and_screener_ranker(tmp_path: Path) -> None:
 	symbols = [_Sym(1, "AAA", "XNAS"), _Sym(2, "BBB", "XNAS"), _Sym(3, "CCC", "XETR")]
 	filtered = filter_universe(symbols, UniverseFilters(regions=["US"]))
 	assert all(s.exchange in ("XNAS", "XNYS") for s in filtered)
+	# A bare string is a single code
+	assert [s.symbol_id for s in filter_universe(symbols, UniverseFilters(exchanges="XNAS"))] == [1, 2]
 	# Rank candidates with ADDV filter
 	asof = _utc(2024, 2, 1)
 	cands = rank_candidates(
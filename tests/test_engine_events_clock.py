@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -57,4 +57,28 @@ def test_clock_schedules_next_open_close():
     assert any(l.startswith("XNYS:") for l in labels)
 
     # Ensure boundaries are CLOCK events
-    assert all(e.type == EventType.CLOCK for e in events)
\ No newline at end of file
+    assert all(e.type == EventType.CLOCK for e in events)
+
+def test_event_order_uses_exact_ns_across_timezones():
+    q = EventQueue()
+    t = datetime(2024, 7, 4, 12, 0, tzinfo=timezone.utc)
+    cet = timezone(timedelta(hours=2))
+    # Same instant expressed in another zone, then one microsecond earlier
+    q.push(t.astimezone(cet), EventType.FX)
+    q.push(t - timedelta(microseconds=1), EventType.FX)
+    q.push(t, EventType.CLOCK)
+
+    out = [q.pop() for _ in range(3)]
+    assert [e.type for e in out] == [EventType.FX, EventType.CLOCK, EventType.FX]
+    assert out[1].ts_ns == out[2].ts_ns == 1720094400 * 1_000_000_000
+
+
+def test_events_support_all_rich_comparisons():
+    from quant.engine.events import Event
+
+    t = datetime(2024, 7, 4, 12, 0, tzinfo=timezone.utc)
+    early, late = Event(ts=t, type=EventType.CLOCK), Event(ts=t, type=EventType.BAR)
+    assert early < late and early <= late and late > early and late >= early
+    # Equality follows the sort key, not the payload
+    same = Event(ts=t.replace(tzinfo=None), type=EventType.CLOCK, payload="x")
+    assert same == early and same <= early and same >= early and hash(same) == hash(early)
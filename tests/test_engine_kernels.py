@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from quant.engine import _kernels
+from quant.sdk.features import rolling_mean, vol_target
+
+
+def test_kernels_match_feature_functions() -> None:
+    closes = [10.0, 10.5, 0.0, 11.0, 10.8, 11.2, 11.9, 11.4, 12.0, 12.3]
+    arr = np.asarray(closes, dtype=np.float64)
+    expected_returns = [0.0 if closes[i - 1] == 0 else (closes[i] - closes[i - 1]) / closes[i - 1] for i in range(1, len(closes))]
+
+    # Both the compiled/NumPy entry points and the plain loops (the numba sources)
+    for simple_returns, rolling_mean_last, vol_target_last in (
+        (_kernels.simple_returns, _kernels.rolling_mean_last, _kernels.vol_target_last),
+        (_kernels._simple_returns_loop, _kernels._rolling_mean_last_loop, _kernels._vol_target_last_loop),
+    ):
+        returns = simple_returns(arr)
+        assert np.allclose(returns, expected_returns)
+        assert math.isclose(rolling_mean_last(arr, 4), rolling_mean(closes, 4)[-1])
+        assert math.isnan(rolling_mean_last(arr, 20))
+        assert math.isclose(vol_target_last(returns, 0.1, 5, 252), vol_target(expected_returns, 0.1, 5, 252)[-1])
+        assert math.isnan(vol_target_last(returns, 0.1, 20, 252))
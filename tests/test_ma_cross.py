@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import numpy as np
+
+from quant.examples.ma_cross import MACross
+
+
+class _Data:
+    def __init__(self, ts, closes) -> None:
+        self._ts = ts
+        self._closes = closes
+
+    def get(self, symbol, fields, lookback, at=None):
+        n = sum(1 for t in self._ts if t <= at)
+        lo = max(0, n - lookback)
+        cols = {"ts": self._ts, "close": self._closes}
+        return {f: list(cols[f][lo:n]) for f in fields}
+
+
+def _stateless_orders(ts, closes, steps, fast, slow):
+    # Reference: recompute both means from the trailing window at every step
+    orders, last_state = [], None
+    for now in steps:
+        window = [c for t, c in zip(ts, closes) if t <= now][-(slow + 1):]
+        if len(window) < slow:
+            continue
+        state = "above" if np.mean(window[-fast:]) > np.mean(window[-slow:]) else "below"
+        if last_state is not None and state != last_state:
+            orders.append((now, "BUY" if state == "above" else "SELL"))
+        last_state = state
+    return orders
+
+
+def _run(strategy, ts, closes, steps):
+    orders = []
+    ctx = SimpleNamespace(
+        now=None,
+        data=_Data(ts, closes),
+        log=logging.getLogger("test"),
+        order=lambda symbol, qty, side, type, tag: orders.append((ctx.now, side)),
+    )
+    strategy.on_start(ctx)
+    for now in steps:
+        ctx.now = now
+        strategy.on_event(None, ctx)
+    return orders
+
+
+def test_ma_cross_seeds_windows_from_history_before_start() -> None:
+    rng = np.random.default_rng(3)
+    ts = [datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(days=i) for i in range(60)]
+    closes = (100.0 + np.cumsum(rng.normal(0.0, 1.0, 60))).tolist()
+
+    # Start mid-history, then also skip some bars entirely
+    for steps in (ts[30:], ts[30:40] + ts[45:]):
+        expected = _stateless_orders(ts, closes, steps, fast=3, slow=10)
+        assert expected
+        assert _run(MACross(symbol="AAPL", fast=3, slow=10), ts, closes, steps) == expected
@@ -140,6 +140,28 @@ def test_compare_with_existing(tmp_path):
     assert added[0].ticker == 'GOOGL'
     
     # Nothing should be removed in this case since we're not removing any symbols
+    assert removed == []
+
+
+def test_compare_with_existing_reports_removed_symbols(tmp_path):
+    """Test that removed symbols are returned as MarketSymbol objects."""
+    fetcher = MarketDataFetcher()
+    
+    test_csv = tmp_path / "existing.csv"
+    with open(test_csv, 'w') as f:
+        f.write("symbol_id,ticker,exchange,currency,active_from,active_to\n")
+        f.write("1,AAPL,XNAS,USD,2020-01-01T00:00:00Z,\n")
+        f.write("2,VOD,XLON,GBP,2020-01-01T00:00:00Z,\n")
+    
+    added, removed, unchanged = fetcher.compare_with_existing(
+        [MarketSymbol('AAPL', 'XNAS', 'USD', 'Apple Inc')], test_csv
+    )
+    
+    assert added == []
+    assert [s.ticker for s in unchanged] == ['AAPL']
+    assert len(removed) == 1
+    assert isinstance(removed[0], MarketSymbol)
+    assert (removed[0].ticker, removed[0].exchange, removed[0].currency) == ('VOD', 'XLON', 'GBP')
 
 
 def test_market_symbol_creation():
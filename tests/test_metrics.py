@@ -57,4 +57,68 @@ def test_metrics_endpoint_contains_quant_metrics(tmp_path) -> None:
     assert resp.status_code == 200
     body = resp.text
     assert "quant_events_total" in body
-    assert "quant_fill_slippage_bps" in body
\ No newline at end of file
+    assert "quant_fill_slippage_bps" in body
+
+def test_batch_observer_matches_direct_observe() -> None:
+    from prometheus_client import CollectorRegistry, Histogram
+
+    from quant.ops.metrics import BatchObserver
+
+    registry = CollectorRegistry()
+    buckets = (0.5, 1, 5)
+    direct = Histogram("direct_h", "direct", buckets=buckets, registry=registry)
+    batched = Histogram("batched_h", "batched", buckets=buckets, registry=registry)
+    observer = BatchObserver(batched, flush_every=3)
+    values = [0.1, 0.5, 0.7, 1.0, 3.0, 5.0, 9.0, 0.2]
+    for v in values:
+        direct.observe(v)
+        observer.observe(v)
+    observer.flush()
+
+    def _samples(prefix: str) -> dict:
+        return {
+            (s.name[len(prefix):], s.labels.get("le")): s.value
+            for metric in registry.collect()
+            for s in metric.samples
+            if s.name.startswith(prefix) and not s.name.endswith("_created")
+        }
+
+    assert _samples("direct_h") == _samples("batched_h")
+
+
+def test_batch_observer_flushes_on_interval_and_across_threads() -> None:
+    import threading
+
+    from prometheus_client import CollectorRegistry, Histogram
+
+    from quant.ops.metrics import BatchObserver
+
+    hist = Histogram("shared_h", "shared", buckets=(1, 5), registry=CollectorRegistry())
+    # An elapsed interval publishes a sample without waiting for a full batch
+    BatchObserver(hist, flush_every=1000, flush_interval=0.0).observe(2.0)
+    assert hist._buckets[1].get() == 1.0
+
+    observer = BatchObserver(hist, flush_every=7, flush_interval=60.0)
+    threads = [threading.Thread(target=lambda: [observer.observe(0.5) for _ in range(5000)]) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    observer.flush()
+    assert hist._buckets[0].get() == 20_000.0
+
+
+def test_metrics_disabled_by_env_are_noops() -> None:
+    import os
+    import subprocess
+    import sys
+
+    code = (
+        "from quant.ops import metrics as m\n"
+        "m.events_total.labels(source='backtest').inc()\n"
+        "m.fill_slippage_observer.observe(1.0); m.fill_slippage_observer.flush()\n"
+        "print(type(m.events_total).__name__, type(m.fill_slippage_bps).__name__)\n"
+    )
+    env = dict(os.environ, QUANT_DISABLE_METRICS="1")
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    assert out.stdout.split() == ["_Noop", "_Noop"]
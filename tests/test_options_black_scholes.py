@@ -1,8 +1,10 @@
 import math
 
+import numpy as np
 import pytest
 
 from quant.options.black_scholes import bs_price, bs_greeks, implied_volatility
+from quant.options.black_scholes_vec import bs_greeks_vec, bs_price_vec
 
 
 @pytest.mark.parametrize(
@@ -32,4 +34,94 @@ def test_implied_vol_recovers_vol_from_price():
     right = "C"
     price = bs_price(spot=spot, strike=strike, rate=rate, time_years=time_years, vol=vol_true, right=right, div_yield=0.0)
     iv = implied_volatility(target_price=price, spot=spot, strike=strike, rate=rate, time_years=time_years, right=right)
-    assert abs(iv - vol_true) < 1e-4
\ No newline at end of file
+    assert abs(iv - vol_true) < 1e-4
+
+
+@pytest.mark.parametrize(
+    "spot,strike,time_years,vol_true,div_yield,right",
+    [
+        (100.0, 80.0, 0.25, 0.15, 0.0, "P"),
+        (100.0, 150.0, 2.0, 0.8, 0.02, "C"),
+        (100.0, 100.0, 0.02, 1.5, 0.0, "P"),
+        (50.0, 70.0, 1.0, 0.05, 0.03, "C"),
+    ],
+)
+def test_implied_vol_converges_away_from_the_money(spot, strike, time_years, vol_true, div_yield, right):
+    price = bs_price(spot=spot, strike=strike, rate=0.02, time_years=time_years, vol=vol_true, div_yield=div_yield, right=right)
+    iv = implied_volatility(
+        target_price=price, spot=spot, strike=strike, rate=0.02, time_years=time_years, div_yield=div_yield, right=right, max_iter=30
+    )
+    repriced = bs_price(spot=spot, strike=strike, rate=0.02, time_years=time_years, vol=iv, div_yield=div_yield, right=right)
+    assert abs(repriced - price) < 1e-8
+
+
+def test_vectorized_prices_and_greeks_match_scalar():
+    rng = np.random.default_rng(0)
+    n = 200
+    spot, strike = rng.uniform(50.0, 150.0, n), rng.uniform(50.0, 150.0, n)
+    time_years, vol = rng.uniform(0.01, 3.0, n), rng.uniform(0.05, 1.0, n)
+    is_call = rng.random(n) < 0.5
+    out = bs_greeks_vec(spot, strike, 0.02, time_years, vol, 0.01, is_call)
+    np.testing.assert_allclose(bs_price_vec(spot, strike, 0.02, time_years, vol, 0.01, is_call), out["price"])
+
+    for i in range(n):
+        kwargs = dict(spot=spot[i], strike=strike[i], rate=0.02, time_years=time_years[i], vol=vol[i], div_yield=0.01, right="C" if is_call[i] else "P")
+        greeks = bs_greeks(**kwargs)
+        assert out["price"][i] == pytest.approx(bs_price(**kwargs), abs=1e-10)
+        for field in ("delta", "gamma", "vega", "theta", "rho"):
+            assert out[field][i] == pytest.approx(getattr(greeks, field), abs=1e-10)
+
+    with pytest.raises(ValueError):
+        bs_price_vec([100.0, 100.0], 100.0, 0.01, [0.5, 0.0], 0.2)
+
+
+def test_compiled_kernels_match_python_source():
+    pytest.importorskip("numba")
+    from quant.options import black_scholes as bs
+
+    assert bs._bs_price_nb is not bs._bs_price_py
+    for right in ("C", "P"):
+        args = (100.0, 105.0, 0.3, right == "C", *bs._factors(0.02, 0.4, 0.01))
+        assert bs._bs_price_nb(*args) == pytest.approx(bs._bs_price_py(*args), abs=1e-12)
+        assert bs._bs_greeks_nb(*args) == pytest.approx(bs._bs_greeks_py(*args), abs=1e-12)
+        assert bs._bs_price_vega_nb(*args) == pytest.approx(bs._bs_price_vega_py(*args), abs=1e-12)
+
+
+def test_greeks_cache_shares_entries_across_float_jitter():
+    from quant.options import GreeksCache
+
+    cache = GreeksCache(maxsize=2)
+    kwargs = dict(spot=100.0, strike=100.0, rate=0.01, time_years=0.5, div_yield=0.0, right="C")
+    first = cache.greeks(vol=0.2, **kwargs)
+    assert cache.greeks(vol=0.20000000001, **kwargs) is first
+    assert cache.price(vol=0.20000000001, **kwargs) == bs_price(vol=0.2, **kwargs)
+
+    cache.greeks(vol=0.3, **kwargs)
+    cache.greeks(vol=0.4, **kwargs)
+    assert cache.greeks(vol=0.2, **kwargs) is not first
+
+
+def test_context_pricing_matches_keyword_api():
+    from quant.options import BSContext, bs_greeks_with_ctx, bs_price_with_ctx
+
+    ctx = BSContext.build(rate=0.02, time_years=0.75, div_yield=0.01)
+    for strike in (80.0, 100.0, 125.0):
+        for right in ("C", "P"):
+            kwargs = dict(spot=100.0, strike=strike, vol=0.25, right=right)
+            assert bs_price_with_ctx(ctx=ctx, **kwargs) == bs_price(rate=0.02, time_years=0.75, div_yield=0.01, **kwargs)
+            assert bs_greeks_with_ctx(ctx=ctx, **kwargs) == bs_greeks(rate=0.02, time_years=0.75, div_yield=0.01, **kwargs)
+
+    with pytest.raises(ValueError):
+        BSContext.build(rate=0.02, time_years=0.0)
+
+
+def test_greeks_cache_prices_inputs_below_its_grid_uncached():
+    from quant.options import GreeksCache
+
+    cache = GreeksCache()
+    # About 12 seconds to expiry, and a vol far below the 1e-5 grid
+    near_expiry = dict(spot=100.0, strike=100.0, rate=0.01, time_years=4e-7, vol=0.2, div_yield=0.0, right="C")
+    tiny_vol = dict(spot=100.0, strike=99.5, rate=0.01, time_years=0.5, vol=4e-6, div_yield=0.0, right="C")
+    for kwargs in (near_expiry, tiny_vol):
+        assert cache.price(**kwargs) == bs_price(**kwargs) > 0.0
+        assert cache.greeks(**kwargs) == bs_greeks(**kwargs)
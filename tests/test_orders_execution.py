@@ -95,4 +95,49 @@ def test_simulate_backward_compat_signature_without_ts():
     quote = Quote(bid=50.0, ask=50.1)
     order = Order(id="x", symbol_id=1, side=OrderSide.SELL, quantity=10, type=OrderType.MARKET, tif=TimeInForce.IOC)
     fills, cost = sim.simulate(order, quote, venue="US", available_liquidity=100)
-    assert fills and cost >= 0.0
\ No newline at end of file
+    assert fills and cost >= 0.0
+
+def test_tod_bucket_boundaries():
+    sim = ExecutionSimulator()
+    # 2024-06-03: New York is UTC-4, Berlin is UTC+2
+    assert sim._tod_bucket("US", datetime(2024, 6, 3, 13, 29, tzinfo=timezone.utc)) == "MID"
+    assert sim._tod_bucket("US", datetime(2024, 6, 3, 13, 30, tzinfo=timezone.utc)) == "OPEN"
+    assert sim._tod_bucket("US", datetime(2024, 6, 3, 14, 0, tzinfo=timezone.utc)) == "OPEN"
+    assert sim._tod_bucket("US", datetime(2024, 6, 3, 14, 1, tzinfo=timezone.utc)) == "MID"
+    assert sim._tod_bucket("US", datetime(2024, 6, 3, 20, 0, tzinfo=timezone.utc)) == "CLOSE"
+    assert sim._tod_bucket("XETR", datetime(2024, 6, 3, 7, 29, tzinfo=timezone.utc)) == "OPEN"
+    assert sim._tod_bucket("DE", datetime(2024, 6, 3, 15, 30, tzinfo=timezone.utc)) == "MID"
+    assert sim._tod_bucket("EU", datetime(2024, 6, 3, 15, 0, tzinfo=timezone.utc)) == "CLOSE"
+    assert sim._tod_bucket("US", None) == "MID"
+
+
+def test_simulate_batch_matches_simulate():
+    import random
+
+    import numpy as np
+
+    rng = random.Random(7)
+    sim = ExecutionSimulator(adv_by_symbol={1: 10000, 2: 500}, adv_cap_fraction=0.2, impact_alpha=0.3, sigma_by_symbol={1: 0.02, 2: 0.05})
+    ts = datetime(2024, 6, 3, 13, 45, tzinfo=timezone.utc)
+    orders, bids, asks, liqs = [], [], [], []
+    for i in range(200):
+        side = rng.choice([OrderSide.BUY, OrderSide.SELL])
+        otype = rng.choice([OrderType.MARKET, OrderType.LIMIT])
+        bid = 100.0 + rng.uniform(-1, 1)
+        ask = bid + rng.uniform(0.01, 0.5)
+        limit = bid + rng.uniform(-0.3, 0.8) if otype == OrderType.LIMIT else None
+        orders.append(Order(id=str(i), symbol_id=rng.choice([1, 2, 3]), side=side, quantity=rng.randint(0, 3000),
+                            type=otype, tif=rng.choice(list(TimeInForce)), limit_price=limit))
+        bids.append(bid)
+        asks.append(ask)
+        liqs.append(rng.randint(0, 4000))
+
+    prices, qtys = sim.simulate_batch(orders, np.array(bids), np.array(asks), "US", np.array(liqs), ts=ts)
+
+    for i, o in enumerate(orders):
+        fills, _ = sim.simulate(o, Quote(bid=bids[i], ask=asks[i]), "US", liqs[i], ts=ts)
+        if fills:
+            assert qtys[i] == fills[0].quantity
+            assert abs(prices[i] - fills[0].price) < 1e-9
+        else:
+            assert qtys[i] == 0
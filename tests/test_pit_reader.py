@@ -62,4 +62,40 @@ def test_fx_pit_reader_returns_last_available() -> None:
 
     rdr = PITDataReader(fx_engine, sym_engine, BarsStore.from_rows([]))
     fx = rdr.get_fx("USD", "EUR", asof=_dt("2024-06-02T12:00:00Z"))
-    assert fx.rate == pytest.approx(0.92)
\ No newline at end of file
+    assert fx.rate == pytest.approx(0.92)
+
+def test_bars_store_get_between_bounds_inclusive() -> None:
+    rows = [
+        BarRow(ts=_dt(f"2024-06-0{d}T20:00:00Z"), symbol_id=1, open=1, high=1, low=1, close=1, volume=1, dt=_dt(f"2024-06-0{d}T00:00:00Z").date())
+        for d in (5, 3, 4, 6)
+    ]
+    store = BarsStore.from_rows(rows)
+
+    out = store.get_between(1, _dt("2024-06-04T20:00:00Z"), _dt("2024-06-05T20:00:00Z"))
+    assert [b.ts.day for b in out] == [4, 5]
+    assert [b.ts.day for b in store.get_between(1, None, None)] == [3, 4, 5, 6]
+    assert store.get_between(1, _dt("2024-06-07T00:00:00Z"), None) == []
+    assert store.get_between(2, None, None) == []
+
+
+def test_bars_store_get_last_n() -> None:
+    rows = [
+        BarRow(ts=_dt(f"2024-06-0{d}T20:00:00Z"), symbol_id=1, open=1, high=1, low=1, close=d, volume=1, dt=_dt(f"2024-06-0{d}T00:00:00Z").date())
+        for d in (5, 3, 4, 6)
+    ]
+    store = BarsStore.from_rows(rows)
+
+    assert [b.close for b in store.get_last_n(1, _dt("2024-06-05T23:00:00Z"), 2)] == [4, 5]
+    assert [b.close for b in store.get_last_n(1, None, 10)] == [3, 4, 5, 6]
+    assert store.get_last_n(1, _dt("2024-06-01T00:00:00Z"), 2) == []
+    assert store.get_last_n(2, None, 2) == []
+
+
+def test_bars_store_addv_batch() -> None:
+    rows = [
+        BarRow(ts=_dt(f"2024-06-0{d}T20:00:00Z"), symbol_id=1, open=1, high=1, low=1, close=d, volume=10, dt=_dt(f"2024-06-0{d}T00:00:00Z").date())
+        for d in (3, 4, 5)
+    ]
+    store = BarsStore.from_rows(rows)
+
+    assert store.addv_batch([1, 2], _dt("2024-06-05T00:00:00Z"), 2) == {1: 35.0, 2: 0.0}
@@ -65,4 +65,134 @@ def test_portfolio_total_value_eur_with_fx(tmp_path):
     # EUR cash 1000 + USD cash (100 - 500) * 0.8 + position 10*50 * 0.8
     # USD cash after buy = -400; position MV = 500; net USD exposure = 100
     expected = 1000.0 + (100.0 - 500.0) * 0.8 + 500.0 * 0.8
-    assert round(total, 2) == round(expected, 2)
\ No newline at end of file
+    assert round(total, 2) == round(expected, 2)
+
+def test_total_value_eur_resolves_each_currency_once(tmp_path, monkeypatch):
+    import quant.engine.portfolio as portfolio_mod
+
+    fx_engine = create_fx_engine(str(tmp_path / "fx.sqlite"))
+    csv_path = tmp_path / "fx.csv"
+    csv_path.write_text("ts,base_ccy,quote_ccy,rate\n2024-01-01T00:00:00Z,USD,EUR,0.8\n")
+    load_fx_csv_to_db(str(csv_path), fx_engine)
+
+    calls = []
+    real = portfolio_mod.get_rate_asof
+
+    def _counting(engine, base, quote, asof):
+        calls.append(base)
+        return real(engine, base, quote, asof)
+
+    monkeypatch.setattr(portfolio_mod, "get_rate_asof", _counting)
+
+    p = Portfolio(base_currency="EUR")
+    for sid in range(1, 6):
+        p.apply_fill(symbol_id=sid, currency="USD", side="BUY", qty=10, price=50.0)
+    asof = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    total = p.total_value_eur(asof, mark_prices={sid: 50.0 for sid in range(1, 6)}, fx_engine=fx_engine)
+
+    # USD cash -2500 and USD positions +2500 net to zero
+    assert round(total, 6) == 0.0
+    assert calls == ["USD"]
+
+
+def test_total_value_eur_vectorised_book_tracks_fills(tmp_path):
+    fx_engine = create_fx_engine(str(tmp_path / "fx.sqlite"))
+    p = Portfolio(base_currency="EUR")
+    p.apply_fill(symbol_id=1, currency="EUR", side="BUY", qty=10, price=5.0)
+    p.apply_fill(symbol_id=2, currency="EUR", side="BUY", qty=4, price=2.0)
+    p.apply_fill(symbol_id=3, currency="EUR", side="BUY", qty=1, price=1.0)
+    p.apply_fill(symbol_id=3, currency="EUR", side="SELL", qty=1, price=1.0)
+    asof = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+    # Symbol 2 is unpriced and symbol 3 is flat: neither contributes
+    total = p.total_value_eur(asof, mark_prices={1: 6.0, 3: 100.0}, fx_engine=fx_engine)
+    assert round(total, 6) == round(-58.0 + 60.0, 6)
+
+    # Moving the closed symbol's price leaves the value unchanged; the open position still revalues
+    moved_closed = p.total_value_eur(asof, mark_prices={1: 6.0, 3: 5000.0}, fx_engine=fx_engine)
+    assert round(moved_closed, 6) == round(total, 6)
+    moved_open = p.total_value_eur(asof, mark_prices={1: 7.0, 3: 5000.0}, fx_engine=fx_engine)
+    assert round(moved_open - total, 6) == round(10 * 1.0, 6)
+
+    # Fills write straight to the arrays, so the next valuation sees them
+    p.apply_fill(symbol_id=1, currency="EUR", side="BUY", qty=10, price=6.0)
+    total = p.total_value_eur(asof, mark_prices={1: 6.0}, fx_engine=fx_engine)
+    assert round(total, 6) == round(-118.0 + 120.0, 6)
+
+
+def test_positions_are_views_over_growing_arrays():
+    from quant.engine.portfolio import Position
+
+    p = Portfolio(base_currency="EUR")
+    for sid in range(1, 41):
+        p.apply_fill(symbol_id=sid, currency="EUR", side="BUY", qty=sid, price=2.0)
+    assert len(p.positions) == 40
+    assert list(p.positions)[:3] == [1, 2, 3]
+    assert p.positions[40] == Position(symbol_id=40, currency="EUR", quantity=40.0, average_price=2.0)
+
+    # Writes through a view land in the portfolio's arrays
+    view = p.positions[7]
+    view.average_price = 3.0
+    assert p.positions[7].average_price == 3.0
+    assert p.positions.get(99) is None
+
+    standalone = Position(symbol_id=5, currency="USD")
+    assert standalone.apply_fill(10, 4.0) == (10.0, 0.0)
+    assert standalone.apply_fill(-4, 5.0) == (6.0, 4.0)
+
+
+def test_process_actions_merges_against_processed_dates():
+    p = Portfolio(base_currency="EUR")
+    p.apply_fill(symbol_id=1, currency="EUR", side="BUY", qty=100, price=10.0)
+    d1 = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    d2 = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    d3 = datetime(2024, 6, 3, tzinfo=timezone.utc)
+    actions = [
+        CorporateAction(symbol_id=1, effective_date=d3, split_ratio=2.0, dividend=0.0, currency="EUR"),
+        CorporateAction(symbol_id=1, effective_date=d1, split_ratio=1.0, dividend=0.5, currency="EUR"),
+        CorporateAction(symbol_id=1, effective_date=d2, split_ratio=2.0, dividend=0.0, currency="EUR"),
+    ]
+
+    # Only d1 and d2 are effective; unsorted input is handled and dividends use post-split shares
+    assert p.process_actions_for_symbol(1, actions, datetime(2024, 4, 1, tzinfo=timezone.utc)) == 100.0
+    assert p.positions[1].quantity == 200
+    # Re-processing is a no-op; d3 applies once it becomes effective
+    assert p.process_actions_for_symbol(1, actions, datetime(2024, 4, 1, tzinfo=timezone.utc)) == 0.0
+    p.process_actions_for_symbol(1, actions, d3)
+    p.process_actions_for_symbol(1, actions, d3)
+    assert p.positions[1].quantity == 400
+    assert p._processed_actions[1] == [d1, d2, d3]
+
+
+def test_apply_fill_accepts_sign_enum_and_string_sides():
+    from quant.engine.orders import OrderSide
+
+    p = Portfolio(base_currency="EUR")
+    p.apply_fill(symbol_id=1, currency="EUR", side=1, qty=10, price=2.0)
+    p.apply_fill(symbol_id=1, currency="EUR", side=OrderSide.BUY, qty=10, price=2.0)
+    p.apply_fill(symbol_id=1, currency="EUR", side="buy", qty=10, price=2.0)
+    p.apply_fill(symbol_id=1, currency="EUR", side=OrderSide.SELL, qty=5, price=2.0)
+    p.apply_fill(symbol_id=1, currency="EUR", side=-1, qty=5, price=2.0)
+    assert p.positions[1].quantity == 20
+    assert p.get_cash("EUR") == -40.0
+
+
+def test_portfolio_equality_compares_open_positions():
+    a, b = Portfolio(base_currency="EUR"), Portfolio(base_currency="EUR")
+    a.apply_fill(symbol_id=1, currency="EUR", side="BUY", qty=10, price=0.0)
+    b.apply_fill(symbol_id=1, currency="EUR", side="BUY", qty=999, price=0.0)
+    assert a.cash_by_ccy == b.cash_by_ccy and a != b
+
+    # Flat rows and array capacity do not matter
+    b.apply_fill(symbol_id=1, currency="EUR", side="SELL", qty=989, price=0.0)
+    b.apply_fill(symbol_id=2, currency="EUR", side="BUY", qty=5, price=0.0)
+    b.apply_fill(symbol_id=2, currency="EUR", side="SELL", qty=5, price=0.0)
+    assert a == b
+
+
+def test_quantities_for_returns_zero_for_unknown_symbols():
+    p = Portfolio(base_currency="EUR")
+    p.apply_fill(symbol_id=4, currency="EUR", side="BUY", qty=7, price=1.0)
+    p.apply_fill(symbol_id=2, currency="EUR", side="SELL", qty=3, price=1.0)
+    assert p.quantities_for([2, 9, 4]).tolist() == [-3.0, 0.0, 7.0]
+    assert p.quantities_for([]).shape == (0,)
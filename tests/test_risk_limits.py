@@ -12,4 +12,24 @@ def test_risk_blocks_symbol_exposure():
 
     ok, reason = rm.check(portfolio=p, symbol_id=1, symbol_currency="EUR", price=200.0, qty=10.0, fx_rate_to_eur=1.0)
     assert not ok
-    assert "max_symbol" in (reason or "")
\ No newline at end of file
+    assert "max_symbol" in (reason or "")
+
+def test_risk_check_batch_matches_single_checks():
+    import numpy as np
+
+    p = Portfolio(base_currency="EUR")
+    p.apply_fill(symbol_id=1, currency="EUR", side="BUY", qty=4, price=200.0)
+    p.apply_fill(symbol_id=2, currency="USD", side="SELL", qty=3, price=100.0)
+    rm = RiskManager(RiskCaps(max_gross=1e9, max_net=1e9, max_symbol=1000.0, max_leverage=10.0))
+
+    symbol_ids = np.array([1, 1, 2, 3, 3])
+    prices = np.array([200.0, 200.0, 100.0, 50.0, 50.0])
+    qtys = np.array([1.0, 2.0, -9.0, 10.0, 30.0])
+    fx = np.array([1.0, 1.0, 0.9, 1.0, 1.0])
+
+    mask = rm.check_batch(p, symbol_ids, prices, qtys, fx)
+    expected = [
+        rm.check(p, int(s), "EUR", float(px), float(q), float(r))[0]
+        for s, px, q, r in zip(symbol_ids, prices, qtys, fx)
+    ]
+    assert mask.tolist() == expected == [True, False, False, True, False]
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+from datetime import datetime, timezone
+
+import pytest
+
+from quant.data.stooq_data_fetcher import StooqDataFetcher
+
+
+STOOQ_CSV = (
+    "Date,Open,High,Low,Close,Volume\n"
+    "2024-01-02,10.0,11.0,9.5,10.5,1000\n"
+    "2024-01-03,10.5,11.5,10.0,11.0,1500.0\n"
+    "2024-01-04,11.0,12.0,10.5,11.5,2000\n"
+)
+
+
+class _FakeResponse:
+    def __init__(self, text: str, status_code: int = 200):
+        self.text = text
+        self.status_code = status_code
+
+
+class _FakeSession:
+    def __init__(self, calls: list):
+        self.calls = calls
+
+    def get(self, url, timeout=None):
+        self.calls.append(url)
+        return _FakeResponse(STOOQ_CSV)
+
+
+def _fetcher(calls: list, **kwargs) -> StooqDataFetcher:
+    fetcher = StooqDataFetcher(delay_seconds=0.0, **kwargs)
+    fetcher._get_session = lambda: _FakeSession(calls)
+    return fetcher
+
+
+def _dt(y: int, m: int, d: int) -> datetime:
+    return datetime(y, m, d, tzinfo=timezone.utc)
+
+
+def test_fetch_symbol_data_parses_rows() -> None:
+    fetcher = _fetcher([])
+    points = fetcher.fetch_symbol_data("AAPL", "XNAS", _dt(2024, 1, 1), _dt(2024, 1, 31))
+
+    assert [p.date.date().isoformat() for p in points] == ["2024-01-02", "2024-01-03", "2024-01-04"]
+    assert points[0].open == 10.0 and points[1].volume == 1500
+    assert points.dates.dtype == "datetime64[D]"
+    assert points.close.tolist() == [10.5, 11.0, 11.5]
+
+
+def test_fetch_symbols_data_concurrent_writes_all_symbols(tmp_path) -> None:
+    calls: list = []
+    fetcher = _fetcher(calls, max_workers=4)
+    out = tmp_path / "bars.csv"
+    symbols = [("AAPL", "XNAS"), ("MSFT", "XNAS"), ("VOD", "XLON")]
+
+    results = fetcher.fetch_symbols_data(symbols, out, _dt(2024, 1, 1), _dt(2024, 1, 31))
+
+    assert results == {"AAPL": 3, "MSFT": 3, "VOD": 3}
+    assert len(calls) == 3
+    with open(out, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 9
+    assert sorted({r["symbol_id"] for r in rows}) == ["AAPL", "MSFT", "VOD"]
+
+
+def test_fetch_symbols_data_async_matches_sync(tmp_path) -> None:
+    calls: list = []
+    fetcher = _fetcher(calls, max_workers=2)
+    out = tmp_path / "bars.csv"
+    symbols = [("AAPL", "XNAS"), ("MSFT", "XNAS"), ("VOD", "XLON")]
+
+    results = asyncio.run(
+        fetcher.fetch_symbols_data_async(symbols, out, _dt(2024, 1, 1), _dt(2024, 1, 31))
+    )
+
+    assert results == {"AAPL": 3, "MSFT": 3, "VOD": 3}
+    assert len(calls) == 3
+    with open(out, newline="") as f:
+        assert len(list(csv.DictReader(f))) == 9
+
+
+def test_fetch_symbol_data_skips_bad_lines_and_empty_payload() -> None:
+    fetcher = _fetcher([])
+    payload = STOOQ_CSV + "2024-01-05,oops,1,1,1,1\n"
+    points = fetcher._parse_stooq_csv(payload, "AAPL")
+    assert len(points) == 3
+    assert points[-1].date == _dt(2024, 1, 4)
+
+    assert len(fetcher._parse_stooq_csv("No data", "AAPL")) == 0
+
+
+def test_second_fetch_only_requests_missing_dates(tmp_path) -> None:
+    calls: list = []
+    fetcher = _fetcher(calls)
+    out = tmp_path / "bars.csv"
+
+    first = fetcher.fetch_symbols_data([("AAPL", "XNAS")], out, _dt(2024, 1, 1), _dt(2024, 1, 31))
+    second = fetcher.fetch_symbols_data([("AAPL", "XNAS")], out, _dt(2024, 1, 1), _dt(2024, 1, 31))
+
+    assert first == {"AAPL": 3}
+    assert second == {"AAPL": 0}
+    with open(out, newline="") as f:
+        assert len(list(csv.DictReader(f))) == 3
+
+
+def test_existing_dates_indexed_from_prior_csv(tmp_path) -> None:
+    out = tmp_path / "bars.csv"
+    out.write_text(
+        "symbol_id,dt,open,high,low,close,volume\n"
+        "AAPL,2024-01-02,1,1,1,1,1\n"
+        "MSFT,2024-01-03,1,1,1,1,1\n"
+    )
+    fetcher = _fetcher([])
+
+    assert fetcher.get_existing_data_dates(out, "AAPL") == {_dt(2024, 1, 2).date()}
+    assert StooqDataFetcher.bar_index_path(out).exists()
+
+    missing = fetcher.fetch_missing_data("AAPL", "XNAS", out, _dt(2024, 1, 1), _dt(2024, 1, 31))
+    assert [p.date.day for p in missing] == [3, 4]
+
+
+def test_rebuilt_index_maps_symbol_ids_back_to_tickers(tmp_path) -> None:
+    from quant.data.symbols_repository import create_sqlite_engine, load_symbols_csv_to_db
+
+    db_path = tmp_path / "symbols.db"
+    symbols_csv = tmp_path / "symbols.csv"
+    symbols_csv.write_text(
+        "symbol_id,ticker,exchange,currency,active_from,active_to\n"
+        "7,AAPL,XNAS,USD,2020-01-01T00:00:00Z,\n"
+    )
+    load_symbols_csv_to_db(str(symbols_csv), create_sqlite_engine(str(db_path)))
+    out = tmp_path / "bars.csv"
+
+    first = _fetcher([], symbols_db_path=str(db_path)).fetch_symbols_data([("AAPL", "XNAS")], out, _dt(2024, 1, 1), _dt(2024, 1, 31))
+    with open(out, newline="") as f:
+        assert {r["symbol_id"] for r in csv.DictReader(f)} == {"7"}
+
+    # A lost sidecar is rebuilt from the CSV's numeric ids
+    StooqDataFetcher.bar_index_path(out).unlink()
+    second = _fetcher([], symbols_db_path=str(db_path)).fetch_symbols_data([("AAPL", "XNAS")], out, _dt(2024, 1, 1), _dt(2024, 1, 31))
+
+    assert first == {"AAPL": 3}
+    assert second == {"AAPL": 0}
+    with open(out, newline="") as f:
+        assert len(list(csv.DictReader(f))) == 3
+
+
+def test_get_data_summary_bars_and_old_format(tmp_path) -> None:
+    fetcher = StooqDataFetcher()
+
+    bars = tmp_path / "bars.csv"
+    bars.write_text(
+        "symbol_id,dt,open,high,low,close,volume\n"
+        "7,2024-01-03,1,1,1,1,1\n"
+        "7,2024-01-02,1,1,1,1,1\n"
+        "AAPL,2024-02-01,1,1,1,1,1\n"
+    )
+    summary = fetcher.get_data_summary(bars)
+    assert summary["7"]["data_points"] == 2
+    assert summary["7"]["first_date"] == _dt(2024, 1, 2)
+    assert summary["7"]["last_date"] == _dt(2024, 1, 3)
+    assert summary["AAPL"]["exchange"] == ""
+
+    old = tmp_path / "old.csv"
+    old.write_text(
+        "symbol,exchange,date,close\n"
+        "VOD,XLON,2024-01-02T00:00:00Z,1\n"
+        "VOD,XLON,2024-01-05T00:00:00Z,1\n"
+    )
+    summary = fetcher.get_data_summary(old)
+    assert summary == {
+        "VOD": {"exchange": "XLON", "data_points": 2, "first_date": _dt(2024, 1, 2), "last_date": _dt(2024, 1, 5)}
+    }
+
+
+def test_get_symbol_id_respects_asof_day(tmp_path) -> None:
+    from quant.data.symbols_repository import create_sqlite_engine, load_symbols_csv_to_db
+
+    db_path = tmp_path / "symbols.db"
+    csv_path = tmp_path / "symbols.csv"
+    csv_path.write_text(
+        "symbol_id,ticker,exchange,currency,active_from,active_to\n"
+        "1,AAPL,XNAS,USD,2020-01-01T00:00:00Z,2023-01-01T00:00:00Z\n"
+        "2,AAPL,XNAS,USD,2023-01-01T00:00:00Z,\n"
+    )
+    load_symbols_csv_to_db(str(csv_path), create_sqlite_engine(str(db_path)))
+
+    fetcher = StooqDataFetcher(symbols_db_path=str(db_path))
+    assert fetcher.get_symbol_id("AAPL", "XNAS", _dt(2022, 6, 1)) == 1
+    assert fetcher.get_symbol_id("AAPL", "XNAS", _dt(2024, 6, 1)) == 2
+    assert fetcher.get_symbol_id("MSFT", "XNAS", _dt(2024, 6, 1)) is None
+
+
+def test_get_existing_data_dates_bulk(tmp_path) -> None:
+    out = tmp_path / "bars.csv"
+    out.write_text(
+        "symbol_id,dt,open,high,low,close,volume\n"
+        "AAPL,2024-01-02,1,1,1,1,1\n"
+        "AAPL,2024-01-03,1,1,1,1,1\n"
+        "MSFT,2024-01-03,1,1,1,1,1\n"
+    )
+    fetcher = _fetcher([])
+
+    existing = fetcher.get_existing_data_dates_bulk(out, ["AAPL", "MSFT", "VOD"])
+    assert existing["AAPL"] == {_dt(2024, 1, 2).date(), _dt(2024, 1, 3).date()}
+    assert existing["MSFT"] == {_dt(2024, 1, 3).date()}
+    assert "VOD" not in existing
+
+
+def test_parquet_storage_roundtrip(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    calls: list = []
+    fetcher = _fetcher(calls, storage_format="parquet")
+    out = tmp_path / "bars"
+
+    first = fetcher.fetch_symbols_data([("AAPL", "XNAS")], out, _dt(2024, 1, 1), _dt(2024, 1, 31))
+    second = fetcher.fetch_symbols_data([("AAPL", "XNAS")], out, _dt(2024, 1, 1), _dt(2024, 1, 31))
+
+    assert first == {"AAPL": 3}
+    assert second == {"AAPL": 0}
+    assert (out / "AAPL.parquet").exists()
+    assert fetcher.get_existing_data_dates(out, "AAPL") == {
+        _dt(2024, 1, 2).date(), _dt(2024, 1, 3).date(), _dt(2024, 1, 4).date()
+    }
+    summary = fetcher.get_data_summary(out)
+    assert summary["AAPL"]["data_points"] == 3
+    assert summary["AAPL"]["last_date"] == _dt(2024, 1, 4)
+
+
+def test_unknown_storage_format_rejected() -> None:
+    with pytest.raises(ValueError):
+        StooqDataFetcher(storage_format="feather")
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import os
 import tempfile
 
@@ -11,6 +11,9 @@ from quant.data.symbols_repository import (
     ensure_schema,
     load_symbols_csv_to_db,
     get_symbols_asof,
+    get_symbol_id_asof,
+    _utc_dt,
+    _utc_dt_batch,
 )
 
 
@@ -51,6 +54,9 @@ def test_get_symbols_asof_filters_correctly() -> None:
     # As of 2022-07-01: AAPL, MSFT, VOD
     rows = get_symbols_asof(engine, _dt("2022-07-01T00:00:00Z"))
     assert [r.symbol_id for r in rows] == [1, 2, 3]
+    assert rows[0].active_from == _dt("2020-01-01T00:00:00Z")
+    assert rows[0].active_to == _dt("2023-01-01T00:00:00Z")
+    assert rows[1].active_to is None
 
     # Boundary: exactly at AAPL active_to -> AAPL should be excluded (active_to exclusive)
     rows = get_symbols_asof(engine, _dt("2023-01-01T00:00:00Z"))
@@ -71,4 +77,33 @@ def test_csv_missing_columns_errors() -> None:
         f.write("symbol_id,ticker\n1,ABC\n")
 
     with pytest.raises(ValueError):
-        load_symbols_csv_to_db(path, engine)
\ No newline at end of file
+        load_symbols_csv_to_db(path, engine)
+
+
+def test_get_symbol_id_asof_point_lookup() -> None:
+    engine = create_sqlite_engine()
+    ensure_schema(engine)
+
+    csv_path = _write_csv(
+        """
+1,AAPL,XNAS,USD,2020-01-01T00:00:00Z,2023-01-01T00:00:00Z
+2,AAPL,XNAS,USD,2023-01-01T00:00:00Z,
+3,VOD,XLON,GBP,2022-06-01T00:00:00Z,
+""".strip()
+    )
+    load_symbols_csv_to_db(csv_path, engine)
+
+    assert get_symbol_id_asof(engine, "AAPL", "XNAS", _dt("2021-01-01T00:00:00Z")) == 1
+    assert get_symbol_id_asof(engine, "AAPL", "XNAS", _dt("2023-01-01T00:00:00Z")) == 2
+    assert get_symbol_id_asof(engine, "VOD", "XLON", _dt("2021-01-01T00:00:00Z")) is None
+    assert get_symbol_id_asof(engine, "VOD", "XNAS", _dt("2023-01-01T00:00:00Z")) is None
+
+
+def test_utc_dt_fast_paths() -> None:
+    utc = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    assert _utc_dt(utc) is utc
+    assert _utc_dt(datetime(2024, 1, 2)) == utc
+    assert _utc_dt(datetime(2024, 1, 2, 1, tzinfo=timezone(timedelta(hours=1)))) == utc
+    assert _utc_dt("2024-01-02") == utc
+    assert _utc_dt("2024-01-02T00:00:00Z") == utc
+    assert _utc_dt_batch(["2024-01-02", "", "2024-01-02T01:00:00+01:00"]) == [utc, None, utc]
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import os
+
+import matplotlib.image as mpimg
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from quant.ops import visualize
+from quant.ops.visualize import _compute_max_drawdown, _load_equity_raw, _load_run, _minmax_bin, visualize_run, visualize_run_ascii, visualize_runs_comparison
+
+
+def _write_run(path, equity) -> None:
+    path.mkdir()
+    ts = pd.date_range("2024-01-02", periods=len(equity), freq="D", tz="UTC")
+    pd.DataFrame({"ts": ts.strftime("%Y-%m-%dT%H:%M:%SZ"), "equity_eur": equity}).to_csv(path / "equity.csv", index=False)
+    pd.DataFrame({"ts": ts[:3].strftime("%Y-%m-%dT%H:%M:%SZ"), "symbol": "AAA"}).to_csv(path / "orders.csv", index=False)
+
+
+def _grid(text: str, height: int) -> list[str]:
+    lines = text.splitlines()
+    start = lines.index("") + 1
+    return [line[len("1234567 |"):] for line in lines[start:start + height]]
+
+
+def test_ascii_grid_marks_curve_and_drawdown(tmp_path) -> None:
+    run = tmp_path / "run"
+    _write_run(run, [100.0, 110.0, 120.0, 90.0, 60.0, 80.0, 100.0, 120.0, 130.0, 140.0])
+    grid = _grid(visualize_run_ascii(run, width=40, height=10), 10)
+
+    assert all(len(line) == 40 for line in grid)
+    assert all(any(line[col] != " " for line in grid) for col in range(40))
+    assert grid[0][-1] == "*"
+    # Columns sampling the peak (index 2) through the trough (index 4) are drawn as D
+    d_cols = {col for line in grid for col, ch in enumerate(line) if ch == "D"}
+    assert d_cols == {col for col in range(40) if 2 <= col * 9 // 39 <= 4}
+    assert "D" in grid[-1]
+    assert "Total orders 3" in visualize_run_ascii(run, width=40, height=10)
+
+
+def test_comparison_grid_first_run_wins_on_overlap(tmp_path) -> None:
+    _write_run(tmp_path / "a", [100.0] * 10)
+    _write_run(tmp_path / "b", [100.0] * 5 + [200.0] * 5)
+    grid = _grid(visualize_runs_comparison([tmp_path / "a", tmp_path / "b"], width=40, height=10), 10)
+
+    assert set(grid[-1][:15]) == {"█"}
+    assert "▓" in grid[0]
+    assert set("".join(grid)) == {" ", "█", "▓"}
+
+
+def test_max_drawdown_skips_missing_values() -> None:
+    ts = pd.date_range("2024-01-02", periods=6, freq="D", tz="UTC")
+    max_dd, peak, trough, dd, trough_pos = _compute_max_drawdown(pd.Series([100.0, 120.0, np.nan, 90.0, 60.0, 130.0], index=ts))
+    assert max_dd == -0.5
+    assert (peak, trough, trough_pos) == (ts[1], ts[4], 4)
+    assert np.isnan(dd.iloc[2]) and dd.iloc[3] == -0.25
+
+    # All non-positive: absolute drawdown
+    max_dd, peak, trough, _, trough_pos = _compute_max_drawdown(pd.Series([-10.0, -5.0, -20.0, -15.0], index=ts[:4]))
+    assert (max_dd, peak, trough, trough_pos) == (-15.0, ts[1], ts[2], 2)
+
+
+def test_run_parse_is_reused_until_csv_changes(tmp_path) -> None:
+    run = tmp_path / "run"
+    _write_run(run, [100.0, 110.0, 120.0])
+    first = visualize_run_ascii(run, width=40, height=10)
+    hits = _load_run.cache_info().hits
+    assert visualize_runs_comparison([run], width=40, height=10)
+    assert _load_run.cache_info().hits == hits + 1
+
+    equity_csv = run / "equity.csv"
+    pd.DataFrame({"ts": ["2024-01-02T00:00:00Z", "2024-01-03T00:00:00Z"], "equity_eur": [50.0, 75.0]}).to_csv(equity_csv, index=False)
+    stat = equity_csv.stat()
+    os.utime(equity_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = visualize_run_ascii(run, width=40, height=10)
+    assert "Equity range: 50.00 - 75.00 EUR" in second and second != first
+
+
+def test_minmax_bin_keeps_extremes_in_order() -> None:
+    y = np.sin(np.linspace(0, 20, 10_000))
+    y[5000:5100] = np.nan
+    y[7321] = 5.0
+    keep = _minmax_bin(y, 50)
+
+    assert keep[0] == 0 and keep[-1] == len(y) - 1
+    assert np.all(np.diff(keep) > 0) and len(keep) <= 2 * 50 + 2
+    assert 7321 in keep and np.nanmin(y[keep]) == np.nanmin(y)
+
+
+def test_grid_fill_loop_matches_numpy_fill() -> None:
+    rng = np.random.default_rng(0)
+    eq_cols = rng.normal(100.0, 10.0, (3, 60))
+    eq_cols[1, :20] = np.nan
+    eq_cols[2] = eq_cols[0]  # fully overlapped by the first run
+    row_equity = np.linspace(130.0, 70.0, 15)
+
+    grids = []
+    for fill in (visualize._fill_grid, visualize._fill_grid_loop, visualize._fill_grid_np):
+        out = np.zeros((15, 60), dtype=np.int16)
+        fill(eq_cols, row_equity, 2.0, out)
+        grids.append(out)
+    assert np.array_equal(grids[0], grids[1]) and np.array_equal(grids[1], grids[2])
+    assert 3 not in grids[0] and 2 not in grids[0][:, :20]
+
+
+
+def test_visualize_run_leaves_no_pyplot_figures(tmp_path) -> None:
+    _write_run(tmp_path / "a", [100.0, 110.0, 120.0, 90.0, 60.0, 80.0, 100.0])
+    out = visualize_run(tmp_path / "a")
+
+    assert out == tmp_path / "a" / "visualization.png"
+    assert mpimg.imread(out).shape[:2] == (6 * 140, 12 * 140)
+    assert plt.get_fignums() == []
+
+
+def test_equity_raw_read_falls_back_to_pandas_on_loose_input(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    strict = tmp_path / "strict"
+    _write_run(strict, [100.0, 95.0, 105.0])
+    ts, equity = _load_equity_raw(strict / "equity.csv")
+    assert ts.dtype == np.dtype("datetime64[ns]") and ts[0] == np.datetime64("2024-01-02T00:00:00")
+    assert equity.tolist() == [100.0, 95.0, 105.0]
+
+    loose = tmp_path / "loose"
+    loose.mkdir()
+    (loose / "equity.csv").write_text("ts,equity_eur\n2024-01-02 00:00:00,100\nnot-a-date,95\n")
+    assert _load_equity_raw(loose / "equity.csv") is None
+    assert "Equity range: 95.00 - 100.00 EUR" in visualize_runs_comparison([loose], width=40, height=10)
+
+
+def test_ascii_counts_orders_without_loading_them(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    run = tmp_path / "run"
+    _write_run(run, [100.0, 110.0, 120.0])
+    misses = visualize._load_orders.cache_info().misses
+    assert "Total orders 3" in visualize_run_ascii(run, width=40, height=10)
+    assert visualize._load_orders.cache_info().misses == misses
+
+    # Unparseable stamps fall back to the pandas load, which drops them as before
+    loose = tmp_path / "loose"
+    _write_run(loose, [100.0, 110.0, 120.0])
+    (loose / "orders.csv").write_text("ts,symbol\n2024-01-02T00:00:00Z,AAA\nbad,AAA\n,AAA\n")
+    assert "Total orders 1" in visualize_run_ascii(loose, width=40, height=10)